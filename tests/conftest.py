@@ -0,0 +1,103 @@
+"""Shared test fixtures."""
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from wbs_mcp.data_loader import WorkItemsLoader
+from wbs_mcp.graphql_client import GraphQLClient
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answer GraphQL POSTs with canned, gzipped responses.
+
+    Each queued response is either a response dict or a callable taking the
+    request body and returning one. Either may instead be a
+    (status, headers, body) tuple to send a non-200 status or extra headers,
+    or None to close the connection without answering.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append({
+            "client_port": self.client_address[1],
+            "authorization": self.headers["Authorization"],
+            "body": request,
+        })
+        response = self.server.responses.pop(0)
+        if callable(response):
+            response = response(request)
+        if response is None:
+            self.close_connection = True
+            return
+        status, headers = 200, {}
+        if isinstance(response, tuple):
+            status, headers, response = response
+        body = json.dumps(response).encode("utf-8")
+        gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            body = gzip.compress(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Run a stand-in GraphQL server on a free local port."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    httpd.requests = []
+    httpd.responses = []
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client(server):
+    """Create a client pointed at the stand-in server."""
+    client = GraphQLClient("test-token", url=f"http://127.0.0.1:{server.server_port}/graphql")
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def loader(tmp_path):
+    """Create a loader over a writable copy of the fixture."""
+    fixture = Path(__file__).parent / "fixtures" / "work-items.yaml"
+    work_path = tmp_path / "work-items.yaml"
+    work_path.write_bytes(fixture.read_bytes())
+    return WorkItemsLoader(work_path)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep disk caches and process-wide GitHub caches per test."""
+    from wbs_mcp import github_sync
+    from wbs_mcp.tools import pr_review_read
+
+    monkeypatch.setenv("WBS_CACHE_DIR", str(tmp_path / "cache"))
+    github_sync._item_indexes.clear()
+    github_sync._project_schemas.clear()
+    pr_review_read.invalidate_thread_cache()
+    yield
+    github_sync._item_indexes.clear()
+    github_sync._project_schemas.clear()
+    pr_review_read.invalidate_thread_cache()
@@ -0,0 +1,83 @@
+"""Tests for the asyncio GitHub request engine."""
+
+import asyncio
+import time
+
+import pytest
+
+from wbs_mcp.async_sync import AsyncGraphQLEngine
+from wbs_mcp.graphql_client import RateLimitError
+
+
+def slow(response, delay=0.2):
+    """Response callable that keeps the request in flight for a while."""
+    def respond(request):
+        time.sleep(delay)
+        return response
+    return respond
+
+
+async def test_identical_queries_coalesced(server, client):
+    """Test that identical in-flight queries are sent once."""
+    server.responses = [slow({"data": {"n": 1}}), {"data": {"n": 2}}]
+    engine = AsyncGraphQLEngine(client)
+
+    first, second = await asyncio.gather(
+        engine.execute("query($x: Int!) { n }", {"x": 1}),
+        engine.execute("query($x: Int!) { n }", {"x": 1}),
+    )
+
+    assert first == second == {"data": {"n": 1}}
+    assert len(server.requests) == 1
+
+    # Once finished, the same query runs again
+    assert (await engine.execute("query($x: Int!) { n }", {"x": 1}))["data"] == {"n": 2}
+
+
+async def test_requests_run_concurrently(server, client):
+    """Test that distinct queries overlap up to the concurrency limit."""
+    server.responses = [slow({"data": {"n": i}}) for i in range(4)]
+    engine = AsyncGraphQLEngine(client, concurrency=4)
+
+    start = time.monotonic()
+    await asyncio.gather(*(engine.execute("query($x: Int!) { n }", {"x": i}) for i in range(4)))
+
+    assert time.monotonic() - start < 0.6
+    assert len(server.requests) == 4
+
+
+async def test_secondary_rate_limit_retried(server, client):
+    """Test that a secondary rate limit is retried after Retry-After."""
+    server.responses = [
+        (403, {"Retry-After": "0"}, {"message": "You have exceeded a secondary rate limit"}),
+        {"data": {"ok": True}},
+    ]
+    engine = AsyncGraphQLEngine(client, base_backoff=0.01)
+
+    response = await engine.execute("mutation { ok }")
+
+    assert response["data"] == {"ok": True}
+    assert len(server.requests) == 2
+
+
+async def test_rate_limit_gives_up_after_retries(server, client):
+    """Test that persistent rate limiting raises once retries are spent."""
+    server.responses = [(429, {}, {"message": "Too many requests"})] * 3
+    engine = AsyncGraphQLEngine(client, max_retries=2, base_backoff=0.01)
+
+    with pytest.raises(RateLimitError):
+        await engine.execute("query { n }")
+    assert len(server.requests) == 3
+
+
+async def test_exhausted_budget_fails_fast(server, client):
+    """Test that a primary limit resetting far in the future isn't waited out."""
+    reset = str(int(time.time()) + 3600)
+    server.responses = [(200, {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": reset}, {"data": {"n": 1}})]
+    engine = AsyncGraphQLEngine(client)
+
+    await engine.execute("query { n }")
+    assert client.rate_limit["remaining"] == 3
+
+    with pytest.raises(RateLimitError, match="nearly exhausted"):
+        await engine.execute("query { m }")
@@ -0,0 +1,141 @@
+"""Opt-in benchmarks over synthetic backlogs.
+
+Skipped unless WBS_BENCHMARK_SIZES is set, e.g.::
+
+    WBS_BENCHMARK_SIZES=1000,10000 pytest tests/test_benchmarks.py
+
+Each benchmark runs WBS_BENCHMARK_ROUNDS times (default: 5) per backlog
+size. Results (min, median and mean seconds) are written to
+WBS_BENCHMARK_OUTPUT (default: .benchmarks/latest.json). To compare
+against an earlier run, point WBS_BENCHMARK_BASELINE at its file; a
+benchmark fails if its median is more than WBS_BENCHMARK_TOLERANCE
+(default: 0.25, i.e. 25%) slower than the baseline.
+"""
+
+import json
+import os
+import platform
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+
+from wbs_mcp.data_loader import WorkItemsLoader
+from wbs_mcp.synthetic import BacklogSpec, write_backlog
+from wbs_mcp.tools import build_hierarchy, calculate_milestone_progress, validate_work_items
+from wbs_mcp.yaml_writer import WorkItemWriter
+
+SIZES = [int(s) for s in os.environ.get("WBS_BENCHMARK_SIZES", "").split(",") if s.strip()]
+ROUNDS = int(os.environ.get("WBS_BENCHMARK_ROUNDS", "5"))
+OUTPUT = Path(os.environ.get("WBS_BENCHMARK_OUTPUT", ".benchmarks/latest.json"))
+BASELINE = os.environ.get("WBS_BENCHMARK_BASELINE")
+TOLERANCE = float(os.environ.get("WBS_BENCHMARK_TOLERANCE", "0.25"))
+# The round-trip YAML writer is much slower than the loader; cap its sizes
+WRITER_MAX_ITEMS = int(os.environ.get("WBS_BENCHMARK_WRITER_MAX", "10000"))
+SEED = int(os.environ.get("WBS_BENCHMARK_SEED", "0"))
+
+if not SIZES:
+    pytest.skip("benchmarks run only with WBS_BENCHMARK_SIZES set", allow_module_level=True)
+
+
+@pytest.fixture(scope="module")
+def results():
+    """Collected results, written to OUTPUT after the module's benchmarks."""
+    collected = {}
+    yield collected
+    OUTPUT.parent.mkdir(parents=True, exist_ok=True)
+    OUTPUT.write_text(json.dumps({
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "seed": SEED,
+        "rounds": ROUNDS,
+        "results": collected,
+    }, indent=2) + "\n")
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    """Results of the baseline run, if one is configured."""
+    if not BASELINE:
+        return {}
+    return json.loads(Path(BASELINE).read_text())["results"]
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda n: f"{n}items")
+def backlog(request, tmp_path_factory):
+    """Synthetic backlog file and its parsed items."""
+    path = tmp_path_factory.mktemp("backlog") / "work-items.yaml"
+    write_backlog(path, BacklogSpec(items=request.param, seed=SEED))
+    return path, WorkItemsLoader(path).load()
+
+
+@pytest.fixture
+def bench(request, results, baseline, backlog):
+    """Time a function over ROUNDS runs, record it and check the baseline."""
+    def run(func, setup=None):
+        timings = []
+        for _ in range(ROUNDS):
+            arg = setup() if setup else None
+            start = time.perf_counter()
+            func(arg) if setup else func()
+            timings.append(time.perf_counter() - start)
+
+        name = f"{request.node.originalname.removeprefix('test_')}[{len(backlog[1])}]"
+        result = {
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "mean": statistics.fmean(timings),
+        }
+        results[name] = result
+        previous = baseline.get(name)
+        if previous is not None:
+            limit = previous["median"] * (1 + TOLERANCE)
+            assert result["median"] <= limit, (
+                f"{name} regressed: median {result['median']:.4f}s vs baseline {previous['median']:.4f}s"
+            )
+    return run
+
+
+def test_load(bench, backlog):
+    path, _ = backlog
+    bench(lambda: WorkItemsLoader(path).load())
+
+
+def test_filter(bench, backlog):
+    path, _ = backlog
+    loader = WorkItemsLoader(path)
+    loader.load()
+    bench(lambda: (
+        loader.filter(status="In Progress"),
+        loader.filter(wbs_type="Feature", milestone="M1"),
+        loader.filter(work_stream="WS2", status="Blocked"),
+    ))
+
+
+def test_build_hierarchy(bench, backlog):
+    _, items = backlog
+    bench(lambda: build_hierarchy(items))
+
+
+def test_validate_work_items(bench, backlog):
+    _, items = backlog
+    bench(lambda: validate_work_items(items))
+
+
+def test_calculate_milestone_progress(bench, backlog):
+    _, items = backlog
+    bench(lambda: calculate_milestone_progress(items))
+
+
+def test_update_work_item(bench, backlog, tmp_path):
+    path, items = backlog
+    if len(items) > WRITER_MAX_ITEMS:
+        pytest.skip(f"writer benchmark limited to {WRITER_MAX_ITEMS} items (WBS_BENCHMARK_WRITER_MAX)")
+    work_path = tmp_path / "work-items.yaml"
+    work_path.write_bytes(path.read_bytes())
+    writer = WorkItemWriter(work_path)
+    target = items[len(items) // 2].wbs_id
+    statuses = iter(["Done", "Blocked"] * ROUNDS)
+    bench(lambda status: writer.update_work_item(target, {"status": status}), setup=lambda: next(statuses))
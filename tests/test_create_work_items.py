@@ -0,0 +1,99 @@
+"""Tests for bulk work item import."""
+
+import json
+
+from wbs_mcp.data_loader import WorkItemsLoader
+from wbs_mcp.tools.create_work_items import create_work_items, format_create_result
+
+
+def make_row(issue_number, wbs_id, **overrides):
+    """Build a valid import row."""
+    row = {
+        "issue_number": issue_number,
+        "wbs_id": wbs_id,
+        "wbs_type": "Task",
+        "wbs_parent": "WS-18101",
+        "title": f"Imported {wbs_id}",
+        "priority": "🟡 Medium",
+        "effort_days": 1.5,
+        "work_stream": "WS1-Repository",
+        "status": "Todo",
+    }
+    row.update(overrides)
+    return row
+
+
+def test_import_jsonl_reports_row_errors(loader):
+    """Test that valid rows are appended and bad rows reported individually."""
+    lines = [
+        json.dumps(make_row(100, "WS-18101-01", description="Line one\nLine two")),
+        json.dumps(make_row(101, "WS-17101")),              # existing WBS ID
+        json.dumps(make_row(54, "WS-18101-02")),            # existing issue number
+        json.dumps(make_row(102, "WS-18101-01")),           # duplicate within import
+        json.dumps(make_row(103, "WS-18101-03", effort_days="lots")),
+        "{not json",
+        "",
+        json.dumps(make_row(104, "WS-18101-04", stauts="Done")),
+        json.dumps(make_row(105, "WS-18101-05")),
+    ]
+    
+    result = create_work_items(loader, data="\n".join(lines))
+    
+    assert result["success"]
+    assert result["total_rows"] == 8
+    assert result["created"] == ["WS-18101-01", "WS-18101-05"]
+    assert [e["row"] for e in result["errors"]] == [2, 3, 4, 5, 6, 8]
+    assert "effort_days" in result["errors"][3]["error"]
+    assert "stauts" in result["errors"][5]["error"]
+    
+    # Visible through the loader without a reload, and persisted
+    assert loader.get_by_issue_number(105).wbs_id == "WS-18101-05"
+    assert not loader._needs_reload()
+    fresh = WorkItemsLoader(loader.yaml_path)
+    assert fresh.get_by_wbs_id("WS-18101-01").description == "Line one\nLine two"
+    assert len(fresh.load()) == 9
+    assert "Rejected rows (6)" in format_create_result(result)
+
+
+def test_import_csv_file(loader, tmp_path):
+    """Test CSV import with type coercion and list columns."""
+    csv_path = tmp_path / "import.csv"
+    csv_path.write_text(
+        "issue_number,wbs_id,wbs_type,title,priority,effort_days,work_stream,status,assignees,milestone\n"
+        "200,WS-19001,Epic,New epic,🟢 Low,10,WS2,Todo,alice; bob,M2\n"
+        "201,WS-19101,Feature,,🟢 Low,3,WS2,Todo,,\n",
+        encoding="utf-8",
+    )
+    
+    result = create_work_items(loader, path=str(csv_path))
+    
+    assert result["created"] == ["WS-19001"]
+    assert result["errors"][0]["row"] == 3
+    item = loader.get_by_wbs_id("WS-19001")
+    assert item.effort_days == 10.0
+    assert item.assignees == ["alice", "bob"]
+    assert item.milestone == "M2"
+
+
+def test_import_path_must_be_inside_workspace(loader, tmp_path):
+    """Test that files outside the workspace can't be read through path."""
+    outside = tmp_path.parent / f"{tmp_path.name}-outside.jsonl"
+    outside.write_text(json.dumps(make_row(300, "WS-19301")) + "\n", encoding="utf-8")
+    (tmp_path / "link.jsonl").symlink_to(outside)
+    try:
+        for path in (str(outside), "../" + outside.name, "link.jsonl"):
+            result = create_work_items(loader, path=path)
+            assert not result["success"]
+            assert "inside the workspace" in result["error"]
+    finally:
+        outside.unlink()
+
+    (tmp_path / "rows.jsonl").write_text(json.dumps(make_row(300, "WS-19301")) + "\n", encoding="utf-8")
+    assert create_work_items(loader, path="rows.jsonl")["created"] == ["WS-19301"]
+
+
+def test_import_requires_single_source(loader):
+    """Test argument validation."""
+    assert not create_work_items(loader)["success"]
+    assert not create_work_items(loader, data="", path="x.csv")["success"]
+    assert not create_work_items(loader, data="", fmt="xml")["success"]
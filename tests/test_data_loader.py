@@ -98,3 +98,49 @@ def test_caching(loader):
     
     # Should be exact same objects (cached)
     assert items1 is items2
+
+
+def test_write_through_update(yaml_path, tmp_path):
+    """Test that writer results patch the loader cache without a reload."""
+    from wbs_mcp.yaml_writer import WorkItemWriter
+
+    work_path = tmp_path / "work-items.yaml"
+    work_path.write_bytes(yaml_path.read_bytes())
+    loader = WorkItemsLoader(work_path)
+    items_before = loader.load()
+    
+    writer = WorkItemWriter(work_path)
+    updated = writer.update_work_item("WS-17102", {"status": "Done"}, create_backup=False)
+    loader.apply_update(updated, writer.file_identity, writer.content_hash)
+    
+    # Cache is patched in place of a reload; the old snapshot is untouched
+    assert not loader._needs_reload()
+    assert loader.get_by_wbs_id("WS-17102").status == "Done"
+    assert loader.get_by_issue_number(55).status == "Done"
+    assert items_before[2].status == "In Progress"
+    
+    # Patched snapshot matches what a full reload produces
+    fresh = WorkItemsLoader(work_path)
+    fresh.load()
+    assert fresh.content_hash == loader.content_hash
+
+
+def test_concurrent_first_loads_parse_once(loader, monkeypatch):
+    """Test that threads racing on the first load share one parse."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    import wbs_mcp.data_loader as data_loader
+
+    parses = []
+    real_safe_load = data_loader.yaml.safe_load
+
+    def counting_safe_load(text):
+        parses.append(1)
+        return real_safe_load(text)
+
+    monkeypatch.setattr(data_loader.yaml, "safe_load", counting_safe_load)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: loader.get_by_wbs_id("WS-17001"), range(16)))
+
+    assert len(parses) == 1
+    assert all(item is results[0] for item in results)
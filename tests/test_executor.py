@@ -0,0 +1,45 @@
+"""Tests for the tool worker pool and cancellation."""
+
+import asyncio
+import threading
+
+import pytest
+
+from wbs_mcp.executor import OperationCancelled, check_cancelled, run_blocking
+
+
+async def test_runs_off_the_event_loop():
+    """Test that blocking work runs in a worker thread."""
+    loop_thread = threading.get_ident()
+
+    assert await run_blocking(threading.get_ident) != loop_thread
+    # Outside a tool call, checks are no-ops
+    check_cancelled()
+
+
+async def test_cancellation_stops_running_call():
+    """Test that cancelling the awaiting task stops the worker at its next check."""
+    started = threading.Event()
+    finished = []
+
+    def long_call():
+        started.set()
+        try:
+            while True:
+                check_cancelled()
+                threading.Event().wait(0.01)
+        except OperationCancelled:
+            finished.append("cancelled")
+            raise
+
+    task = asyncio.create_task(run_blocking(long_call))
+    await asyncio.to_thread(started.wait, 2)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    for _ in range(100):
+        if finished:
+            break
+        await asyncio.sleep(0.01)
+    assert finished == ["cancelled"]
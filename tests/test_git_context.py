@@ -0,0 +1,99 @@
+"""Tests for reading repository context from .git and PR lookup."""
+
+import pytest
+
+from wbs_mcp import git_context, graphql_client
+from wbs_mcp.git_context import read_git_context
+from wbs_mcp.tools import pr_review_read
+
+HEAD_SHA = "1" * 40
+OTHER_SHA = "2" * 40
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    """Start every test without cached configs or PR numbers."""
+    git_context._configs.clear()
+    git_context._pr_numbers.clear()
+    yield
+    git_context._configs.clear()
+    git_context._pr_numbers.clear()
+
+
+def make_repo(root, config, head="ref: refs/heads/feature/x"):
+    """Create a minimal .git directory."""
+    git_dir = root / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text(head + "\n")
+    (git_dir / "config").write_text(config)
+    return git_dir
+
+
+def test_reads_remote_branch_and_packed_ref(tmp_path):
+    """Test owner/repo from the branch's remote and SHA from packed-refs."""
+    git_dir = make_repo(tmp_path, """[core]
+\tbare = false
+[remote "origin"]
+\turl = https://github.com/me/fork.git
+[remote "upstream"]
+\turl = git@github.com:acme/widgets.git
+[branch "feature/x"]
+\tremote = upstream
+\tmerge = refs/heads/feature/x-review
+""")
+    (git_dir / "packed-refs").write_text(
+        f"# pack-refs with: peeled fully-peeled sorted\n{HEAD_SHA} refs/heads/feature/x\n"
+    )
+    (tmp_path / "src").mkdir()
+
+    assert read_git_context(tmp_path / "src") == {
+        "owner": "acme", "repo": "widgets", "branch": "feature/x-review", "head": HEAD_SHA,
+    }
+
+
+def test_worktree_and_detached_head(tmp_path):
+    """Test a linked worktree (.git file) with a detached HEAD."""
+    main_git = make_repo(tmp_path / "main", '[remote "origin"]\n\turl = ssh://git@github.com/acme/widgets\n')
+    worktree_git = main_git / "worktrees" / "wt"
+    worktree_git.mkdir(parents=True)
+    (worktree_git / "HEAD").write_text(OTHER_SHA + "\n")
+    (worktree_git / "commondir").write_text("../..\n")
+    (tmp_path / "wt").mkdir()
+    (tmp_path / "wt" / ".git").write_text(f"gitdir: {worktree_git}\n")
+
+    assert read_git_context(tmp_path / "wt") == {
+        "owner": "acme", "repo": "widgets", "branch": None, "head": OTHER_SHA,
+    }
+
+
+def test_pr_lookup_is_cached_per_head(server, client, tmp_path, monkeypatch):
+    """Test that the branch lookup and threads share one request, then use the PR cache."""
+    git_dir = make_repo(tmp_path, '[remote "origin"]\n\turl = https://github.com/acme/widgets\n')
+    (git_dir / "refs" / "heads" / "feature").mkdir()
+    ref = git_dir / "refs" / "heads" / "feature" / "x"
+    ref.write_text(HEAD_SHA + "\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(graphql_client, "_client", client)
+
+    pr = {"number": 12, "updatedAt": "2026-01-05T10:00:00Z", "reviewThreads": {
+        "pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": [],
+    }}
+    server.responses = [
+        {"data": {"repository": {"pullRequests": {"nodes": [pr]}}}},
+        {"data": {"repository": {"pullRequest": pr}}},
+        {"data": {"repository": {"pullRequests": {"nodes": [pr]}}}},
+    ]
+
+    assert pr_review_read.list_pr_review_threads()["pr_number"] == 12
+    assert server.requests[0]["body"]["variables"] == {
+        "owner": "acme", "repo": "widgets", "branch": "feature/x", "cursor": None,
+    }
+
+    # Same HEAD: PR number comes from the cache
+    assert pr_review_read.list_pr_review_threads()["pr_number"] == 12
+    assert server.requests[1]["body"]["variables"]["pr"] == 12
+
+    # New commit: look the branch up again
+    ref.write_text(OTHER_SHA + "\n")
+    assert pr_review_read.list_pr_review_threads()["pr_number"] == 12
+    assert "branch" in server.requests[2]["body"]["variables"]
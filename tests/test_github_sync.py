@@ -0,0 +1,287 @@
+"""Tests for GitHub Projects sync against a local stand-in server."""
+
+from wbs_mcp import github_sync
+from wbs_mcp.async_sync import AsyncGraphQLEngine
+from wbs_mcp.github_sync import GitHubProjectSync
+
+
+def items_page(numbers, end_cursor, has_next):
+    """Build a project items page response."""
+    return {"data": {"organization": {"projectV2": {"items": {
+        "pageInfo": {"hasNextPage": has_next, "endCursor": end_cursor},
+        "nodes": [{"id": f"PVTI_{n}", "content": {"number": n}} for n in numbers],
+    }}}}}
+
+
+def test_item_index_paginates_and_caches(server, client):
+    """Test that the item index covers all pages and is reused."""
+    server.responses = [
+        items_page(range(1, 101), "c1", True),
+        items_page(range(101, 151), "c2", False),
+    ]
+    
+    sync = GitHubProjectSync(client)
+    assert sync._get_project_item_id(150) == "PVTI_150"
+    assert [r["body"]["variables"]["cursor"] for r in server.requests] == [None, "c1"]
+    
+    # Hits are served from the process-wide index, even for new instances
+    assert GitHubProjectSync(client)._get_project_item_id(3) == "PVTI_3"
+    assert len(server.requests) == 2
+
+
+def test_item_index_miss_resumes_from_cursor(server, client):
+    """Test that a miss fetches only items added after the saved cursor."""
+    server.responses = [
+        items_page([1, 2], "c1", False),
+        items_page([3], "c2", False),
+        items_page([], None, False),
+    ]
+    
+    sync = GitHubProjectSync(client)
+    assert sync._get_project_item_id(3) == "PVTI_3"
+    assert server.requests[1]["body"]["variables"]["cursor"] == "c1"
+    
+    assert sync._get_project_item_id(99) is None
+    assert server.requests[2]["body"]["variables"]["cursor"] == "c2"
+    
+    # Misses are remembered for a while
+    assert sync._get_project_item_id(99) is None
+    assert len(server.requests) == 3
+
+
+def test_item_index_miss_expires(server, client):
+    """Test that an issue added to the project after a miss is found later."""
+    server.responses = [
+        items_page([1], "c1", False),
+        items_page([], None, False),
+        items_page([99], "c2", False),
+    ]
+    
+    sync = GitHubProjectSync(client)
+    assert sync._get_project_item_id(99) is None
+    assert len(server.requests) == 2
+    
+    # Issue 99 is added to the project; the miss ages past the interval
+    index = github_sync._item_indexes[(sync.org, sync.project_number)]
+    index["misses"][99] -= github_sync.SCHEMA_REFRESH_INTERVAL + 1
+    assert sync._get_project_item_id(99) == "PVTI_99"
+    assert server.requests[2]["body"]["variables"]["cursor"] == "c1"
+    assert 99 not in index["misses"]
+
+
+def test_item_index_persisted_to_disk(server, client):
+    """Test that a new process starts from the disk cache."""
+    server.responses = [items_page([7], "c1", False)]
+    GitHubProjectSync(client)._get_project_item_id(7)
+    
+    # Simulate a fresh process
+    github_sync._item_indexes.clear()
+    assert GitHubProjectSync(client)._get_project_item_id(7) == "PVTI_7"
+    assert len(server.requests) == 1
+
+
+FIELDS = {"data": {"organization": {"projectV2": {"id": "PVT_1", "fields": {
+    "pageInfo": {"hasNextPage": False, "endCursor": "f1"},
+    "nodes": [
+        {"id": "F_title", "name": "Title", "dataType": "TITLE"},
+        {"id": "F_status", "name": "Status", "dataType": "SINGLE_SELECT", "options": [
+            {"id": "O_todo", "name": "Todo"}, {"id": "O_done", "name": "Done"},
+        ]},
+        {"id": "F_priority", "name": "Priority", "dataType": "SINGLE_SELECT", "options": [
+            {"id": "O_low", "name": "🟢 Low"}, {"id": "O_high", "name": "🔥 High"},
+        ]},
+        {"id": "F_start", "name": "Start date", "dataType": "DATE"},
+        {"id": "F_end", "name": "End date", "dataType": "DATE"},
+        {"id": "F_estimate", "name": "Estimate", "dataType": "NUMBER"},
+        {"id": "F_notes", "name": "Notes", "dataType": "TEXT"},
+        {"id": "F_iteration", "name": "Iteration", "dataType": "ITERATION", "configuration": {
+            "iterations": [{"id": "I_2", "title": "M1.2 Integration"}],
+            "completedIterations": [{"id": "I_1", "title": "M1.1 Foundation"}],
+        }},
+    ],
+}}}}}
+
+
+def route(server, mutation_handler):
+    """Answer every request by query type, delegating mutations."""
+    def respond(body):
+        query = body["query"]
+        if "mutation" in query:
+            return mutation_handler(body)
+        if "fields(" in query:
+            return FIELDS
+        return items_page([10, 11, 12], "c1", False)
+    server.responses = [respond] * 20
+
+
+def test_sync_work_items_batches_and_maps_failures(server, client, monkeypatch):
+    """Test batched mutations with per-(issue, field) outcomes."""
+    monkeypatch.setattr(github_sync, "MAX_MUTATIONS_PER_REQUEST", 4)
+    
+    def mutation(body):
+        aliases = [f"m{i}" for i in range(body["query"].count("updateProjectV2ItemFieldValue"))]
+        if body["variables"]["item0"] == "PVTI_12":
+            # Second batch: fail the second operation
+            return {
+                "data": {"m0": {"projectV2Item": {"id": "x"}}, "m1": None},
+                "errors": [{"message": "Field locked", "path": ["m1"]}],
+            }
+        return {"data": {alias: {"projectV2Item": {"id": "x"}} for alias in aliases}}
+    
+    route(server, mutation)
+    sync = GitHubProjectSync(client)
+    results = sync.sync_work_items({
+        10: {"status": "Done", "priority": "🟢 Low"},
+        11: {"status": "Todo", "priority": "🔥 High", "title": "ignored"},
+        12: {"status": "Done", "priority": "🟢 Low"},
+        99: {"status": "Done"},
+        10_000: {"title": "unmapped only"},
+    })
+    
+    assert results[10] == {"status": True, "priority": True}
+    assert results[11] == {"status": True, "priority": True}
+    assert results[12] == {"status": True, "priority": False}
+    assert results[99] == {"status": False}
+    assert results[10_000] == {}
+    assert sync.errors[(12, "priority")] == "Field locked"
+    assert "not found" in sync.errors[(99, "status")]
+    
+    mutations = [r["body"] for r in server.requests if "mutation" in r["body"]["query"]]
+    assert [m["query"].count("updateProjectV2ItemFieldValue") for m in mutations] == [4, 2]
+    assert mutations[0]["variables"]["value0"] == {"singleSelectOptionId": "O_done"}
+
+
+async def test_sync_work_items_async_runs_batches(server, client, monkeypatch):
+    """Test that the async sync sends every batch and records outcomes."""
+    monkeypatch.setattr(github_sync, "MAX_MUTATIONS_PER_REQUEST", 1)
+    
+    def mutation(body):
+        return {"data": {"m0": {"projectV2Item": {"id": "x"}}}}
+    
+    route(server, mutation)
+    sync = GitHubProjectSync(client)
+    engine = AsyncGraphQLEngine(client, mutation_interval=0)
+    results = await sync.sync_work_items_async({
+        10: {"status": "Done"},
+        11: {"status": "Todo", "priority": "🔥 High"},
+        99: {"status": "Done"},
+    }, engine)
+    
+    assert results == {
+        10: {"status": True},
+        11: {"status": True, "priority": True},
+        99: {"status": False},
+    }
+    mutations = [r for r in server.requests if "mutation" in r["body"]["query"]]
+    assert len(mutations) == 3
+
+
+def test_unresolved_item_dropped_from_index(server, client):
+    """Test that an item deleted from the project is looked up again."""
+    def mutation(body):
+        return {
+            "data": {"m0": None},
+            "errors": [{"message": "Could not resolve to a node with the global id of 'PVTI_10'", "path": ["m0"]}],
+        }
+    
+    route(server, mutation)
+    sync = GitHubProjectSync(client)
+    assert sync.sync_work_items({10: {"status": "Done"}, 11: {"status": "Done"}}) == {
+        10: {"status": False}, 11: {"status": False},
+    }
+    index = github_sync._item_indexes[(sync.org, sync.project_number)]
+    assert 10 not in index["items"] and 11 in index["items"]
+    
+    # Re-added to the project with a new item ID
+    server.responses = [items_page([10], "c2", False)]
+    server.requests.clear()
+    assert sync._get_project_item_id(10) == "PVTI_10"
+    assert server.requests[0]["body"]["variables"]["cursor"] == "c1"
+
+
+def test_typed_fields_sync_in_one_request(server, client, monkeypatch):
+    """Test that date, number, text and iteration fields share one mutation document."""
+    for yaml_field, github_field in {
+        "start_date": "Start date", "end_date": "End date", "effort_days": "Estimate",
+        "description": "Notes", "milestone": "Iteration",
+    }.items():
+        monkeypatch.setitem(github_sync.FIELD_MAPPING, yaml_field, github_field)
+    
+    def mutation(body):
+        count = body["query"].count("ProjectV2ItemFieldValue(")
+        return {"data": {f"m{i}": {"projectV2Item": {"id": "x"}} for i in range(count)}}
+    
+    route(server, mutation)
+    sync = GitHubProjectSync(client)
+    results = sync.sync_work_item(10, {
+        "status": "Done",
+        "start_date": "2026-03-01",
+        "end_date": None,
+        "effort_days": 2.5,
+        "description": "Ship it",
+        "milestone": "M1.1 Foundation",
+    })
+    
+    assert all(results.values()) and len(results) == 6
+    mutations = [r["body"] for r in server.requests if "mutation" in r["body"]["query"]]
+    assert len(mutations) == 1
+    variables = mutations[0]["variables"]
+    assert [variables[f"value{i}"] for i in (0, 1, 3, 4, 5)] == [
+        {"singleSelectOptionId": "O_done"},
+        {"date": "2026-03-01"},
+        {"number": 2.5},
+        {"text": "Ship it"},
+        {"iterationId": "I_1"},
+    ]
+    assert "value2" not in variables
+    assert "m2: clearProjectV2ItemFieldValue" in mutations[0]["query"]
+
+
+def test_typed_field_rejects_bad_values(server, client, monkeypatch):
+    """Test that values are checked against the field type before any mutation."""
+    monkeypatch.setitem(github_sync.FIELD_MAPPING, "start_date", "Start date")
+    monkeypatch.setitem(github_sync.FIELD_MAPPING, "milestone", "Iteration")
+    route(server, lambda body: {"data": {}})
+    sync = GitHubProjectSync(client)
+    
+    results = sync.sync_work_item(10, {"start_date": "next week", "milestone": "M9"})
+    
+    assert results == {"start_date": False, "milestone": False}
+    assert "expected YYYY-MM-DD" in sync.errors[(10, "start_date")]
+    assert "M1.2 Integration" in sync.errors[(10, "milestone")]
+    assert not any("mutation" in r["body"]["query"] for r in server.requests)
+
+
+def test_field_mapping_from_env(monkeypatch):
+    """Test that WBS_GITHUB_FIELD_MAP extends and disables default mappings."""
+    monkeypatch.setenv("WBS_GITHUB_FIELD_MAP", '{"start_date": "Start date", "priority": null}')
+    assert github_sync.load_field_mapping() == {"status": "Status", "start_date": "Start date"}
+    
+    monkeypatch.setenv("WBS_GITHUB_FIELD_MAP", "not json")
+    assert github_sync.load_field_mapping() == github_sync.DEFAULT_FIELD_MAPPING
+
+
+def test_sync_work_item_rejects_invalid_option(server, client):
+    """Test that invalid option values fail without a mutation."""
+    route(server, lambda body: {"data": {}})
+    sync = GitHubProjectSync(client)
+    
+    assert sync.sync_work_item(10, {"status": "Someday"}) == {"status": False}
+    assert "Valid options: Todo, Done" in sync.errors[(10, "status")]
+    assert not any("mutation" in r["body"]["query"] for r in server.requests)
+
+
+def test_field_schema_fetched_once_and_shared(server, client):
+    """Test that project ID and all fields come from one cached fetch."""
+    route(server, lambda body: {"data": {"m0": {"projectV2Item": {"id": "x"}}, "m1": {"projectV2Item": {"id": "x"}}}})
+    
+    GitHubProjectSync(client).sync_work_item(10, {"status": "Done", "priority": "🟢 Low"})
+    GitHubProjectSync(client).sync_work_item(11, {"status": "Todo"})
+    
+    queries = [r["body"]["query"] for r in server.requests]
+    assert sum("fields(" in q for q in queries) == 1
+    
+    # A new process starts warm from the disk cache
+    github_sync._project_schemas.clear()
+    assert GitHubProjectSync(client)._get_project_id() == "PVT_1"
+    assert sum("fields(" in r["body"]["query"] for r in server.requests) == 1
@@ -0,0 +1,61 @@
+"""Tests for the native GraphQL client against a local stand-in server."""
+
+import pytest
+
+from wbs_mcp.github_sync import GitHubProjectSync
+from wbs_mcp.graphql_client import GraphQLError
+
+
+def test_connection_reused_across_requests(server, client):
+    """Test that consecutive requests share one keep-alive connection."""
+    server.responses = [{"data": {"n": 1}}, {"data": {"n": 2}}]
+    
+    assert client.execute("query { n }")["data"] == {"n": 1}
+    assert client.execute("query($x: Int!) { n }", {"x": 5})["data"] == {"n": 2}
+    
+    first, second = server.requests
+    assert first["client_port"] == second["client_port"]
+    assert first["authorization"] == "bearer test-token"
+    assert second["body"]["variables"] == {"x": 5}
+
+
+def test_dropped_connection_retries_queries_only(server, client):
+    """Test that a request lost after sending is retried for queries, not mutations."""
+    server.responses = [{"data": {"n": 1}}, None, {"data": {"n": 2}}, None]
+    
+    client.execute("query { n }")
+    assert client.execute("query { n }")["data"] == {"n": 2}
+    assert len(server.requests) == 3
+    
+    # The dropped mutation may have been applied; it isn't sent again
+    with pytest.raises(ConnectionError):
+        client.execute("mutation { addReply { id } }")
+    assert len(server.requests) == 4
+
+
+def test_graphql_errors_raise(server, client):
+    """Test error handling for full and partial failures."""
+    server.responses = [
+        {"errors": [{"message": "Bad credentials"}]},
+        {"data": {"a": None}, "errors": [{"message": "boom", "path": ["a"]}]},
+    ]
+    
+    with pytest.raises(GraphQLError, match="Bad credentials"):
+        client.execute("query { a }")
+    
+    response = client.execute("query { a }", allow_partial=True)
+    assert response["errors"][0]["path"] == ["a"]
+
+
+def test_project_sync_uses_client(server, client):
+    """Test that GitHubProjectSync queries go through the injected client."""
+    server.responses = [
+        {"data": {"organization": {"projectV2": {"id": "PVT_1", "fields": {
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+            "nodes": [],
+        }}}}},
+    ]
+    
+    sync = GitHubProjectSync(client)
+    assert sync._get_project_id() == "PVT_1"
+    assert server.requests[0]["body"]["variables"]["number"] == sync.project_number
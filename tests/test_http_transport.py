@@ -0,0 +1,124 @@
+"""Tests for the streamable HTTP transport."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import uvicorn
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
+
+from wbs_mcp import server
+from wbs_mcp.data_loader import WorkItemsLoader
+from wbs_mcp.http_transport import ConnectionLimiter, create_http_app
+from wbs_mcp.response_cache import ResponseCache
+
+TOOL_CALL = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {}}).encode()
+CANCEL = json.dumps({"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {}}).encode()
+
+
+class BlockingApp:
+    """ASGI app that holds each request until released, tracking concurrency."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.running = 0
+        self.peak = 0
+        self.bodies = []
+
+    async def __call__(self, scope, receive, send):
+        self.bodies.append((await receive())["body"])
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await self.release.wait()
+        self.running -= 1
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def request(app, body, session="s1"):
+    """Send a POST through an ASGI app and return the response status."""
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "headers": [(b"mcp-session-id", session.encode())],
+             "client": ("127.0.0.1", 5000)}
+    await app(scope, receive, send)
+    return sent[0]["status"]
+
+
+async def test_per_client_fairness():
+    """Test that one client's tool calls are capped without blocking others."""
+    inner = BlockingApp()
+    limiter = ConnectionLimiter(inner, max_connections=10, client_concurrency=2)
+
+    busy = [asyncio.create_task(request(limiter, TOOL_CALL, "busy")) for _ in range(4)]
+    other = asyncio.create_task(request(limiter, TOOL_CALL, "other"))
+    cancel = asyncio.create_task(request(limiter, CANCEL, "busy"))
+    await asyncio.sleep(0.05)
+
+    # Two of "busy"'s calls run; its cancellation and "other"'s call aren't held back
+    assert inner.running == 4
+    assert inner.bodies.count(CANCEL) == 1
+
+    inner.release.set()
+    assert await asyncio.gather(*busy, other, cancel) == [200] * 6
+    assert inner.peak == 4
+    assert limiter._clients == {}
+
+
+async def test_connection_limit():
+    """Test that requests over the connection limit are rejected with 503."""
+    inner = BlockingApp()
+    limiter = ConnectionLimiter(inner, max_connections=2, client_concurrency=4)
+
+    held = [asyncio.create_task(request(limiter, CANCEL, f"c{i}")) for i in range(2)]
+    await asyncio.sleep(0.05)
+    assert await request(limiter, TOOL_CALL, "late") == 503
+
+    inner.release.set()
+    assert await asyncio.gather(*held) == [200, 200]
+    assert await request(limiter, TOOL_CALL, "late") == 200
+
+
+async def test_clients_share_one_snapshot(tmp_path, monkeypatch):
+    """Test that concurrent HTTP clients are served from one loader and cache."""
+    fixture = Path(__file__).parent / "fixtures" / "work-items.yaml"
+    work_path = tmp_path / "work-items.yaml"
+    work_path.write_bytes(fixture.read_bytes())
+    monkeypatch.setattr(server, "loader", WorkItemsLoader(work_path))
+    monkeypatch.setattr(server, "write_queue", None)
+    monkeypatch.setattr(server, "response_cache", ResponseCache())
+
+    config = uvicorn.Config(create_http_app(server.app), host="127.0.0.1", port=0, log_level="warning")
+    http_server = uvicorn.Server(config)
+    serving = asyncio.create_task(http_server.serve())
+    while not http_server.started:
+        await asyncio.sleep(0.01)
+    port = http_server.servers[0].sockets[0].getsockname()[1]
+
+    async def get_item():
+        async with streamable_http_client(f"http://127.0.0.1:{port}/mcp/") as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool("get_work_item", {"wbs_id": "WS-17001"})
+                return result.content[0].text
+
+    try:
+        texts = await asyncio.gather(*(get_item() for _ in range(3)))
+        async with httpx.AsyncClient() as http:
+            exposition = (await http.get(f"http://127.0.0.1:{port}/metrics")).text
+    finally:
+        http_server.should_exit = True
+        await serving
+
+    assert texts[0] == texts[1] == texts[2]
+    assert "WS-17001" in texts[0]
+    assert server.response_cache.hits == 2
+    assert 'wbs_tool_calls_total{outcome="ok",tool="get_work_item"}' in exposition
@@ -0,0 +1,76 @@
+"""Tests for server metrics."""
+
+from pathlib import Path
+
+import pytest
+
+from wbs_mcp import server
+from wbs_mcp.data_loader import WorkItemsLoader
+from wbs_mcp.metrics import MetricsRegistry, metrics
+from wbs_mcp.response_cache import ResponseCache
+from wbs_mcp.yaml_writer import WorkItemWriter
+
+
+@pytest.fixture
+def work_path(tmp_path, monkeypatch):
+    """Server state over a copy of the fixture backlog, with fresh metrics."""
+    fixture = Path(__file__).parent / "fixtures" / "work-items.yaml"
+    path = tmp_path / "work-items.yaml"
+    path.write_bytes(fixture.read_bytes())
+    monkeypatch.setattr(server, "loader", WorkItemsLoader(path))
+    monkeypatch.setattr(server, "write_queue", None)
+    monkeypatch.setattr(server, "response_cache", ResponseCache())
+    monkeypatch.setenv("WBS_SYNC_OUTBOX", "0")
+    metrics.reset()
+    return path
+
+
+def test_prometheus_rendering():
+    """Test counters, labels and cumulative histogram buckets in text format."""
+    registry = MetricsRegistry()
+    registry.describe("calls_total", "Calls")
+    registry.inc("calls_total", tool='say "hi"')
+    registry.inc("calls_total", 2, tool='say "hi"')
+    registry.observe("latency_seconds", 0.003)
+    registry.observe("latency_seconds", 0.2)
+    registry.register_collector(lambda: [("items", {}, 42)])
+
+    text = registry.render_prometheus()
+    assert "# HELP calls_total Calls\n# TYPE calls_total counter\n" in text
+    assert 'calls_total{tool="say \\"hi\\""} 3' in text
+    assert "items 42" in text
+    assert 'latency_seconds_bucket{le="0.0025"} 0' in text
+    assert 'latency_seconds_bucket{le="0.005"} 1' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 2' in text
+    assert "latency_seconds_count 2" in text
+
+    histogram = registry.snapshot()["histograms"][0]
+    assert histogram["p50"] == 0.005 and histogram["p99"] == 0.25
+
+
+def test_tool_calls_record_load_cache_and_write_metrics(work_path):
+    """Test that dispatch records load phases, cache lookups and writes."""
+    server.dispatch_tool("get_work_item", {"wbs_id": "WS-17001"})
+    server.dispatch_tool("get_work_item", {"wbs_id": "WS-17001"})
+    server.dispatch_tool("update_work_item", {"wbs_id": "WS-17001", "updates": {"status": "Done"}})
+    with pytest.raises(ValueError):
+        WorkItemWriter(work_path).update_work_item("WS-99999", {"status": "Done"})
+
+    snapshot = metrics.snapshot()
+    counters = {(c["name"], tuple(c["labels"].values())): c["value"] for c in snapshot["counters"]}
+    assert counters[("wbs_response_cache_requests_total", ("hit", "get_work_item"))] == 1
+    assert counters[("wbs_response_cache_requests_total", ("miss", "get_work_item"))] == 1
+    assert counters[("wbs_loader_loads_total", ("parsed",))] == 1
+    assert counters[("wbs_writer_updates_total", ("ok",))] == 1
+    assert counters[("wbs_writer_updates_total", ("ValueError",))] == 1
+
+    phases = {h["labels"].get("phase") for h in snapshot["histograms"] if h["name"] == "wbs_loader_phase_seconds"}
+    assert phases == {"read", "parse", "validate", "index"}
+    gauges = {g["name"]: g["value"] for g in snapshot["gauges"]}
+    fixture = Path(__file__).parent / "fixtures" / "work-items.yaml"
+    assert gauges["wbs_snapshot_bytes"] == fixture.stat().st_size
+    assert gauges["wbs_response_cache_hits"] == 1
+
+    text = server.dispatch_tool("server_stats", {"prefix": "wbs_tool_handler"})[0].text
+    assert "wbs_tool_handler_seconds{tool=get_work_item} | 1 |" in text
+    assert "wbs_loader" not in text
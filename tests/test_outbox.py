@@ -0,0 +1,154 @@
+"""Tests for the durable GitHub sync outbox."""
+
+from pathlib import Path
+
+import pytest
+
+from wbs_mcp import server
+from wbs_mcp.data_loader import WorkItemsLoader
+from wbs_mcp.github_sync import GitHubProjectSync
+from wbs_mcp.outbox import OutboxWorker, SyncOutbox, has_unfinished_entries
+from wbs_mcp.tools.get_sync_status import format_sync_status, get_sync_status
+from wbs_mcp.tools.update_work_item import format_update_result, update_work_item
+
+FIELDS = {"data": {"organization": {"projectV2": {"id": "PVT_1", "fields": {
+    "pageInfo": {"hasNextPage": False, "endCursor": None},
+    "nodes": [
+        {"id": "F_status", "name": "Status", "dataType": "SINGLE_SELECT", "options": [
+            {"id": "O_todo", "name": "Todo"}, {"id": "O_done", "name": "Done"},
+        ]},
+    ],
+}}}}}
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    """Create an outbox in a temporary database."""
+    outbox = SyncOutbox(tmp_path / "outbox.sqlite3", max_attempts=2)
+    yield outbox
+    outbox.close()
+
+
+@pytest.fixture
+def project(server):
+    """Answer schema, item and mutation requests for issues 50 and 54."""
+    def respond(body):
+        query = body["query"]
+        if "mutation" in query:
+            return {"data": {"m0": {"projectV2Item": {"id": "x"}}}}
+        if "fields(" in query:
+            return FIELDS
+        return {"data": {"organization": {"projectV2": {"items": {
+            "pageInfo": {"hasNextPage": False, "endCursor": "c1"},
+            "nodes": [{"id": f"PVTI_{n}", "content": {"number": n}} for n in (50, 54)],
+        }}}}}
+    server.responses = [respond] * 20
+    return server
+
+
+def test_claim_and_complete(outbox):
+    """Test that claimed entries aren't claimed twice and can be completed."""
+    ticket = outbox.enqueue("WS-17001", 50, {"status": "Done"})
+
+    assert [e["id"] for e in outbox.claim_due()] == [ticket]
+    assert outbox.claim_due() == []
+
+    outbox.mark_done(ticket)
+    assert outbox.get(ticket)["status"] == "done"
+    assert outbox.counts() == {"pending": 0, "in_progress": 0, "done": 1, "failed": 0}
+
+
+def test_failures_retry_then_fail(outbox):
+    """Test that failed attempts are rescheduled until max_attempts."""
+    ticket = outbox.enqueue("WS-17001", 50, {"status": "Done"})
+    outbox.claim_due()
+
+    outbox.mark_failed(ticket, "timeout")
+    entry = outbox.get(ticket)
+    assert entry["status"] == "pending"
+    assert entry["attempts"] == 1
+    assert outbox.claim_due() == []  # backing off
+
+    outbox.mark_failed(ticket, "timeout again")
+    entry = outbox.get(ticket)
+    assert entry["status"] == "failed"
+    assert entry["last_error"] == "timeout again"
+
+
+def test_newer_entry_supersedes_pending_fields(outbox):
+    """Test that a newer push replaces unsent values for the same fields."""
+    first = outbox.enqueue("WS-17001", 50, {"status": "Done"})
+    second = outbox.enqueue("WS-17001", 50, {"status": "Todo", "priority": "🟢 Low"})
+
+    assert outbox.get(first)["status"] == "done"
+    assert outbox.get(first)["last_error"] == f"Superseded by #{second}"
+    assert [e["id"] for e in outbox.claim_due()] == [second]
+
+
+def test_worker_pushes_and_records_failures(project, client, outbox, monkeypatch):
+    """Test that one drain round pushes entries and keeps per-entry errors."""
+    def sequential(self, updates_by_issue):
+        raise AssertionError("the outbox pushes through sync_work_items_async")
+
+    monkeypatch.setattr(GitHubProjectSync, "sync_work_items", sequential)
+    ok = outbox.enqueue("WS-17001", 50, {"status": "Done"})
+    bad = outbox.enqueue("WS-17101", 54, {"status": "Someday"})
+
+    worker = OutboxWorker(outbox, sync_factory=lambda: GitHubProjectSync(client))
+    assert worker.drain_once() == 2
+
+    assert outbox.get(ok)["status"] == "done"
+    entry = outbox.get(bad)
+    assert entry["status"] == "pending"
+    assert "Invalid Status value 'Someday'" in entry["last_error"]
+
+    text = format_sync_status(get_sync_status(outbox))
+    assert "Pending: 1" in text and "Done: 1" in text
+
+
+def test_update_work_item_returns_ticket(tmp_path, outbox):
+    """Test that pushes are queued instead of run inline."""
+    fixture = Path(__file__).parent / "fixtures" / "work-items.yaml"
+    work_path = tmp_path / "work-items.yaml"
+    work_path.write_bytes(fixture.read_bytes())
+
+    result = update_work_item(
+        WorkItemsLoader(work_path), "WS-17001", {"status": "Done", "title": "Renamed"},
+        push_to_github=True, outbox=outbox,
+    )
+
+    entry = outbox.get(result["sync_ticket"])
+    assert entry["updates"] == {"status": "Done"}
+    assert "ticket" in format_update_result(result)
+
+
+def test_resume_starts_worker_only_for_unfinished_entries(loader, tmp_path, monkeypatch):
+    """Test that startup leaves the outbox alone unless a previous run left pushes."""
+    path = tmp_path / "outbox.sqlite3"
+    monkeypatch.setenv("WBS_OUTBOX_PATH", str(path))
+    monkeypatch.setattr(server, "loader", loader)
+    monkeypatch.setattr(server, "sync_outbox", None)
+    monkeypatch.setattr(server, "outbox_worker", None)
+
+    server.resume_outbox()
+    assert not path.exists()
+    assert server.sync_outbox is None and server.outbox_worker is None
+    assert "No GitHub pushes" in server.dispatch_tool("get_sync_status", {})[0].text
+    assert not path.exists()
+
+    previous = SyncOutbox(path)
+    ticket = previous.enqueue("WS-17001", 50, {"status": "Done"})
+    previous.mark_done(ticket)
+    assert not has_unfinished_entries(path)
+    previous.enqueue("WS-17001", 50, {"status": "Todo"})
+    previous.close()
+    assert has_unfinished_entries(path)
+
+    # Keep the started worker from pushing
+    monkeypatch.setattr(OutboxWorker, "drain_once", lambda self: 0)
+    server.resume_outbox()
+    try:
+        assert server.sync_outbox is not None and server.outbox_worker is not None
+    finally:
+        server.outbox_worker.stop()
+        server.sync_outbox.close()
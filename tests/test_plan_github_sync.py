@@ -0,0 +1,85 @@
+"""Tests for the minimal-diff GitHub sync planner."""
+
+import pytest
+
+from wbs_mcp.github_sync import GitHubProjectSync
+from wbs_mcp.tools.plan_github_sync import format_plan_result, plan_github_sync
+
+FIELDS = {"data": {"organization": {"projectV2": {"id": "PVT_1", "fields": {
+    "pageInfo": {"hasNextPage": False, "endCursor": None},
+    "nodes": [
+        {"id": "F_status", "name": "Status", "dataType": "SINGLE_SELECT", "options": [
+            {"id": "O_todo", "name": "Todo"}, {"id": "O_progress", "name": "In Progress"},
+            {"id": "O_done", "name": "Done"},
+        ]},
+        {"id": "F_priority", "name": "Priority", "dataType": "SINGLE_SELECT", "options": [
+            {"id": "O_critical", "name": "🔴 Critical"},
+        ]},
+    ],
+}}}}}
+
+# Current GitHub values; issue 55 is not in the project
+CURRENT = {
+    "PVTI_50": {"Status": "Todo", "Priority": "🔴 Critical"},
+    "PVTI_54": {"Status": "Done", "Priority": "🔴 Critical"},
+}
+
+WBS_IDS = ["WS-17001", "WS-17101", "WS-17102"]
+
+
+@pytest.fixture
+def project(server):
+    """Answer schema, item, field value and mutation requests."""
+    def respond(body):
+        query = body["query"]
+        if "mutation" in query:
+            return {"data": {"m0": {"projectV2Item": {"id": "PVTI_50"}}}}
+        if "fields(" in query:
+            return FIELDS
+        if "nodes(ids" in query:
+            return {"data": {"nodes": [
+                {"id": item_id, "fieldValues": {"nodes": [
+                    {"name": value, "field": {"name": field}}
+                    for field, value in CURRENT[item_id].items()
+                ]}}
+                for item_id in body["variables"]["ids"]
+            ]}}
+        return {"data": {"organization": {"projectV2": {"items": {
+            "pageInfo": {"hasNextPage": False, "endCursor": "c1"},
+            "nodes": [{"id": f"PVTI_{n}", "content": {"number": n}} for n in (50, 54)],
+        }}}}}
+    server.responses = [respond] * 20
+    return server
+
+
+def test_plan_lists_only_differing_fields(project, client, loader):
+    """Test that the dry run reports just the fields GitHub needs."""
+    result = plan_github_sync(loader, WBS_IDS, sync=GitHubProjectSync(client))
+
+    assert result["success"]
+    assert [(c["wbs_id"], c["yaml_field"], c["current"], c["desired"]) for c in result["changes"]] == [
+        ("WS-17001", "status", "Todo", "In Progress"),
+    ]
+    assert result["not_in_project"] == ["WS-17102"]
+    assert not any("mutation" in r["body"]["query"] for r in project.requests)
+    assert "Dry run" in format_plan_result(result)
+
+
+def test_plan_execute_pushes_only_changes(project, client, loader):
+    """Test that executing sends one mutation for the one differing field."""
+    result = plan_github_sync(loader, WBS_IDS, execute=True, sync=GitHubProjectSync(client))
+
+    assert result["changes"][0]["pushed"] is True
+    mutations = [r["body"] for r in project.requests if "mutation" in r["body"]["query"]]
+    assert len(mutations) == 1
+    assert mutations[0]["query"].count("updateProjectV2ItemFieldValue") == 1
+    assert mutations[0]["variables"]["value0"] == {"singleSelectOptionId": "O_progress"}
+    assert "Pushed 1 of 1" in format_plan_result(result)
+
+
+def test_plan_unknown_wbs_id(loader):
+    """Test that unknown work items are rejected before any request."""
+    result = plan_github_sync(loader, ["WS-00000"], sync=object())
+
+    assert not result["success"]
+    assert "WS-00000" in result["error"]
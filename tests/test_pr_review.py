@@ -0,0 +1,135 @@
+"""Tests for PR review thread tools."""
+
+import pytest
+
+from wbs_mcp import graphql_client
+from wbs_mcp.tools import pr_review_read
+from wbs_mcp.tools.pr_review_read import format_review_threads, list_pr_review_threads
+from wbs_mcp.tools.pr_review_write import (
+    address_review_threads,
+    format_address_result,
+    resolve_review_thread,
+)
+
+
+@pytest.fixture(autouse=True)
+def repo(client, monkeypatch):
+    """Point the tools at the stand-in server and a fixed repository."""
+    monkeypatch.setattr(graphql_client, "_client", client)
+    monkeypatch.setattr(pr_review_read, "read_git_context", lambda: {
+        "owner": "acme", "repo": "widgets", "branch": "feature", "head": "abc",
+    })
+
+
+def thread(n, path, author="alice", resolved=False, comments=1):
+    """Review thread node as returned by the API."""
+    return {"id": f"T_{n}", "isResolved": resolved, "comments": {"totalCount": comments, "nodes": [{
+        "author": {"login": author}, "body": f"Comment {n}", "path": path,
+        "line": n, "createdAt": "2026-01-05T10:00:00Z",
+    }]}}
+
+
+def page(nodes, cursor=None, updated_at="2026-01-05T10:00:00Z"):
+    """Pull request response with one page of threads."""
+    return {"data": {"repository": {"pullRequest": {
+        "number": 7, "updatedAt": updated_at, "reviewThreads": {
+            "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor}, "nodes": nodes,
+        },
+    }}}}
+
+
+def updated(updated_at):
+    """Validator response."""
+    return {"data": {"repository": {"pullRequest": {"updatedAt": updated_at}}}}
+
+
+def test_pages_through_all_threads(server):
+    """Test that every thread page is fetched and comments are counted."""
+    server.responses = [
+        page([thread(1, "a.py", comments=14), thread(2, "b.py", resolved=True)], cursor="c1"),
+        page([thread(3, "c.py")]),
+    ]
+
+    result = list_pr_review_threads(7)
+
+    assert [t["thread_id"] for t in result["unresolved_threads"]] == ["T_1", "T_3"]
+    assert result["unresolved_threads"][0]["comment_count"] == 14
+    assert server.requests[1]["body"]["variables"]["cursor"] == "c1"
+    assert "Comments: 14" in format_review_threads(result)
+
+
+def test_cache_validated_by_updated_at(server):
+    """Test that unchanged PRs are served from the cache and writes invalidate it."""
+    server.responses = [
+        page([thread(1, "a.py")]),
+        updated("2026-01-05T10:00:00Z"),
+        updated("2026-01-06T09:00:00Z"),
+        page([thread(1, "a.py"), thread(2, "b.py")], updated_at="2026-01-06T09:00:00Z"),
+        {"data": {"resolveReviewThread": {"thread": {"isResolved": True}}}},
+        page([thread(2, "b.py")], updated_at="2026-01-06T09:00:00Z"),
+    ]
+
+    assert list_pr_review_threads(7)["cached"] is False
+    assert list_pr_review_threads(7)["cached"] is True
+    assert list_pr_review_threads(7)["total_unresolved"] == 2
+
+    assert resolve_review_thread("T_1")["success"]
+    result = list_pr_review_threads(7)
+    assert result["cached"] is False
+    assert result["total_unresolved"] == 1
+    assert len(server.requests) == 6
+
+
+def test_path_and_author_filters(server):
+    """Test filtering by file glob and thread author."""
+    server.responses = [
+        page([
+            thread(1, "wbs_mcp/server.py", author="Alice"),
+            thread(2, "wbs_mcp/tools/outbox.py", author="bob"),
+            thread(3, "docs/TOOLS.md", author="alice"),
+        ]),
+    ]
+
+    result = list_pr_review_threads(7, path="wbs_mcp/*", author="alice")
+
+    assert [t["thread_id"] for t in result["unresolved_threads"]] == ["T_1"]
+    assert "matching path=wbs_mcp/*, author=alice" in format_review_threads(result)
+    # Filters are applied to the cached threads, not refetched
+    server.responses = [updated("2026-01-05T10:00:00Z")]
+    assert list_pr_review_threads(7, author="bob")["unresolved_threads"][0]["thread_id"] == "T_2"
+
+
+def test_address_threads_in_batches(server, monkeypatch):
+    """Test bulk replies and resolves, skipping resolve after a failed reply."""
+    monkeypatch.setattr("wbs_mcp.tools.pr_review_write.MAX_THREAD_MUTATIONS_PER_REQUEST", 2)
+    server.responses = [
+        {"data": {"r0": {"comment": {"id": "C_1"}}, "r1": None},
+         "errors": [{"path": ["r1"], "message": "Could not resolve to a node"}]},
+        {"data": {"r0": {"comment": {"id": "C_3"}}}},
+        {"data": {"s0": {"thread": {"isResolved": True}}, "s1": {"thread": {"isResolved": True}}}},
+        {"data": {"s0": {"thread": {"isResolved": True}}}},
+    ]
+
+    result = address_review_threads([
+        {"thread_id": "T_1", "body": "Fixed"},
+        {"thread_id": "T_2", "body": "Fixed"},
+        {"thread_id": "T_3", "body": "Will follow up", "resolve": False},
+        {"thread_id": "T_4"},
+        {"thread_id": "T_5"},
+    ])
+
+    assert result["requests"] == 4
+    assert (result["replied"], result["resolved"], result["failed"]) == (2, 3, 1)
+    outcomes = {o["thread_id"]: o for o in result["threads"]}
+    assert outcomes["T_1"] == {"thread_id": "T_1", "replied": True, "comment_id": "C_1",
+                               "resolved": True, "error": None}
+    assert outcomes["T_2"]["resolved"] is None
+    assert outcomes["T_3"]["resolved"] is None
+    assert server.requests[2]["body"]["variables"] == {"t0": "T_1", "t1": "T_4"}
+    assert "T_2: Could not resolve to a node" in format_address_result(result)
+
+
+def test_address_threads_validates_entries():
+    """Test that entries without anything to do are rejected before any request."""
+    result = address_review_threads([{"thread_id": "T_1", "resolve": False}])
+    assert not result["success"]
@@ -0,0 +1,147 @@
+"""Tests for on-demand tool call profiling."""
+
+import pstats
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from wbs_mcp import profiling, server
+from wbs_mcp.data_loader import WorkItemsLoader
+from wbs_mcp.profiling import PROFILE_ARGUMENT
+from wbs_mcp.response_cache import ResponseCache
+from wbs_mcp.tool_registry import ToolRegistry
+
+
+def snapshot():
+    """Stand-in backlog content hash."""
+    return "0123456789abcdef"
+
+
+@pytest.fixture
+def profile_dir(tmp_path, monkeypatch):
+    """Server state over the fixture backlog, profiles going to a temp dir."""
+    fixture = Path(__file__).parent / "fixtures" / "work-items.yaml"
+    monkeypatch.setattr(server, "loader", WorkItemsLoader(fixture))
+    monkeypatch.setattr(server, "write_queue", None)
+    monkeypatch.setattr(server, "response_cache", ResponseCache())
+    monkeypatch.setenv("WBS_PROFILE_DIR", str(tmp_path / "profiles"))
+    return tmp_path / "profiles"
+
+
+def test_profile_argument_writes_tagged_artifacts(profile_dir):
+    """Test that a profiled call bypasses the cache and writes both artifacts."""
+    plain = server.dispatch_tool("get_hierarchy", {})
+    assert not profile_dir.exists()
+
+    profiled = server.dispatch_tool("get_hierarchy", {"profile": True})
+    assert profiled[0].text == plain[0].text
+    assert profiled[-1].text.startswith("🔬 Profile:")
+    assert server.response_cache.hits == 0
+
+    [stats_file] = profile_dir.glob("*.pstats")
+    assert stats_file.name.startswith("get_hierarchy-")
+    assert f"-{server.loader.content_hash[:12]}-" in stats_file.name
+    functions = {name for _, _, name in pstats.Stats(str(stats_file)).stats}
+    assert "build_hierarchy" in functions
+
+    collapsed = stats_file.with_name(stats_file.name.replace(".pstats", ".collapsed.txt"))
+    for line in collapsed.read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack.startswith("<lambda>") and int(count) > 0
+
+
+def test_profile_env_selects_tools(profile_dir, monkeypatch):
+    """Test that WBS_PROFILE profiles every call of the listed tools only."""
+    monkeypatch.setattr(profiling, "PROFILE_TOOLS", frozenset({"validate_sync"}))
+    server.dispatch_tool("validate_sync", {})
+    server.dispatch_tool("find_orphans", {})
+
+    names = sorted(p.name.split("-")[0] for p in profile_dir.glob("*.pstats"))
+    assert names == ["validate_sync"]
+
+
+def test_profile_argument_in_schemas():
+    """Test that common properties are added to every tool's schema."""
+    registry = ToolRegistry(PROFILE_ARGUMENT)
+    registry.tool("a", "A", {"type": "object", "properties": {"x": {"type": "string"}}})(lambda loader, args: [])
+    [tool] = registry.list_tools()
+    assert set(tool.inputSchema["properties"]) == {"x", "profile"}
+
+
+def test_sampled_stacks_are_collapsed(tmp_path, monkeypatch):
+    """Test that the sampler records stacks below the profiled call."""
+    monkeypatch.setenv("WBS_PROFILE_DIR", str(tmp_path))
+
+    def busy():
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+        return "done"
+
+    result, base = profiling.profile_call("t", {"a": 1}, busy, snapshot)
+    assert result == "done"
+    top = base.with_name(base.name + ".collapsed.txt").read_text().splitlines()[0]
+    assert top.startswith("busy (test_profiling.py:")
+
+
+def test_concurrent_calls_fall_back_to_sampler(tmp_path, monkeypatch):
+    """Test that a call profiled while another is under cProfile gets stacks only."""
+    monkeypatch.setenv("WBS_PROFILE_DIR", str(tmp_path))
+    inside, release = threading.Event(), threading.Event()
+
+    def first():
+        inside.set()
+        release.wait(5)
+        return "first"
+
+    bases = []
+    worker = threading.Thread(target=lambda: bases.append(profiling.profile_call("a", {}, first, snapshot)[1]))
+    worker.start()
+    assert inside.wait(5)
+    try:
+        result, base = profiling.profile_call("b", {}, lambda: "second", snapshot)
+    finally:
+        release.set()
+        worker.join()
+
+    assert result == "second"
+    assert not base.with_name(base.name + ".pstats").exists()
+    assert base.with_name(base.name + ".collapsed.txt").exists()
+    [first_base] = bases
+    assert first_base.with_name(first_base.name + ".pstats").exists()
+
+    # The lock is released again for the next call
+    _, base = profiling.profile_call("c", {}, lambda: None, snapshot)
+    assert base.with_name(base.name + ".pstats").exists()
+
+
+def test_active_profiler_falls_back_to_sampler(tmp_path, monkeypatch):
+    """Test that cProfile refusing to start (another tool active) isn't an error."""
+    import cProfile
+
+    monkeypatch.setenv("WBS_PROFILE_DIR", str(tmp_path))
+
+    class Busy(cProfile.Profile):
+        def enable(self, *args, **kwargs):
+            raise ValueError("Another profiling tool is already active")
+
+    monkeypatch.setattr(cProfile, "Profile", Busy)
+    result, base = profiling.profile_call("t", {}, lambda: "ok", snapshot)
+    assert result == "ok"
+    assert not base.with_name(base.name + ".pstats").exists()
+    assert not profiling._cprofile_lock.locked()
+
+
+def test_sampler_stops_when_func_raises(tmp_path, monkeypatch):
+    """Test that a failing call still stops the sampler and releases cProfile."""
+    monkeypatch.setenv("WBS_PROFILE_DIR", str(tmp_path))
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        profiling.profile_call("t", {}, fail, snapshot)
+    assert not any(t.name == "wbs-profile-sampler" for t in threading.enumerate())
+    assert not profiling._cprofile_lock.locked()
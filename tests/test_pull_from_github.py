@@ -0,0 +1,85 @@
+"""Tests for incremental pull sync from GitHub Projects."""
+
+from wbs_mcp.data_loader import WorkItemsLoader
+from wbs_mcp.github_sync import GitHubProjectSync
+from wbs_mcp.tools.pull_from_github import format_pull_result, pull_from_github
+from wbs_mcp.yaml_writer import WorkItemWriter
+
+TIMESTAMPS = {
+    50: "2026-02-01T10:00:00Z",
+    55: "2026-02-01T11:00:00Z",
+    60: "2026-02-01T12:00:00Z",
+    999: "2026-02-01T13:00:00Z",
+}
+
+VALUES = {
+    "PVTI_50": {"Status": "Done", "Priority": "🔴 Critical"},
+    "PVTI_55": {"Status": "In Progress", "Priority": "🟡 Medium"},
+    "PVTI_60": {"Status": "In Progress", "Priority": "🟢 Low"},
+}
+
+
+def route(server):
+    """Answer item listings and field value lookups from the tables above."""
+    def respond(body):
+        if "nodes(ids" in body["query"]:
+            return {"data": {"nodes": [
+                {"id": item_id, "fieldValues": {"nodes": [
+                    {"name": value, "field": {"name": field}} for field, value in VALUES[item_id].items()
+                ] + [{}]}}
+                for item_id in body["variables"]["ids"]
+            ]}}
+        return {"data": {"organization": {"projectV2": {"items": {
+            "pageInfo": {"hasNextPage": False, "endCursor": "c1"},
+            "nodes": [
+                {"id": f"PVTI_{n}", "updatedAt": updated, "content": {"number": n}}
+                for n, updated in TIMESTAMPS.items()
+            ],
+        }}}}}
+    server.responses = [respond] * 10
+
+
+def test_pull_applies_changes_and_watermarks(server, client, loader):
+    """Test that changed fields are pulled and watermarks stop refetching."""
+    WorkItemWriter(loader.yaml_path).update_work_item("WS-18001", {"allow_yaml_override": True})
+    route(server)
+    sync = GitHubProjectSync(client)
+
+    result = pull_from_github(loader, sync=sync)
+
+    assert result["success"]
+    assert result["checked"] == 3
+    assert result["untracked"] == 1
+    assert result["changes"] == [{
+        "wbs_id": "WS-17001", "issue_number": 50, "field": "status",
+        "old": "In Progress", "new": "Done",
+    }]
+    assert result["overridden"] == ["WS-18001"]
+
+    fresh = WorkItemsLoader(loader.yaml_path)
+    epic = fresh.get_by_wbs_id("WS-17001")
+    assert epic.status == "Done"
+    assert epic.github_updated_at == "2026-02-01T10:00:00Z"
+    assert epic.last_synced_at is not None
+    assert fresh.get_by_wbs_id("WS-18001").status == "Todo"
+    assert loader.get_by_wbs_id("WS-17001").status == "Done"
+
+    # Nothing changed on GitHub since: no field values are fetched
+    server.requests.clear()
+    result = pull_from_github(loader, sync=sync)
+    assert result["checked"] == 0
+    assert not any("nodes(ids" in r["body"]["query"] for r in server.requests)
+
+
+def test_pull_dry_run_leaves_file_unchanged(server, client, loader):
+    """Test that a dry run reports changes without writing."""
+    route(server)
+    before = loader.yaml_path.read_bytes()
+
+    result = pull_from_github(loader, dry_run=True, sync=GitHubProjectSync(client))
+
+    assert [(c["wbs_id"], c["field"]) for c in result["changes"]] == [
+        ("WS-17001", "status"), ("WS-18001", "status"),
+    ]
+    assert loader.yaml_path.read_bytes() == before
+    assert "Dry run" in format_pull_result(result)
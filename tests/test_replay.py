@@ -0,0 +1,128 @@
+"""Tests for record/replay GitHub transports."""
+
+import json
+import time
+
+import pytest
+
+from wbs_mcp import github_sync, graphql_client
+from wbs_mcp.github_sync import GitHubProjectSync
+from wbs_mcp.graphql_client import GraphQLClient, GraphQLError
+from wbs_mcp.replay import RecordingTransport, ReplayTransport
+from wbs_mcp.tools import pr_review_read
+
+FIELDS = {"data": {"organization": {"projectV2": {"id": "PVT_1", "fields": {
+    "pageInfo": {"hasNextPage": False, "endCursor": None},
+    "nodes": [{"id": "F_status", "name": "Status", "dataType": "SINGLE_SELECT", "options": [
+        {"id": "O_done", "name": "Done"},
+    ]}],
+}}}}}
+
+ITEMS = {"data": {"organization": {"projectV2": {"items": {
+    "pageInfo": {"hasNextPage": False, "endCursor": "c1"},
+    "nodes": [{"id": "PVTI_10", "content": {"number": 10}}],
+}}}}}
+
+
+def sync_status(client):
+    """Push one status update, starting with empty in-memory caches."""
+    github_sync._project_schemas.clear()
+    github_sync._item_indexes.clear()
+    return GitHubProjectSync(client).sync_work_item(10, {"status": "Done"})
+
+
+def test_record_then_replay_offline(server, client, tmp_path, monkeypatch):
+    """Test that a recorded sync replays identically without the server."""
+    fixture = tmp_path / "github.jsonl"
+    server.responses = [
+        ITEMS,
+        FIELDS,
+        (200, {"X-RateLimit-Remaining": "4999"}, {"data": {"m0": {"projectV2Item": {"id": "x"}}}}),
+    ]
+    client.transport = RecordingTransport(client.transport, fixture)
+
+    assert sync_status(client) == {"status": True}
+    lines = [json.loads(line) for line in fixture.read_text().splitlines()]
+    assert len(lines) == 3
+    assert lines[2]["headers"] == {"x-ratelimit-remaining": "4999"}
+    assert "authorization" not in json.dumps(lines).lower()
+
+    # Disk caches would hide the replayed requests
+    monkeypatch.setenv("WBS_CACHE_DIR", str(tmp_path / "other-cache"))
+    replay_client = GraphQLClient("unused", transport=ReplayTransport(fixture))
+    assert sync_status(replay_client) == {"status": True}
+    assert replay_client.rate_limit["remaining"] == 4999
+    assert len(server.requests) == 3
+
+
+def test_non_json_response_recorded_as_text(tmp_path):
+    """Test that a proxy error page passes through and replays as recorded."""
+    class BadGateway:
+        def post(self, payload):
+            return 502, {}, b"<html>502 Bad Gateway</html>"
+
+        def close(self):
+            pass
+
+    fixture = tmp_path / "github.jsonl"
+    client = GraphQLClient("unused", transport=RecordingTransport(BadGateway(), fixture))
+    with pytest.raises(GraphQLError, match="HTTP 502"):
+        client.execute("query { viewer { login } }")
+    [line] = [json.loads(line) for line in fixture.read_text().splitlines()]
+    assert line["response_text"] == "<html>502 Bad Gateway</html>"
+
+    replay = ReplayTransport(fixture)
+    assert replay.post(json.dumps({"query": "query { viewer { login } }"}).encode("utf-8")) == (
+        502, {}, b"<html>502 Bad Gateway</html>",
+    )
+
+
+def test_replay_unmatched_request_and_latency(tmp_path):
+    """Test that unknown requests fail and fixed latency is applied."""
+    fixture = tmp_path / "github.jsonl"
+    fixture.write_text(json.dumps({
+        "request": {"query": "query {\n  viewer { login }\n}", "variables": {}},
+        "status": 200, "headers": {}, "response": {"data": {"viewer": {"login": "octocat"}}},
+        "elapsed": 0.5,
+    }) + "\n")
+    client = GraphQLClient("unused", transport=ReplayTransport(fixture, latency=0.05))
+
+    start = time.monotonic()
+    # Whitespace differences don't matter
+    assert client.execute("query { viewer { login } }")["data"]["viewer"]["login"] == "octocat"
+    assert 0.05 <= time.monotonic() - start < 0.4
+
+    with pytest.raises(GraphQLError, match="No recorded response"):
+        client.execute("query { rateLimit { remaining } }")
+
+
+def test_pr_review_threads_from_replay(server, client, tmp_path, monkeypatch):
+    """Test that a recorded PR review session replays through the tool."""
+    fixture = tmp_path / "pr.jsonl"
+    thread = {"id": "T_1", "isResolved": False, "comments": {"totalCount": 1, "nodes": [{
+        "author": {"login": "reviewer"}, "body": "Rename this", "path": "a.py",
+        "line": 3, "createdAt": "2026-01-05T10:00:00Z",
+    }]}}
+    server.responses = [
+        {"data": {"repository": {"pullRequest": {
+            "number": 7, "updatedAt": "2026-01-05T10:00:00Z", "reviewThreads": {
+                "pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": [thread],
+            },
+        }}}},
+    ]
+    monkeypatch.setattr(pr_review_read, "read_git_context", lambda: {
+        "owner": "o", "repo": "r", "branch": "feature", "head": "abc",
+    })
+    client.transport = RecordingTransport(client.transport, fixture)
+    monkeypatch.setattr(graphql_client, "_client", client)
+    recorded = pr_review_read.list_pr_review_threads(7)
+
+    monkeypatch.setenv("WBS_GITHUB_TRANSPORT", "replay")
+    monkeypatch.setenv("WBS_GITHUB_FIXTURES", str(fixture))
+    monkeypatch.setattr(graphql_client, "_client", None)
+    pr_review_read.invalidate_thread_cache()
+    replayed = pr_review_read.list_pr_review_threads(7)
+
+    assert replayed == recorded
+    assert replayed["unresolved_threads"][0]["thread_id"] == "T_1"
+    assert len(server.requests) == 1
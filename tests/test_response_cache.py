@@ -0,0 +1,58 @@
+"""Tests for the tool response cache."""
+
+from pathlib import Path
+
+from mcp.types import TextContent
+
+from wbs_mcp import server
+from wbs_mcp.data_loader import WorkItemsLoader
+from wbs_mcp.response_cache import ResponseCache
+
+
+def text(size):
+    """Response with a body of the given size."""
+    return [TextContent(type="text", text="x" * size)]
+
+
+def test_lru_eviction_by_bytes():
+    """Test that least recently used entries are evicted to fit the budget."""
+    cache = ResponseCache(max_bytes=100)
+    a, b, c = (cache.make_key(name, {}, 1) for name in "abc")
+    cache.put(a, text(40))
+    cache.put(b, text(40))
+    cache.get(a)
+    cache.put(c, text(40))
+
+    assert cache.get(b) is None
+    assert cache.get(a) is not None and cache.get(c) is not None
+    assert cache.size == 80
+
+    cache.put(cache.make_key("huge", {}, 1), text(101))
+    assert len(cache) == 2
+
+
+def test_key_normalizes_arguments():
+    """Test that argument order and None values don't change the key."""
+    assert (ResponseCache.make_key("t", {"a": 1, "b": None, "c": 2}, 3)
+            == ResponseCache.make_key("t", {"c": 2, "a": 1}, 3))
+    assert ResponseCache.make_key("t", {}, 3) != ResponseCache.make_key("t", {}, 4)
+
+
+def test_dispatch_caches_until_write(tmp_path, monkeypatch):
+    """Test that read tools hit the cache until a write changes the snapshot."""
+    fixture = Path(__file__).parent / "fixtures" / "work-items.yaml"
+    work_path = tmp_path / "work-items.yaml"
+    work_path.write_bytes(fixture.read_bytes())
+    monkeypatch.setattr(server, "loader", WorkItemsLoader(work_path))
+    monkeypatch.setattr(server, "write_queue", None)
+    monkeypatch.setattr(server, "response_cache", ResponseCache())
+    monkeypatch.setenv("WBS_SYNC_OUTBOX", "0")
+
+    first = server.dispatch_tool("get_work_item", {"wbs_id": "WS-17001"})
+    assert server.dispatch_tool("get_work_item", {"wbs_id": "WS-17001"}) is first
+    assert server.response_cache.hits == 1
+
+    server.dispatch_tool("update_work_item", {"wbs_id": "WS-17001", "updates": {"status": "Done"}})
+    assert len(server.response_cache) == 0
+    after = server.dispatch_tool("get_work_item", {"wbs_id": "WS-17001"})
+    assert "**Status**: Done" in after[0].text
@@ -0,0 +1,42 @@
+"""Tests for the synthetic backlog generator."""
+
+from collections import Counter
+
+from wbs_mcp.data_loader import WorkItemsLoader
+from wbs_mcp.synthetic import BacklogSpec, generate_items, write_backlog
+from wbs_mcp.tools import build_hierarchy, validate_work_items
+
+
+def test_generated_backlog_loads_and_validates(tmp_path):
+    """Test that the written file parses into a valid tree of the requested size."""
+    path = tmp_path / "work-items.yaml"
+    spec = BacklogSpec(items=150, seed=3, depth=4, fan_out=3)
+    assert write_backlog(path, spec) == 150
+
+    items = WorkItemsLoader(path).load()
+    assert len(items) == 150
+    assert validate_work_items(items).is_valid
+    assert {item.wbs_type for item in items} == {"Epic", "Feature", "Task"}
+    assert max(item.wbs_id.count("-") for item in items) == 4
+    # The repo's priority vocabulary (models.WorkItem.priority)
+    assert {item.priority for item in items} == {"🚨 Critical", "🔥 High", "🟡 Medium", "🟢 Low"}
+
+    roots = build_hierarchy(items)
+    assert sum(1 for item in items if item.wbs_type == "Epic") == len(roots)
+
+    # Same seed, same backlog
+    again = tmp_path / "again.yaml"
+    write_backlog(again, spec)
+    assert again.read_bytes() == path.read_bytes()
+
+
+def test_milestone_skew_and_description_sizes():
+    """Test that milestone popularity follows the skew and descriptions their bounds."""
+    items = list(generate_items(BacklogSpec(
+        items=2000, milestones=4, milestone_skew=2.0, unassigned_ratio=0.0, description_words=(3, 4),
+    )))
+    counts = Counter(item["milestone"] for item in items)
+    ranked = [counts[m] for m in sorted(counts)]
+    # Children mostly inherit their parent's milestone, so only the ends are reliable
+    assert ranked[0] == max(ranked) and ranked[0] > 4 * ranked[-1]
+    assert all(3 <= len(item["description"].split()) <= 4 for item in items)
@@ -0,0 +1,42 @@
+"""Tests for the tool registry and lazy tool imports."""
+
+import subprocess
+import sys
+
+import pytest
+
+from wbs_mcp import server
+from wbs_mcp.tool_registry import ToolRegistry
+
+
+def test_list_tools_is_built_once():
+    """Test that the schema list is cached and follows registration order."""
+    tools = server.registry.list_tools()
+
+    assert server.registry.list_tools() is tools
+    assert tools[0].name == "list_work_items"
+    assert {"get_hierarchy", "update_work_item", "address_review_threads"} <= {t.name for t in tools}
+    assert server.registry.get("get_hierarchy").cacheable
+    assert server.registry.get("update_work_item").writes
+
+
+def test_duplicate_and_unknown_tools():
+    """Test that names are unique and unknown tools are reported."""
+    registry = ToolRegistry()
+    registry.tool("a", "A", {"type": "object"})(lambda loader, args: [])
+    with pytest.raises(ValueError, match="already registered"):
+        registry.tool("a", "A again", {"type": "object"})(lambda loader, args: [])
+
+    assert server.dispatch_tool("no_such_tool", {})[0].text == "Unknown tool: no_such_tool"
+
+
+def test_heavy_modules_not_imported_at_startup():
+    """Test that importing the server leaves tool, GitHub and writer modules unloaded."""
+    code = (
+        "import sys, wbs_mcp.server; "
+        "print(','.join(m for m in ('ruamel.yaml', 'sqlite3', 'wbs_mcp.github_sync', "
+        "'wbs_mcp.yaml_writer', 'wbs_mcp.outbox', 'wbs_mcp.tools.get_hierarchy', "
+        "'wbs_mcp.tools.pr_review_read') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
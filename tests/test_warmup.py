@@ -0,0 +1,51 @@
+"""Tests for the startup warm-up."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from wbs_mcp import data_loader, server
+from wbs_mcp.data_loader import WorkItemsLoader
+from wbs_mcp.executor import get_executor
+from wbs_mcp.response_cache import ResponseCache
+
+
+@pytest.fixture
+def slow_loader(tmp_path, monkeypatch):
+    """Server loader whose YAML parse blocks until released, counting parses."""
+    fixture = Path(__file__).parent / "fixtures" / "work-items.yaml"
+    work_path = tmp_path / "work-items.yaml"
+    work_path.write_bytes(fixture.read_bytes())
+    monkeypatch.setattr(server, "loader", WorkItemsLoader(work_path))
+    monkeypatch.setattr(server, "write_queue", None)
+    monkeypatch.setattr(server, "response_cache", ResponseCache())
+
+    release = threading.Event()
+    parses = []
+    real_safe_load = data_loader.yaml.safe_load
+
+    def slow_safe_load(text):
+        parses.append(1)
+        release.wait(5)
+        return real_safe_load(text)
+
+    monkeypatch.setattr(data_loader.yaml, "safe_load", slow_safe_load)
+    return release, parses
+
+
+async def test_first_request_awaits_warm_up(slow_loader, monkeypatch):
+    """Test that a request during warm-up reuses its parse and cached renders."""
+    release, parses = slow_loader
+    monkeypatch.setenv("WBS_PREWARM_TOOLS", "validate_sync, get_hierarchy, update_work_item")
+    monkeypatch.setattr(server, "warmup", get_executor().submit(server.warm_up))
+
+    threading.Timer(0.2, release.set).start()
+    result = await server.call_tool("get_work_item", {"wbs_id": "WS-17001"})
+
+    assert "WS-17001" in result[0].text
+    assert len(parses) == 1
+    assert len(server.response_cache) == 3  # two warmed tools plus this call
+
+    await server.call_tool("validate_sync", {})
+    assert server.response_cache.hits == 1
@@ -0,0 +1,103 @@
+"""Tests for the write-behind queue."""
+
+import time
+
+import pytest
+
+from wbs_mcp.data_loader import WorkItemsLoader
+from wbs_mcp.write_queue import WriteQueue
+
+
+def test_queued_updates_visible_before_flush(loader):
+    """Test that reads see queued updates and disk catches up on flush."""
+    queue = WriteQueue(loader, debounce_seconds=60)
+    original = loader.yaml_path.read_bytes()
+    
+    queue.enqueue("WS-17102", {"status": "Done"})
+    queue.enqueue("WS-17102", {"assignees": ["alice"]})
+    
+    item = loader.get_by_wbs_id("WS-17102")
+    assert item.status == "Done"
+    assert item.assignees == ["alice"]
+    assert loader.yaml_path.read_bytes() == original
+    
+    assert queue.flush() == {"flushed": ["WS-17102"]}
+    assert queue.pending_count == 0
+    
+    fresh = WorkItemsLoader(loader.yaml_path).get_by_wbs_id("WS-17102")
+    assert fresh.status == "Done"
+    assert fresh.assignees == ["alice"]
+    assert not loader._needs_reload()
+
+
+def test_debounced_and_threshold_flush(loader):
+    """Test automatic flushing after the debounce period or size threshold."""
+    queue = WriteQueue(loader, debounce_seconds=0.05, max_pending=2)
+    
+    queue.enqueue("WS-17101", {"priority": "🟢 Low"})
+    time.sleep(0.3)
+    assert queue.pending_count == 0
+    assert WorkItemsLoader(loader.yaml_path).get_by_wbs_id("WS-17101").priority == "🟢 Low"
+    
+    queue.debounce_seconds = 60
+    queue.enqueue("WS-17101", {"status": "Blocked"})
+    queue.enqueue("WS-18001", {"status": "Done"})
+    assert queue.pending_count == 0
+    assert WorkItemsLoader(loader.yaml_path).get_by_wbs_id("WS-18001").status == "Done"
+
+
+def test_enqueue_rejects_invalid_updates(loader):
+    """Test that invalid updates fail at enqueue time."""
+    queue = WriteQueue(loader, debounce_seconds=60)
+    
+    with pytest.raises(ValueError, match="Invalid fields"):
+        queue.enqueue("WS-17101", {"wbs_id": "X"})
+    with pytest.raises(ValueError, match="Work item not found"):
+        queue.enqueue("WS-MISSING", {"status": "Done"})
+    assert queue.pending_count == 0
+
+
+def test_failed_debounced_flush_is_retried(loader, monkeypatch):
+    """Test that a failed automatic flush schedules a retry with backoff."""
+    queue = WriteQueue(loader, debounce_seconds=0.02)
+    real_update = queue.writer.update_work_items
+    attempts = []
+    
+    def flaky_update(batch):
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise TimeoutError("lock busy")
+        return real_update(batch)
+    
+    monkeypatch.setattr(queue.writer, "update_work_items", flaky_update)
+    queue.enqueue("WS-17101", {"status": "Blocked"})
+    
+    deadline = time.monotonic() + 2
+    while len(attempts) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # Wait for the retry to finish writing
+    assert queue.flush() == {"flushed": []}
+    assert len(attempts) == 2
+    assert attempts[1] - attempts[0] >= 0.04
+    assert WorkItemsLoader(loader.yaml_path).get_by_wbs_id("WS-17101").status == "Blocked"
+
+
+def test_checked_update_after_queued_writes(loader):
+    """Test that flushing the queue doesn't invalidate the caller's expected_hash."""
+    from wbs_mcp.tools.update_work_item import update_work_item
+    
+    queue = WriteQueue(loader, debounce_seconds=60)
+    queue.enqueue("WS-17102", {"status": "Done"})
+    snapshot = loader.content_hash[:16]
+    
+    for on_conflict in ("reject", "merge"):
+        result = update_work_item(
+            loader, "WS-17101", {"priority": "🟢 Low"},
+            expected_hash=snapshot, on_conflict=on_conflict, write_queue=queue,
+        )
+        assert result["success"], result
+        snapshot = result["content_hash"][:16]
+    
+    fresh = WorkItemsLoader(loader.yaml_path)
+    assert fresh.get_by_wbs_id("WS-17102").status == "Done"
+    assert fresh.get_by_wbs_id("WS-17101").priority == "🟢 Low"
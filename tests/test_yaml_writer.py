@@ -1,9 +1,11 @@
 """Tests for YAML writer functionality."""
 
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pytest
-from wbs_mcp.yaml_writer import WorkItemWriter
+from wbs_mcp.data_loader import WorkItemsLoader
+from wbs_mcp.yaml_writer import WorkItemWriter, WriteConflictError
 
 
 def create_test_yaml():
@@ -158,3 +160,102 @@ def test_formatting_preservation():
         
     finally:
         yaml_path.unlink()
+
+
+def test_expected_hash_conflict_rejected():
+    """Test that a stale expected_hash is rejected without base values."""
+    yaml_path = create_test_yaml()
+    writer = WorkItemWriter(yaml_path)
+    
+    try:
+        writer.update_work_item("WS-TEST-001", {"status": "Done"}, create_backup=False)
+        stale_hash = writer.base_hash
+        
+        with pytest.raises(WriteConflictError, match="changed since snapshot"):
+            writer.update_work_item(
+                "WS-TEST-001",
+                {"priority": "🟢 Low"},
+                create_backup=False,
+                expected_hash=stale_hash
+            )
+        
+        # Current hash is accepted
+        updated = writer.update_work_item(
+            "WS-TEST-001",
+            {"priority": "🟢 Low"},
+            create_backup=False,
+            expected_hash=writer.content_hash[:16]
+        )
+        assert updated.priority == "🟢 Low"
+        
+        with pytest.raises(ValueError, match="at least 16 characters"):
+            writer.update_work_item(
+                "WS-TEST-001",
+                {"priority": "🟡 Medium"},
+                create_backup=False,
+                expected_hash=writer.content_hash[:8]
+            )
+    finally:
+        yaml_path.unlink()
+
+
+def test_expected_hash_field_merge():
+    """Test per-field merge onto a newer snapshot."""
+    yaml_path = create_test_yaml()
+    writer = WorkItemWriter(yaml_path)
+    
+    try:
+        writer.update_work_item("WS-TEST-001", {"status": "Done"}, create_backup=False)
+        stale_hash = writer.base_hash
+        
+        # Untouched field merges cleanly
+        updated = writer.update_work_item(
+            "WS-TEST-001",
+            {"priority": "🟢 Low"},
+            create_backup=False,
+            expected_hash=stale_hash,
+            base_values={"priority": "🟡 Medium"}
+        )
+        assert updated.status == "Done"
+        assert updated.priority == "🟢 Low"
+        
+        # Concurrently changed field conflicts
+        with pytest.raises(WriteConflictError, match="status"):
+            writer.update_work_item(
+                "WS-TEST-001",
+                {"status": "Blocked"},
+                create_backup=False,
+                expected_hash=stale_hash,
+                base_values={"status": "Todo"}
+            )
+    finally:
+        yaml_path.unlink()
+
+
+def test_concurrent_writers_do_not_lose_updates():
+    """Test that locked read-modify-write keeps every concurrent update."""
+    yaml_path = create_test_yaml()
+    fields = {
+        "status": "Done",
+        "priority": "🚨 Critical",
+        "milestone": "M2",
+        "start_date": "2026-01-01",
+        "end_date": "2026-02-01",
+        "responsible_architect": "Alice",
+    }
+    
+    def write(field):
+        WorkItemWriter(yaml_path).update_work_item(
+            "WS-TEST-001", {field: fields[field]}, create_backup=False
+        )
+    
+    try:
+        with ThreadPoolExecutor(max_workers=len(fields)) as pool:
+            list(pool.map(write, fields))
+        
+        item = WorkItemsLoader(yaml_path).get_by_wbs_id("WS-TEST-001")
+        for field, value in fields.items():
+            assert getattr(item, field) == value
+    finally:
+        yaml_path.unlink()
+        yaml_path.with_name(yaml_path.name + ".lock").unlink(missing_ok=True)
@@ -0,0 +1,189 @@
+"""Asyncio engine for concurrent, rate-limit-aware GitHub GraphQL requests."""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .graphql_client import GraphQLClient, RateLimitError, get_client, is_mutation
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of GitHub requests in flight at once
+DEFAULT_CONCURRENCY = int(os.environ.get("WBS_GITHUB_CONCURRENCY", "4"))
+
+# Minimum spacing between mutation requests (seconds). GitHub's secondary
+# rate limits are triggered by bursts of content-creating requests, so
+# mutations are paced while reads run freely up to the concurrency limit.
+DEFAULT_MUTATION_INTERVAL = float(os.environ.get("WBS_MUTATION_INTERVAL", "1.0"))
+
+# Primary rate limit points to leave untouched for other clients
+RATE_LIMIT_RESERVE = 50
+
+# Retry policy for rate-limited requests
+DEFAULT_MAX_RETRIES = 5
+BASE_BACKOFF = 1.0
+
+# Longest we are willing to wait for a rate limit before failing (seconds)
+MAX_WAIT = 60.0
+
+
+class AsyncGraphQLEngine:
+    """Run GraphQL requests concurrently without tripping GitHub's rate limits.
+
+    Requests run in worker threads on a shared GraphQLClient, bounded by a
+    semaphore. Before each request the engine consults the rate limit
+    headers of the latest response and waits for the reset when the
+    remaining budget is nearly spent. Rate-limited requests are retried
+    with exponential backoff and jitter (or after Retry-After, when given),
+    and identical queries that are already in flight are run only once.
+    """
+
+    def __init__(
+        self,
+        client: Optional[GraphQLClient] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        mutation_interval: float = DEFAULT_MUTATION_INTERVAL,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_backoff: float = BASE_BACKOFF,
+        max_wait: float = MAX_WAIT,
+    ):
+        """Initialize the engine.
+
+        Args:
+            client: GraphQL client (default: shared process-wide client)
+            concurrency: Maximum number of requests in flight
+            mutation_interval: Minimum seconds between mutation requests
+            max_retries: Retries for a rate-limited request before giving up
+            base_backoff: Initial backoff delay in seconds
+            max_wait: Longest single wait for a rate limit before failing
+        """
+        self.client = client or get_client()
+        self.mutation_interval = mutation_interval
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_wait = max_wait
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._inflight: Dict[Tuple[str, str, bool], "asyncio.Future[Dict[str, Any]]"] = {}
+        # Event loop times before which no request / mutation may start
+        self._resume_at = 0.0
+        self._next_mutation_at = 0.0
+
+    async def execute(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        allow_partial: bool = False,
+    ) -> Dict[str, Any]:
+        """Execute a GraphQL query or mutation.
+
+        Identical concurrent queries share one request and receive the same
+        response object, which callers must not modify. Mutations are never
+        coalesced.
+
+        Args:
+            query: GraphQL document
+            variables: Query variables
+            allow_partial: Return responses that carry both data and errors
+
+        Returns:
+            Full GraphQL response ({"data": ..., "errors": ...})
+
+        Raises:
+            GraphQLError: On HTTP or GraphQL errors
+            RateLimitError: If still rate limited after retries
+        """
+        if is_mutation(query):
+            return await self._run(query, variables, allow_partial, mutation=True)
+
+        key = (query, json.dumps(variables or {}, sort_keys=True), allow_partial)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run(query, variables, allow_partial, mutation=False))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.debug("Coalescing identical in-flight GraphQL query")
+        # A cancelled caller must not cancel the request other callers share
+        return await asyncio.shield(task)
+
+    async def _run(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        allow_partial: bool,
+        mutation: bool,
+    ) -> Dict[str, Any]:
+        """Execute one request with pacing and rate limit retries."""
+        attempt = 0
+        while True:
+            await self._wait_for_budget(mutation)
+            async with self._semaphore:
+                try:
+                    return await asyncio.to_thread(
+                        self.client.execute, query, variables, allow_partial
+                    )
+                except RateLimitError as e:
+                    if attempt >= self.max_retries:
+                        raise
+                    delay = self._backoff_delay(e, attempt)
+                    if delay > self.max_wait:
+                        raise
+                    attempt += 1
+                    logger.warning(
+                        f"GitHub rate limit hit ({e}); retry {attempt}/{self.max_retries} "
+                        f"in {delay:.1f}s"
+                    )
+                    # Hold back every request, not just this one
+                    loop = asyncio.get_running_loop()
+                    self._resume_at = max(self._resume_at, loop.time() + delay)
+
+    async def _wait_for_budget(self, mutation: bool) -> None:
+        """Wait until backoff, primary rate limit and mutation pacing allow a request.
+
+        Raises:
+            RateLimitError: If the primary limit resets further than max_wait away
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            wait = self._resume_at - now
+
+            state = self.client.rate_limit
+            if state.get("remaining", RATE_LIMIT_RESERVE + 1) <= RATE_LIMIT_RESERVE and "reset" in state:
+                reset_wait = state["reset"] - time.time()
+                if reset_wait > self.max_wait:
+                    raise RateLimitError(
+                        f"GitHub rate limit nearly exhausted ({state['remaining']} points left, "
+                        f"resets in {reset_wait:.0f}s)",
+                        reset_at=float(state["reset"]),
+                    )
+                wait = max(wait, reset_wait)
+
+            if mutation:
+                wait = max(wait, self._next_mutation_at - now)
+
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+
+        # No await between the check above and this reservation, so
+        # concurrent mutations can't both claim the same slot
+        if mutation:
+            self._next_mutation_at = loop.time() + self.mutation_interval
+
+    def _backoff_delay(self, error: RateLimitError, attempt: int) -> float:
+        """Delay before retrying a rate-limited request.
+
+        Honors Retry-After and the primary limit reset time; otherwise uses
+        exponential backoff with full jitter in [delay/2, delay].
+        """
+        if error.retry_after is not None:
+            return error.retry_after + random.uniform(0, self.base_backoff)
+        if error.reset_at is not None:
+            return max(error.reset_at - time.time(), 0.0) + random.uniform(0, self.base_backoff)
+        delay = self.base_backoff * (2 ** attempt)
+        return random.uniform(delay / 2, delay)
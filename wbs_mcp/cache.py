@@ -0,0 +1,91 @@
+"""On-disk JSON cache shared by server processes."""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def cache_dir() -> Path:
+    """Directory for cache files.
+
+    Uses WBS_CACHE_DIR if set, otherwise $XDG_CACHE_HOME/wbs-mcp
+    (default ~/.cache/wbs-mcp).
+    """
+    configured = os.environ.get("WBS_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "wbs-mcp"
+
+
+def project_from_env() -> Tuple[str, int]:
+    """GitHub organization and project number from GITHUB_ORG / GITHUB_PROJECT_NUMBER.
+
+    Per-project caches and the sync outbox are named after these, so they
+    are read here rather than in github_sync, which is slow to import.
+    """
+    return (
+        os.environ.get("GITHUB_ORG", "techseed-codex"),
+        int(os.environ.get("GITHUB_PROJECT_NUMBER", "2")),
+    )
+
+
+def cache_path(name: str) -> Path:
+    """Path of a named cache file, with the name made filesystem-safe."""
+    safe = re.sub(r"[^A-Za-z0-9._-]", "_", name)
+    return cache_dir() / f"{safe}.json"
+
+
+def read_cache(name: str, ttl: Optional[float] = None) -> Optional[Any]:
+    """Read a cached value.
+
+    Args:
+        name: Cache entry name
+        ttl: Maximum age in seconds (None = never expires)
+
+    Returns:
+        Cached value, or None if missing, expired or unreadable
+    """
+    path = cache_path(name)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+        return None
+
+    if ttl is not None and time.time() - entry.get("saved_at", 0) > ttl:
+        logger.debug(f"Cache entry expired: {name}")
+        return None
+    return entry.get("data")
+
+
+def write_cache(name: str, data: Any) -> None:
+    """Atomically write a cached value. Failures are logged, not raised.
+
+    Args:
+        name: Cache entry name
+        data: JSON-serializable value
+    """
+    path = cache_path(name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"saved_at": time.time(), "data": data}, f)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        logger.warning(f"Failed to write cache file {path}: {e}")
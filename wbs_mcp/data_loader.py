@@ -1,16 +1,36 @@
 """Data loader for work-items.yaml with caching and file monitoring."""
 
+import hashlib
 import logging
 import os
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import yaml
 
+from .executor import check_cancelled
+from .metrics import metrics
 from .models import WorkItem
 
 logger = logging.getLogger(__name__)
 
+# File identity used to detect external modifications: (mtime in ns, size in bytes)
+FileIdentity = tuple[int, int]
+
+
+def stat_identity(st: os.stat_result) -> FileIdentity:
+    """Build a file identity from a stat result.
+
+    Args:
+        st: Result of os.stat / os.fstat
+
+    Returns:
+        Tuple of (mtime_ns, size) that changes whenever the file is rewritten
+    """
+    return (st.st_mtime_ns, st.st_size)
+
 
 def find_workspace_root(start_path: Path) -> Optional[Path]:
     """Find workspace root by looking for .git directory.
@@ -33,7 +53,12 @@ def find_workspace_root(start_path: Path) -> Optional[Path]:
 
 
 class WorkItemsLoader:
-    """Loads and caches work items from YAML file."""
+    """Loads and caches work items from YAML file.
+
+    Safe to share between threads: loads and snapshot changes are
+    serialized by a re-entrant lock, and each snapshot list is replaced
+    rather than mutated, so readers keep a consistent view.
+    """
 
     def __init__(self, yaml_path: Path):
         """Initialize loader.
@@ -43,7 +68,25 @@ class WorkItemsLoader:
         """
         self.yaml_path = yaml_path
         self._cache: Optional[list[WorkItem]] = None
-        self._last_mtime: Optional[float] = None
+        self._wbs_index: dict[str, int] = {}
+        self._issue_index: dict[int, int] = {}
+        self._file_identity: Optional[FileIdentity] = None
+        self._content_hash: Optional[str] = None
+        self._version = 0
+        # Queued (not yet written) field updates layered over the file content
+        self._staged: dict[str, dict[str, Any]] = {}
+        # Concurrent first loads wait for one parse instead of each parsing
+        self._lock = threading.RLock()
+
+    @property
+    def content_hash(self) -> Optional[str]:
+        """SHA-256 of the file content backing the current snapshot."""
+        return self._content_hash
+
+    @property
+    def version(self) -> int:
+        """Snapshot version, incremented whenever the cached items change."""
+        return self._version
 
     def _needs_reload(self) -> bool:
         """Check if file has been modified since last load."""
@@ -51,12 +94,35 @@ class WorkItemsLoader:
             logger.error(f"Work items file not found: {self.yaml_path}")
             return False
 
-        current_mtime = self.yaml_path.stat().st_mtime
-
-        if self._last_mtime is None:
+        if self._file_identity is None:
             return True
 
-        return current_mtime > self._last_mtime
+        return stat_identity(self.yaml_path.stat()) != self._file_identity
+
+    def _set_snapshot(self, items: list[WorkItem]) -> None:
+        """Replace the cached items, rebuild lookup indexes and re-apply staged updates."""
+        wbs_index: dict[str, int] = {}
+        issue_index: dict[int, int] = {}
+        for pos, item in enumerate(items):
+            # First occurrence wins, matching the writer's lookup order
+            wbs_index.setdefault(item.wbs_id, pos)
+            issue_index.setdefault(item.issue_number, pos)
+
+        for wbs_id, fields in self._staged.items():
+            staged_pos = wbs_index.get(wbs_id)
+            if staged_pos is None:
+                continue
+            try:
+                items[staged_pos] = _with_fields(items[staged_pos], fields)
+            except ValueError as e:
+                logger.warning(f"Dropping staged update for {wbs_id}: {e}")
+
+        self._cache = items
+        self._wbs_index = wbs_index
+        self._issue_index = issue_index
+        self._version += 1
+        metrics.set_gauge("wbs_snapshot_items", len(items))
+        metrics.set_gauge("wbs_snapshot_version", self._version)
 
     def load(self, force_reload: bool = False) -> list[WorkItem]:
         """Load work items from YAML file.
@@ -71,8 +137,14 @@ class WorkItemsLoader:
             FileNotFoundError: If YAML file doesn't exist
             ValueError: If YAML is invalid
         """
+        with self._lock:
+            return self._load_locked(force_reload)
+
+    def _load_locked(self, force_reload: bool) -> list[WorkItem]:
+        """Load work items; caller must hold the lock."""
         if not force_reload and self._cache is not None and not self._needs_reload():
             logger.debug("Using cached work items")
+            metrics.inc("wbs_loader_loads_total", result="cached")
             return self._cache
 
         if not self.yaml_path.exists():
@@ -80,9 +152,16 @@ class WorkItemsLoader:
 
         logger.info(f"Loading work items from {self.yaml_path}")
 
+        metrics.inc("wbs_loader_loads_total", result="parsed")
         try:
-            with open(self.yaml_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            with metrics.time("wbs_loader_phase_seconds", phase="read"):
+                with open(self.yaml_path, "rb") as f:
+                    identity = stat_identity(os.fstat(f.fileno()))
+                    raw = f.read()
+            metrics.set_gauge("wbs_snapshot_bytes", len(raw))
+
+            with metrics.time("wbs_loader_phase_seconds", phase="parse"):
+                data = yaml.safe_load(raw.decode("utf-8"))
 
             if not isinstance(data, dict) or "work_items" not in data:
                 raise ValueError("Invalid work-items.yaml structure: missing 'work_items' key")
@@ -92,16 +171,22 @@ class WorkItemsLoader:
                 raise ValueError("Invalid work-items.yaml structure: 'work_items' must be a list")
 
             # Parse and validate each work item
+            validate_start = time.perf_counter()
             work_items = []
             for idx, item in enumerate(raw_items):
+                check_cancelled()
                 try:
                     work_item = WorkItem(**item)
                     work_items.append(work_item)
                 except Exception as e:
                     logger.warning(f"Skipping invalid work item at index {idx}: {e}")
 
-            self._cache = work_items
-            self._last_mtime = self.yaml_path.stat().st_mtime
+            metrics.observe("wbs_loader_phase_seconds", time.perf_counter() - validate_start, phase="validate")
+
+            with metrics.time("wbs_loader_phase_seconds", phase="index"):
+                self._set_snapshot(work_items)
+            self._file_identity = identity
+            self._content_hash = hashlib.sha256(raw).hexdigest()
 
             logger.info(f"Loaded {len(work_items)} work items")
             return work_items
@@ -112,6 +197,139 @@ class WorkItemsLoader:
             logger.error(f"Error loading work items: {e}")
             raise
 
+    def apply_update(
+        self,
+        item: WorkItem,
+        file_identity: Optional[FileIdentity] = None,
+        content_hash: Optional[str] = None,
+        base_hash: Optional[str] = None,
+    ) -> None:
+        """Patch a single written item into the cached snapshot.
+
+        Args:
+            item: Updated work item as returned by the writer
+            file_identity: Identity of the file right after the write
+            content_hash: SHA-256 of the written file content
+            base_hash: SHA-256 of the content the write was applied to
+        """
+        self.apply_updates([item], file_identity, content_hash, base_hash)
+
+    def apply_updates(
+        self,
+        items: list[WorkItem],
+        file_identity: Optional[FileIdentity] = None,
+        content_hash: Optional[str] = None,
+        base_hash: Optional[str] = None,
+        committed: Optional[dict[str, dict[str, Any]]] = None,
+    ) -> None:
+        """Patch written items into the cached snapshot.
+
+        Avoids a full re-parse after our own writes. The snapshot list is
+        copied rather than mutated so callers holding the previous list keep
+        a consistent view.
+
+        Args:
+            items: Updated work items as returned by the writer
+            file_identity: Identity of the file right after the write
+            content_hash: SHA-256 of the written file content
+            base_hash: SHA-256 of the content the write was applied to
+            committed: Staged updates that this write persisted
+        """
+        with self._lock:
+            if committed:
+                self._unstage(committed)
+
+            if self._cache is None:
+                # Nothing loaded yet; the next read will load from disk
+                return
+
+            if base_hash is not None and base_hash != self._content_hash:
+                # Another process wrote in between; patching would hide its changes
+                logger.info("Work items file changed externally, scheduling full reload")
+                self._file_identity = None
+                return
+
+            snapshot = list(self._cache)
+            for item in items:
+                pos = self._wbs_index.get(item.wbs_id)
+                if pos is None:
+                    snapshot.append(item)
+                else:
+                    snapshot[pos] = item
+
+            self._set_snapshot(snapshot)
+            self._file_identity = file_identity
+            self._content_hash = content_hash
+            logger.debug(f"Patched {len(items)} cached work item(s)")
+
+    def stage_update(self, wbs_id: str, updates: dict[str, Any]) -> WorkItem:
+        """Layer queued field updates over the snapshot until they are written.
+
+        Args:
+            wbs_id: WBS ID of the item to update
+            updates: Dictionary of fields to update
+
+        Returns:
+            Work item as readers will now see it
+
+        Raises:
+            ValueError: If WBS ID not found or values fail validation
+        """
+        with self._lock:
+            items = self.load()
+            pos = self._wbs_index.get(wbs_id)
+            if pos is None:
+                raise ValueError(f"Work item not found: {wbs_id}")
+
+            # Validate before staging so bad values fail the call, not the flush
+            _with_fields(items[pos], updates)
+            self._staged.setdefault(wbs_id, {}).update(updates)
+            snapshot = list(items)
+            self._set_snapshot(snapshot)
+            return snapshot[pos]
+
+    def _unstage(self, committed: dict[str, dict[str, Any]]) -> None:
+        """Drop staged fields that were written with the same value."""
+        for wbs_id, fields in committed.items():
+            staged = self._staged.get(wbs_id)
+            if staged is None:
+                continue
+            for key, value in fields.items():
+                if key in staged and staged[key] == value:
+                    del staged[key]
+            if not staged:
+                del self._staged[wbs_id]
+
+    def cached_item(self, wbs_id: str) -> Optional[WorkItem]:
+        """Get a work item from the current snapshot without checking the file.
+
+        Args:
+            wbs_id: WBS ID (e.g., 'WS-17101')
+
+        Returns:
+            Cached work item or None if not loaded or not found
+        """
+        with self._lock:
+            if self._cache is None:
+                return None
+            pos = self._wbs_index.get(wbs_id)
+            return self._cache[pos] if pos is not None else None
+
+    def cached_item_by_issue_number(self, issue_number: int) -> Optional[WorkItem]:
+        """Get a work item by issue number from the current snapshot without checking the file.
+
+        Args:
+            issue_number: GitHub issue number
+
+        Returns:
+            Cached work item or None if not loaded or not found
+        """
+        with self._lock:
+            if self._cache is None:
+                return None
+            pos = self._issue_index.get(issue_number)
+            return self._cache[pos] if pos is not None else None
+
     def get_by_wbs_id(self, wbs_id: str) -> Optional[WorkItem]:
         """Get work item by WBS ID.
 
@@ -121,11 +339,10 @@ class WorkItemsLoader:
         Returns:
             Work item or None if not found
         """
-        items = self.load()
-        for item in items:
-            if item.wbs_id == wbs_id:
-                return item
-        return None
+        with self._lock:
+            items = self.load()
+            pos = self._wbs_index.get(wbs_id)
+            return items[pos] if pos is not None else None
 
     def get_by_issue_number(self, issue_number: int) -> Optional[WorkItem]:
         """Get work item by GitHub issue number.
@@ -136,11 +353,10 @@ class WorkItemsLoader:
         Returns:
             Work item or None if not found
         """
-        items = self.load()
-        for item in items:
-            if item.issue_number == issue_number:
-                return item
-        return None
+        with self._lock:
+            items = self.load()
+            pos = self._issue_index.get(issue_number)
+            return items[pos] if pos is not None else None
 
     def filter(
         self,
@@ -181,3 +397,8 @@ class WorkItemsLoader:
             filtered = [i for i in filtered if i.wbs_parent == parent_wbs]
 
         return filtered
+
+
+def _with_fields(item: WorkItem, fields: dict[str, Any]) -> WorkItem:
+    """Return a validated copy of a work item with fields replaced."""
+    return WorkItem(**{**item.model_dump(), **fields})
@@ -0,0 +1,101 @@
+"""Worker pool for blocking tool work, with cooperative cancellation.
+
+Tool handlers parse YAML, write files and wait on GitHub, none of which
+may run on the event loop without stalling every other request. They run
+in a bounded thread pool instead. When the client cancels a call, the
+awaiting coroutine is cancelled and the call's token is set; long loops
+call ``check_cancelled()`` so an abandoned call frees its worker early.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Worker threads for tool calls
+DEFAULT_WORKERS = int(os.environ.get("WBS_WORKER_THREADS", "8"))
+
+T = TypeVar("T")
+
+# Cancellation token of the tool call running in the current context
+_current_token: contextvars.ContextVar[Optional[threading.Event]] = contextvars.ContextVar(
+    "wbs_cancel_token", default=None
+)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class OperationCancelled(BaseException):
+    """Raised by check_cancelled() when the client has cancelled the call.
+
+    Derives from BaseException, like asyncio.CancelledError, so tools'
+    generic ``except Exception`` handlers don't report it as a failure.
+    """
+
+
+def check_cancelled() -> None:
+    """Stop the current tool call if it was cancelled.
+
+    A no-op outside calls started by run_blocking().
+
+    Raises:
+        OperationCancelled: If the call was cancelled
+    """
+    token = _current_token.get()
+    if token is not None and token.is_set():
+        raise OperationCancelled()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get or create the shared worker pool."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=DEFAULT_WORKERS, thread_name_prefix="wbs-worker")
+        return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking function in the worker pool.
+
+    Context variables are copied into the worker. If the awaiting task is
+    cancelled, a call that hasn't started yet never runs, and a running
+    call sees check_cancelled() raise.
+
+    Args:
+        func: Function to run
+        *args: Positional arguments
+        **kwargs: Keyword arguments
+
+    Returns:
+        The function's return value
+    """
+    token = threading.Event()
+    context = contextvars.copy_context()
+    context.run(_current_token.set, token)
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(
+        get_executor(), functools.partial(context.run, func, *args, **kwargs)
+    )
+    try:
+        return await future
+    except asyncio.CancelledError:
+        token.set()
+        logger.info(f"Cancelled {getattr(func, '__name__', func)}")
+        raise
+
+
+def shutdown_executor() -> None:
+    """Stop the worker pool, dropping queued calls and not waiting for running ones."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
@@ -0,0 +1,189 @@
+"""Repository context read directly from the .git directory.
+
+PR review tools need the GitHub owner, repository name and current branch.
+Reading them from ``.git/HEAD`` and ``.git/config`` avoids starting
+``gh repo view`` / ``gh pr view`` processes (and their API calls) on every
+tool call.
+"""
+
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .cache import read_cache, write_cache
+from .data_loader import find_workspace_root
+
+logger = logging.getLogger(__name__)
+
+# Parsed git config per file, keyed by (st_mtime_ns, st_size)
+_configs: Dict[Path, Tuple[Tuple[int, int], Dict[str, Dict[str, str]]]] = {}
+
+# Branch → PR number, keyed by (owner, repo, branch), valid for one HEAD commit
+_pr_numbers: Dict[Tuple[str, str, str], Tuple[str, int]] = {}
+
+# owner/repo from https://github.com/o/r(.git), git@github.com:o/r(.git)
+# and ssh://git@github.com/o/r(.git) remote URLs
+_REMOTE_URL = re.compile(r"[/:]([^/:]+)/([^/]+?)(?:\.git)?/?$")
+
+
+def read_git_context(start: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Read the GitHub repository and branch of the current checkout.
+
+    The remote is the current branch's configured remote, falling back to
+    "origin" and then the first remote. The branch is the upstream branch
+    name if one is configured (it is what PRs are opened from).
+
+    Args:
+        start: Directory inside the checkout (default: current directory)
+
+    Returns:
+        Dictionary with owner, repo, branch (None if detached) and head
+        (commit SHA, None before the first commit), or None if no git
+        checkout with a GitHub-style remote is found
+    """
+    root = find_workspace_root(start or Path.cwd())
+    if root is None:
+        return None
+    try:
+        git_dir, common_dir = _git_dirs(root / ".git")
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        config = _read_config(common_dir / "config")
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read git metadata in {root}: {e}")
+        return None
+
+    branch: Optional[str] = None
+    if head.startswith("ref: "):
+        ref = head[5:]
+        branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else None
+        sha = _resolve_ref(git_dir, common_dir, ref)
+    else:
+        sha = head
+
+    branch_config = config.get(f'branch "{branch}"', {}) if branch else {}
+    remotes = [section[8:-1] for section in config if section.startswith('remote "')]
+    remote = branch_config.get("remote")
+    if remote not in remotes:
+        remote = "origin" if "origin" in remotes else (remotes[0] if remotes else None)
+    if remote is None:
+        return None
+
+    match = _REMOTE_URL.search(config[f'remote "{remote}"'].get("url", ""))
+    if match is None:
+        return None
+
+    merge = branch_config.get("merge", "")
+    if merge.startswith("refs/heads/"):
+        branch = merge[len("refs/heads/"):]
+
+    return {"owner": match.group(1), "repo": match.group(2), "branch": branch, "head": sha}
+
+
+def cached_pr_number(context: Dict[str, Any]) -> Optional[int]:
+    """PR number previously found for the branch at the same HEAD commit.
+
+    Args:
+        context: Result of read_git_context
+
+    Returns:
+        PR number, or None on a miss or after HEAD has moved
+    """
+    if not context["branch"] or not context["head"]:
+        return None
+    key = (context["owner"], context["repo"], context["branch"])
+    entry = _pr_numbers.get(key)
+    if entry is None:
+        stored = read_cache(_pr_cache_name(*key))
+        if stored:
+            entry = (stored["head"], stored["pr_number"])
+            _pr_numbers[key] = entry
+    if entry is None or entry[0] != context["head"]:
+        return None
+    return entry[1]
+
+
+def remember_pr_number(context: Dict[str, Any], pr_number: int) -> None:
+    """Cache the PR number found for the branch at its current HEAD commit."""
+    if not context["branch"] or not context["head"]:
+        return
+    key = (context["owner"], context["repo"], context["branch"])
+    _pr_numbers[key] = (context["head"], pr_number)
+    write_cache(_pr_cache_name(*key), {"head": context["head"], "pr_number": pr_number})
+
+
+def _pr_cache_name(owner: str, repo: str, branch: str) -> str:
+    """Disk cache entry name for a branch → PR mapping."""
+    return f"pr-number-{owner}-{repo}-{branch}"
+
+
+def _git_dirs(dot_git: Path) -> Tuple[Path, Path]:
+    """Resolve the git directory and the common directory holding config and refs.
+
+    Handles linked worktrees and submodules, where .git is a file
+    containing "gitdir: <path>".
+    """
+    git_dir = dot_git
+    if dot_git.is_file():
+        content = dot_git.read_text(encoding="utf-8").strip()
+        if not content.startswith("gitdir: "):
+            raise ValueError(f"Unrecognized .git file: {dot_git}")
+        git_dir = (dot_git.parent / content[8:]).resolve()
+
+    common_dir = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.exists():
+        common_dir = (git_dir / commondir_file.read_text(encoding="utf-8").strip()).resolve()
+    return git_dir, common_dir
+
+
+def _resolve_ref(git_dir: Path, common_dir: Path, ref: str) -> Optional[str]:
+    """Commit SHA of a ref from loose ref files or packed-refs (None if unborn)."""
+    for base in (git_dir, common_dir):
+        try:
+            value = (base / ref).read_text(encoding="utf-8").strip()
+        except OSError:
+            continue
+        if value.startswith("ref: "):
+            return _resolve_ref(git_dir, common_dir, value[5:])
+        return value
+
+    try:
+        with open(common_dir / "packed-refs", "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[1] == ref and not line.startswith(("#", "^")):
+                    return parts[0]
+    except OSError:
+        pass
+    return None
+
+
+def _read_config(path: Path) -> Dict[str, Dict[str, str]]:
+    """Parse a git config file into sections, cached until the file changes.
+
+    Section names keep git's quoting, e.g. 'remote "origin"'. Keys are
+    lowercased; includes and multi-valued keys aren't needed here.
+    """
+    stat = path.stat()
+    identity = (stat.st_mtime_ns, stat.st_size)
+    cached = _configs.get(path)
+    if cached is not None and cached[0] == identity:
+        return cached[1]
+
+    sections: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    for raw in path.read_text(encoding="utf-8").splitlines():
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            name = line[1:line.index("]")].strip()
+            head, _, sub = name.partition(" ")
+            current = sections.setdefault(f"{head.lower()} {sub}" if sub else head.lower(), {})
+        elif current is not None:
+            key, _, value = line.partition("=")
+            current[key.strip().lower()] = value.strip().strip('"')
+
+    _configs[path] = (identity, sections)
+    return sections
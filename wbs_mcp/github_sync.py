@@ -1,47 +1,118 @@
 """GitHub Projects v2 API integration for work item synchronization."""
 
+import asyncio
+import json
 import logging
 import os
-import subprocess
-from pathlib import Path
-from typing import Any, Dict, Optional
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from .async_sync import AsyncGraphQLEngine
+from .cache import project_from_env, read_cache, write_cache
+from .graphql_client import GraphQLClient, GraphQLError, get_client
 
 logger = logging.getLogger(__name__)
 
+# How long a fully paginated issue → project item index stays valid (seconds)
+ITEM_INDEX_TTL = float(os.environ.get("WBS_ITEM_INDEX_TTL", "3600"))
+
+# Page size for project item pagination (GitHub maximum)
+ITEMS_PAGE_SIZE = 100
+
+# Maximum aliased mutations per GraphQL request. Each field update costs
+# about one point; 25 keeps documents small and well inside GitHub's
+# per-request cost and secondary rate limits.
+MAX_MUTATIONS_PER_REQUEST = int(os.environ.get("WBS_MUTATION_BATCH_SIZE", "25"))
+
+# Default map of YAML field names to GitHub Project field names
+DEFAULT_FIELD_MAPPING = {
+    "status": "Status",
+    "priority": "Priority",
+}
+
+# ProjectV2FieldValue input key for each supported field data type
+FIELD_VALUE_KEYS = {
+    "SINGLE_SELECT": "singleSelectOptionId",
+    "ITERATION": "iterationId",
+    "DATE": "date",
+    "NUMBER": "number",
+    "TEXT": "text",
+}
+
+
+def load_field_mapping() -> Dict[str, str]:
+    """Build the YAML → project field mapping.
+    
+    WBS_GITHUB_FIELD_MAP, a JSON object, extends or overrides the defaults;
+    a null value disables a default mapping. For example:
+    {"start_date": "Start date", "effort_days": "Estimate", "milestone": "Iteration"}
+    How values are sent depends on the project field's type (single select,
+    iteration, date, number or text), resolved from the field schema.
+    """
+    mapping = dict(DEFAULT_FIELD_MAPPING)
+    raw = os.environ.get("WBS_GITHUB_FIELD_MAP")
+    if not raw:
+        return mapping
+    
+    try:
+        overrides = json.loads(raw)
+        if not isinstance(overrides, dict) or not all(
+            isinstance(v, str) or v is None for v in overrides.values()
+        ):
+            raise ValueError("expected an object of field names")
+    except ValueError as e:
+        logger.error(f"Ignoring invalid WBS_GITHUB_FIELD_MAP: {e}")
+        return mapping
+    
+    for yaml_field, github_field in overrides.items():
+        if github_field is None:
+            mapping.pop(yaml_field, None)
+        else:
+            mapping[yaml_field] = github_field
+    return mapping
+
+
+# Map YAML field names to GitHub Project field names
+FIELD_MAPPING = load_field_mapping()
+
+# How long the cached project ID and field configuration stay valid (seconds)
+FIELD_SCHEMA_TTL = float(os.environ.get("WBS_FIELD_SCHEMA_TTL", "86400"))
+
+# Minimum age before a lookup miss may force a schema or item page refetch (seconds)
+SCHEMA_REFRESH_INTERVAL = 60.0
+
+# Process-wide project schemas (project ID and fields), keyed by (org, project number)
+_project_schemas: Dict[Tuple[str, int], Dict[str, Any]] = {}
+_schema_lock = threading.Lock()
+
+# Process-wide issue → project item indexes, shared by all sync instances.
+# Keyed by (org, project number); values hold "items", "end_cursor",
+# "fetched_at" and "misses" (issue → time it was last found not to be in the project).
+_item_indexes: Dict[Tuple[str, int], Dict[str, Any]] = {}
+_item_index_lock = threading.Lock()
+
+# Error GitHub returns for node IDs that no longer exist (e.g. removed project items)
+UNRESOLVED_NODE_ERROR = "Could not resolve to a node"
+
 
 class GitHubProjectSync:
     """Sync work items with GitHub Projects using GraphQL API."""
     
-    def __init__(self) -> None:
-        """Initialize GitHub sync client."""
-        self.token = self._get_token()
-        self.org = os.environ.get("GITHUB_ORG", "techseed-codex")
-        self.project_number = int(os.environ.get("GITHUB_PROJECT_NUMBER", "2"))
-        self._project_id_cache: Optional[str] = None
-        self._field_cache: Dict[str, Dict[str, str]] = {}
-    
-    def _get_token(self) -> str:
-        """Get GitHub token from environment or gh CLI."""
-        token = os.environ.get("GITHUB_TOKEN")
-        if token:
-            return token
+    def __init__(self, client: Optional[GraphQLClient] = None) -> None:
+        """Initialize GitHub sync client.
         
-        # Fallback to gh CLI
-        try:
-            result = subprocess.run(
-                ["gh", "auth", "token"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            raise RuntimeError(
-                "No GitHub token found. Set GITHUB_TOKEN or run 'gh auth login'"
-            ) from e
+        Args:
+            client: GraphQL client (default: shared process-wide client)
+        """
+        self.client = client or get_client()
+        self.org, self.project_number = project_from_env()
+        # Failure reasons from the last sync, keyed by (issue number, YAML field)
+        self.errors: Dict[Tuple[int, str], str] = {}
     
-    def _gh_api(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Execute GraphQL query using gh CLI.
+    def _graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Execute GraphQL query over the persistent HTTP client.
         
         Args:
             query: GraphQL query string
@@ -50,74 +121,102 @@ class GitHubProjectSync:
         Returns:
             GraphQL response data
         """
-        import json
-        
-        # Build gh command
-        cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
-        
-        # Add variables
-        if variables:
-            for key, value in variables.items():
-                cmd.extend(["-F", f"{key}={value}"])
-        
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            response: Dict[str, Any] = json.loads(result.stdout)
-            return response
-        except subprocess.CalledProcessError as e:
-            logger.error(f"GraphQL query failed: {e.stderr}")
-            raise RuntimeError(f"GitHub API error: {e.stderr}") from e
+        return self.client.execute(query, variables)
     
     def _get_project_id(self) -> str:
         """Get project global ID (cached)."""
-        if self._project_id_cache:
-            return self._project_id_cache
-        
-        query = """
-        query($org: String!, $number: Int!) {
-          organization(login: $org) {
-            projectV2(number: $number) {
-              id
-            }
-          }
-        }
-        """
-        
-        result = self._gh_api(query, {"org": self.org, "number": self.project_number})
-        self._project_id_cache = result["data"]["organization"]["projectV2"]["id"]
-        return self._project_id_cache
+        project_id: str = self._project_schema()["project_id"]
+        return project_id
     
-    def _get_field_config(self, field_name: str) -> Dict[str, str]:
-        """Get field ID and options for a project field (cached).
+    def _get_field_config(self, field_name: str) -> Dict[str, Any]:
+        """Get field ID, data type and options for a project field (cached).
+        
+        A field missing from the cached schema triggers one refresh, in case
+        it was added after the schema was fetched.
         
         Args:
             field_name: Field name (e.g., "Status", "Priority")
             
         Returns:
-            Dict with field_id and options (name -> id mapping)
+            Dict with field_id, data_type and options (option or iteration
+            name -> id mapping)
         """
-        if field_name in self._field_cache:
-            return self._field_cache[field_name]
+        config: Optional[Dict[str, Any]] = self._project_schema()["fields"].get(field_name)
+        if config is None:
+            config = self._project_schema(refresh=True)["fields"].get(field_name)
+        if config is None:
+            raise ValueError(f"Field '{field_name}' not found in project")
+        return config
+    
+    def _schema_cache_key(self) -> str:
+        """Disk cache name for this project's field schema."""
+        return f"project-fields-{self.org}-{self.project_number}"
+    
+    def _project_schema(self, refresh: bool = False) -> Dict[str, Any]:
+        """Get project ID and all field configurations.
         
+        Served from the process-wide cache, then the disk cache, and fetched
+        in one paginated query otherwise.
+        
+        Args:
+            refresh: Skip both caches and refetch
+            
+        Returns:
+            Dict with project_id, fields (name -> config) and fetched_at
+        """
+        key = (self.org, self.project_number)
+        with _schema_lock:
+            schema = _project_schemas.get(key)
+            if schema is not None:
+                age = time.time() - schema["fetched_at"]
+                # Forced refreshes are throttled so repeated misses don't refetch
+                if age <= (SCHEMA_REFRESH_INTERVAL if refresh else FIELD_SCHEMA_TTL):
+                    return schema
+            
+            schema = None if refresh else read_cache(self._schema_cache_key(), ttl=FIELD_SCHEMA_TTL)
+            if schema is None:
+                schema = self._fetch_project_schema()
+                write_cache(self._schema_cache_key(), schema)
+            
+            _project_schemas[key] = schema
+            return schema
+    
+    def _fetch_project_schema(self) -> Dict[str, Any]:
+        """Fetch project ID and all fields with their options and iterations."""
         query = """
-        query($org: String!, $number: Int!) {
+        query($org: String!, $number: Int!, $cursor: String) {
           organization(login: $org) {
             projectV2(number: $number) {
-              fields(first: 20) {
+              id
+              fields(first: 100, after: $cursor) {
+                pageInfo {
+                  hasNextPage
+                  endCursor
+                }
                 nodes {
-                  ... on ProjectV2SingleSelectField {
+                  ... on ProjectV2FieldCommon {
                     id
                     name
+                    dataType
+                  }
+                  ... on ProjectV2SingleSelectField {
                     options {
                       id
                       name
                     }
                   }
+                  ... on ProjectV2IterationField {
+                    configuration {
+                      iterations {
+                        id
+                        title
+                      }
+                      completedIterations {
+                        id
+                        title
+                      }
+                    }
+                  }
                 }
               }
             }
@@ -125,35 +224,137 @@ class GitHubProjectSync:
         }
         """
         
-        result = self._gh_api(query, {"org": self.org, "number": self.project_number})
-        fields = result["data"]["organization"]["projectV2"]["fields"]["nodes"]
-        
-        # Find matching field
-        for field in fields:
-            if field.get("name") == field_name:
-                config = {
+        fields: Dict[str, Dict[str, Any]] = {}
+        cursor = None
+        while True:
+            result = self._graphql(query, {
+                "org": self.org,
+                "number": self.project_number,
+                "cursor": cursor
+            })
+            project = result["data"]["organization"]["projectV2"]
+            connection = project["fields"]
+            
+            for field in connection["nodes"]:
+                if not field.get("name"):
+                    continue
+                # Iterations are selected by title, like single-select options
+                options = {opt["name"]: opt["id"] for opt in field.get("options") or []}
+                configuration = field.get("configuration") or {}
+                for key in ("completedIterations", "iterations"):
+                    options.update({it["title"]: it["id"] for it in configuration.get(key) or []})
+                fields[field["name"]] = {
                     "field_id": field["id"],
-                    "options": {opt["name"]: opt["id"] for opt in field["options"]}
+                    "data_type": field.get("dataType"),
+                    "options": options
                 }
-                self._field_cache[field_name] = config
-                return config
+            
+            if not connection["pageInfo"]["hasNextPage"]:
+                break
+            cursor = connection["pageInfo"]["endCursor"]
         
-        raise ValueError(f"Field '{field_name}' not found in project")
+        logger.info(f"Fetched {len(fields)} project fields")
+        return {"project_id": project["id"], "fields": fields, "fetched_at": time.time()}
     
     def _get_project_item_id(self, issue_number: int) -> Optional[str]:
         """Get project item ID for an issue.
         
+        Uses a cached issue → item index covering the whole project. On a
+        miss, items added since the index was built are fetched by resuming
+        pagination from the last cursor. Issues still missing after that are
+        remembered for SCHEMA_REFRESH_INTERVAL seconds, so repeated lookups
+        of issues outside the project don't each cost a request, while an
+        issue added to the project later is still found soon after.
+        
         Args:
             issue_number: GitHub issue number
             
         Returns:
             Project item ID or None if not in project
         """
+        with _item_index_lock:
+            index = self._item_index()
+            item_id: Optional[str] = index["items"].get(issue_number)
+            missed_at = index["misses"].get(issue_number)
+            if item_id is None and (missed_at is None or time.time() - missed_at > SCHEMA_REFRESH_INTERVAL):
+                self._fetch_item_pages(index)
+                item_id = index["items"].get(issue_number)
+                if item_id is None:
+                    index["misses"][issue_number] = time.time()
+                else:
+                    index["misses"].pop(issue_number, None)
+        return item_id
+    
+    def _forget_project_items(self, issue_numbers: List[int]) -> None:
+        """Drop index entries whose project items no longer exist.
+        
+        The next lookup of these issues resumes pagination, which finds
+        them again if they were re-added to the project.
+        """
+        if not issue_numbers:
+            return
+        with _item_index_lock:
+            index = _item_indexes.get((self.org, self.project_number))
+            if index is None:
+                return
+            for issue_number in issue_numbers:
+                index["items"].pop(issue_number, None)
+            logger.info(f"Dropped stale project items of issues {sorted(issue_numbers)}")
+            self._save_item_index(index)
+    
+    def _unresolved_items(self, batch: List[Dict[str, Any]], errors: List[Dict[str, Any]]) -> List[int]:
+        """Issues of batch operations that failed because their item is gone."""
+        aliases = {
+            str(error["path"][0]) for error in errors
+            if error.get("path") and UNRESOLVED_NODE_ERROR in str(error.get("message", ""))
+        }
+        return [op["issue_number"] for i, op in enumerate(batch) if f"m{i}" in aliases]
+    
+    def _item_index_key(self) -> str:
+        """Disk cache name for this project's item index."""
+        return f"project-items-{self.org}-{self.project_number}"
+    
+    def _item_index(self) -> Dict[str, Any]:
+        """Get the issue → item index from memory, disk, or a full fetch.
+        
+        Caller must hold _item_index_lock.
+        """
+        key = (self.org, self.project_number)
+        index = _item_indexes.get(key)
+        if index is not None and time.time() - index["fetched_at"] <= ITEM_INDEX_TTL:
+            return index
+        
+        cached = read_cache(self._item_index_key(), ttl=ITEM_INDEX_TTL)
+        if cached is not None:
+            index = {
+                "items": {int(k): v for k, v in cached["items"].items()},
+                "end_cursor": cached["end_cursor"],
+                "fetched_at": cached["fetched_at"],
+                "misses": {},
+            }
+            logger.debug(f"Loaded {len(index['items'])} project items from disk cache")
+        else:
+            index = {"items": {}, "end_cursor": None, "fetched_at": time.time(), "misses": {}}
+            self._fetch_item_pages(index)
+        
+        _item_indexes[key] = index
+        return index
+    
+    def _fetch_item_pages(self, index: Dict[str, Any]) -> None:
+        """Page through project items after the index's cursor and persist it.
+        
+        Starting from the saved end cursor only fetches items added since the
+        last fetch, since new project items are appended at the end.
+        """
         query = """
-        query($org: String!, $number: Int!) {
+        query($org: String!, $number: Int!, $first: Int!, $cursor: String) {
           organization(login: $org) {
             projectV2(number: $number) {
-              items(first: 100) {
+              items(first: $first, after: $cursor) {
+                pageInfo {
+                  hasNextPage
+                  endCursor
+                }
                 nodes {
                   id
                   content {
@@ -168,28 +369,180 @@ class GitHubProjectSync:
         }
         """
         
-        result = self._gh_api(query, {"org": self.org, "number": self.project_number})
-        items = result["data"]["organization"]["projectV2"]["items"]["nodes"]
+        cursor = index["end_cursor"]
+        pages = 0
+        while True:
+            result = self._graphql(query, {
+                "org": self.org,
+                "number": self.project_number,
+                "first": ITEMS_PAGE_SIZE,
+                "cursor": cursor
+            })
+            connection = result["data"]["organization"]["projectV2"]["items"]
+            pages += 1
+            
+            for item in connection["nodes"]:
+                content = item.get("content") or {}
+                if "number" in content:
+                    index["items"][content["number"]] = str(item["id"])
+            
+            # Keep the last non-null cursor so the next refresh resumes here
+            cursor = connection["pageInfo"]["endCursor"] or cursor
+            if not connection["pageInfo"]["hasNextPage"]:
+                break
+        
+        index["end_cursor"] = cursor
+        logger.info(f"Fetched {pages} page(s) of project items ({len(index['items'])} indexed)")
+        self._save_item_index(index)
+    
+    def _save_item_index(self, index: Dict[str, Any]) -> None:
+        """Persist the item index to the disk cache (misses aren't persisted)."""
+        write_cache(self._item_index_key(), {
+            "items": index["items"],
+            "end_cursor": index["end_cursor"],
+            "fetched_at": index["fetched_at"],
+        })
+    
+    def fetch_item_timestamps(self) -> List[Dict[str, Any]]:
+        """List every issue in the project with its item ID and last update time.
+        
+        Project items can't be ordered or filtered by update time, so this is
+        a lightweight pass (no field values) over all items; callers compare
+        ``updated_at`` against their watermark and fetch field values only
+        for items that changed.
+        
+        Returns:
+            List of {"issue_number", "item_id", "updated_at"} dictionaries
+        """
+        query = """
+        query($org: String!, $number: Int!, $first: Int!, $cursor: String) {
+          organization(login: $org) {
+            projectV2(number: $number) {
+              items(first: $first, after: $cursor) {
+                pageInfo {
+                  hasNextPage
+                  endCursor
+                }
+                nodes {
+                  id
+                  updatedAt
+                  content {
+                    ... on Issue {
+                      number
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+        """
         
-        for item in items:
-            content = item.get("content", {})
-            if isinstance(content, dict) and content.get("number") == issue_number:
-                return str(item["id"])
+        entries: List[Dict[str, Any]] = []
+        cursor = None
+        while True:
+            result = self._graphql(query, {
+                "org": self.org,
+                "number": self.project_number,
+                "first": ITEMS_PAGE_SIZE,
+                "cursor": cursor
+            })
+            connection = result["data"]["organization"]["projectV2"]["items"]
+            for item in connection["nodes"]:
+                content = item.get("content") or {}
+                if "number" in content:
+                    entries.append({
+                        "issue_number": content["number"],
+                        "item_id": item["id"],
+                        "updated_at": item["updatedAt"],
+                    })
+            if not connection["pageInfo"]["hasNextPage"]:
+                break
+            cursor = connection["pageInfo"]["endCursor"]
         
-        return None
+        logger.info(f"Listed {len(entries)} project items")
+        return entries
+    
+    def fetch_item_field_values(self, item_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch current field values for project items, up to 100 items per request.
+        
+        Args:
+            item_ids: Project item global IDs
+            
+        Returns:
+            Mapping of item ID to {GitHub field name: value}; single-select
+            and iteration values are option names and iteration titles
+        """
+        query = """
+        query($ids: [ID!]!) {
+          nodes(ids: $ids) {
+            ... on ProjectV2Item {
+              id
+              fieldValues(first: 50) {
+                nodes {
+                  ... on ProjectV2ItemFieldSingleSelectValue {
+                    name
+                    field { ...fieldName }
+                  }
+                  ... on ProjectV2ItemFieldIterationValue {
+                    title
+                    field { ...fieldName }
+                  }
+                  ... on ProjectV2ItemFieldDateValue {
+                    date
+                    field { ...fieldName }
+                  }
+                  ... on ProjectV2ItemFieldNumberValue {
+                    number
+                    field { ...fieldName }
+                  }
+                  ... on ProjectV2ItemFieldTextValue {
+                    text
+                    field { ...fieldName }
+                  }
+                }
+              }
+            }
+          }
+        }
+        
+        fragment fieldName on ProjectV2FieldConfiguration {
+          ... on ProjectV2FieldCommon {
+            name
+          }
+        }
+        """
+        
+        values: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(item_ids), ITEMS_PAGE_SIZE):
+            result = self._graphql(query, {"ids": item_ids[start:start + ITEMS_PAGE_SIZE]})
+            for node in result["data"]["nodes"]:
+                if not node:
+                    continue
+                fields: Dict[str, Any] = {}
+                for value in node["fieldValues"]["nodes"]:
+                    field = (value or {}).get("field") or {}
+                    if "name" not in field:
+                        continue
+                    for key in ("name", "title", "date", "number", "text"):
+                        if key in value:
+                            fields[field["name"]] = value[key]
+                            break
+                values[node["id"]] = fields
+        return values
     
     def update_item_field(
         self,
         issue_number: int,
         field_name: str,
-        value: str
+        value: Any
     ) -> bool:
-        """Update a single-select field for a work item.
+        """Update (or clear, when value is None) one field of a work item.
         
         Args:
             issue_number: GitHub issue number
-            field_name: Field to update (e.g., "Status", "Priority")
-            value: New value (e.g., "In Progress", "High")
+            field_name: Field to update (e.g., "Status", "Start date")
+            value: New value (option name, iteration title, date, number or text)
             
         Returns:
             True if successful
@@ -200,49 +553,69 @@ class GitHubProjectSync:
             logger.warning(f"Issue #{issue_number} not found in project")
             return False
         
-        # Get field configuration
-        field_config = self._get_field_config(field_name)
-        field_id = field_config["field_id"]
-        
-        # Get option ID for value
-        options = field_config["options"]
-        assert isinstance(options, dict), "Options must be a dict"
-        option_id = options.get(value)
-        if not option_id:
-            raise ValueError(
-                f"Invalid {field_name} value '{value}'. "
-                f"Valid options: {', '.join(options.keys())}"
-            )
+        # Resolve field ID and typed value
+        field_id, field_value = self._field_value_input(field_name, value)
         
-        # Update field via GraphQL mutation
-        mutation = """
-        mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $optionId: String!) {
-          updateProjectV2ItemFieldValue(
-            input: {
-              projectId: $projectId
-              itemId: $itemId
-              fieldId: $fieldId
-              value: { singleSelectOptionId: $optionId }
-            }
-          ) {
-            projectV2Item {
-              id
-            }
-          }
-        }
-        """
-        
-        project_id = self._get_project_id()
-        self._gh_api(mutation, {
-            "projectId": project_id,
-            "itemId": item_id,
-            "fieldId": field_id,
-            "optionId": option_id
-        })
+        batch = [{
+            "issue_number": issue_number,
+            "item_id": item_id,
+            "field_id": field_id,
+            "value": field_value,
+        }]
+        document, variables = self.build_mutation_batch(self._get_project_id(), batch)
+        try:
+            self._graphql(document, variables)
+        except GraphQLError as e:
+            self._forget_project_items(self._unresolved_items(batch, e.errors))
+            raise
         
         logger.info(f"Updated issue #{issue_number} {field_name} to '{value}'")
         return True
     
+    def plan_sync(
+        self,
+        desired_by_issue: Dict[int, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Diff desired field values against the project's current values.
+        
+        Current values are fetched in bulk (up to 100 items per request), so
+        only fields that actually differ need a mutation.
+        
+        Args:
+            desired_by_issue: Mapping of issue number to YAML field values
+            
+        Returns:
+            Dictionary with "changes" (list of issue_number, yaml_field,
+            current and desired values) and "not_in_project" (issue numbers)
+        """
+        item_ids: Dict[int, str] = {}
+        not_in_project: List[int] = []
+        for issue_number in desired_by_issue:
+            item_id = self._get_project_item_id(issue_number)
+            if item_id:
+                item_ids[issue_number] = item_id
+            else:
+                not_in_project.append(issue_number)
+        
+        current_values = self.fetch_item_field_values(list(item_ids.values()))
+        
+        changes: List[Dict[str, Any]] = []
+        for issue_number, item_id in item_ids.items():
+            current = current_values.get(item_id, {})
+            for yaml_field, value in desired_by_issue[issue_number].items():
+                github_field = FIELD_MAPPING.get(yaml_field)
+                if github_field is None or value in (None, ""):
+                    continue
+                if current.get(github_field) != value:
+                    changes.append({
+                        "issue_number": issue_number,
+                        "yaml_field": yaml_field,
+                        "current": current.get(github_field),
+                        "desired": value,
+                    })
+        
+        return {"changes": changes, "not_in_project": not_in_project}
+    
     def sync_work_item(
         self,
         issue_number: int,
@@ -250,6 +623,8 @@ class GitHubProjectSync:
     ) -> Dict[str, bool]:
         """Sync multiple fields for a work item to GitHub Project.
         
+        All mapped fields are updated in a single batched request.
+        
         Args:
             issue_number: GitHub issue number
             updates: Dictionary of field updates
@@ -257,28 +632,255 @@ class GitHubProjectSync:
         Returns:
             Dictionary mapping field names to success status
         """
-        # Map YAML field names to GitHub field names
-        field_mapping = {
-            "status": "Status",
-            "priority": "Priority",
-            # Add more mappings as needed
-        }
+        return self.sync_work_items({issue_number: updates})[issue_number]
+    
+    def sync_work_items(
+        self,
+        updates_by_issue: Dict[int, Dict[str, Any]]
+    ) -> Dict[int, Dict[str, bool]]:
+        """Sync field updates for many work items with batched mutations.
         
-        results = {}
-        for yaml_field, value in updates.items():
-            github_field = field_mapping.get(yaml_field)
-            if not github_field:
+        Field updates are combined into aliased multi-mutation documents of
+        at most MAX_MUTATIONS_PER_REQUEST operations. Failure reasons for
+        each (issue, field) pair are available in ``self.errors``.
+        
+        Args:
+            updates_by_issue: Mapping of issue number to field updates
+            
+        Returns:
+            Mapping of issue number to {field name: success status}
+        """
+        results: Dict[int, Dict[str, bool]] = {issue: {} for issue in updates_by_issue}
+        self.errors = {}
+        
+        operations = self._prepare_operations(updates_by_issue, results)
+        if operations:
+            project_id = self._get_project_id()
+            for start in range(0, len(operations), MAX_MUTATIONS_PER_REQUEST):
+                batch = operations[start:start + MAX_MUTATIONS_PER_REQUEST]
+                self._run_mutation_batch(project_id, batch, results)
+        
+        return results
+    
+    async def sync_work_items_async(
+        self,
+        updates_by_issue: Dict[int, Dict[str, Any]],
+        engine: Optional[AsyncGraphQLEngine] = None
+    ) -> Dict[int, Dict[str, bool]]:
+        """Like sync_work_items, but sends the mutation batches concurrently.
+        
+        Item and field lookups run in a worker thread (they are usually
+        cache hits); the batches are then scheduled on an AsyncGraphQLEngine,
+        which bounds concurrency and paces requests by GitHub's rate limits.
+        
+        Args:
+            updates_by_issue: Mapping of issue number to field updates
+            engine: Request engine (default: a new engine on this client)
+            
+        Returns:
+            Mapping of issue number to {field name: success status}
+        """
+        engine = engine or AsyncGraphQLEngine(self.client)
+        results: Dict[int, Dict[str, bool]] = {issue: {} for issue in updates_by_issue}
+        self.errors = {}
+        
+        operations = await asyncio.to_thread(self._prepare_operations, updates_by_issue, results)
+        if not operations:
+            return results
+        project_id = await asyncio.to_thread(self._get_project_id)
+        
+        async def run_batch(batch: List[Dict[str, Any]]) -> None:
+            document, variables = self.build_mutation_batch(project_id, batch)
+            try:
+                response = await engine.execute(document, variables, allow_partial=True)
+            except GraphQLError as e:
+                for op in batch:
+                    self._record_failure(results, op["issue_number"], op["yaml_field"], str(e))
+                errors = e.errors
+            else:
+                self._record_batch_response(batch, response, results)
+                errors = response.get("errors") or []
+            stale = self._unresolved_items(batch, errors)
+            if stale:
+                # Takes the index lock, which a lookup may hold over a request
+                await asyncio.to_thread(self._forget_project_items, stale)
+        
+        await asyncio.gather(*(
+            run_batch(operations[start:start + MAX_MUTATIONS_PER_REQUEST])
+            for start in range(0, len(operations), MAX_MUTATIONS_PER_REQUEST)
+        ))
+        return results
+    
+    def _prepare_operations(
+        self,
+        updates_by_issue: Dict[int, Dict[str, Any]],
+        results: Dict[int, Dict[str, bool]]
+    ) -> List[Dict[str, Any]]:
+        """Resolve field updates to mutation operations, recording lookup failures."""
+        operations: List[Dict[str, Any]] = []
+        for issue_number, updates in updates_by_issue.items():
+            mapped = {k: v for k, v in updates.items() if k in FIELD_MAPPING}
+            for yaml_field in updates.keys() - mapped.keys():
                 logger.debug(f"Skipping field '{yaml_field}' (no GitHub mapping)")
+            if not mapped:
                 continue
             
+            item_id = self._get_project_item_id(issue_number)
+            for yaml_field, value in mapped.items():
+                if not item_id:
+                    self._record_failure(results, issue_number, yaml_field, "Issue not found in project")
+                    continue
+                try:
+                    field_id, field_value = self._field_value_input(FIELD_MAPPING[yaml_field], value)
+                except ValueError as e:
+                    self._record_failure(results, issue_number, yaml_field, str(e))
+                    continue
+                operations.append({
+                    "issue_number": issue_number,
+                    "yaml_field": yaml_field,
+                    "item_id": item_id,
+                    "field_id": field_id,
+                    "value": field_value,
+                })
+        return operations
+    
+    def _field_value_input(self, field_name: str, value: Any) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Resolve a field name and value to a field ID and ProjectV2FieldValue input.
+        
+        The input depends on the field's data type. Empty values resolve to
+        None, meaning the field is cleared.
+        
+        Raises:
+            ValueError: If the field, option or iteration doesn't exist, the
+                value doesn't fit the field type, or the type isn't supported
+        """
+        field_config = self._get_field_config(field_name)
+        data_type = field_config.get("data_type")
+        value_key = FIELD_VALUE_KEYS.get(data_type or "")
+        if value_key is None:
+            raise ValueError(f"Field '{field_name}' has unsupported type {data_type}")
+        if value is None or value == "":
+            return field_config["field_id"], None
+        
+        if data_type == "DATE":
+            try:
+                typed: Any = date.fromisoformat(str(value)).isoformat()
+            except ValueError:
+                raise ValueError(f"Invalid {field_name} date '{value}' (expected YYYY-MM-DD)") from None
+        elif data_type == "NUMBER":
             try:
-                results[yaml_field] = self.update_item_field(
-                    issue_number,
-                    github_field,
-                    value
+                typed = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid {field_name} number '{value}'") from None
+        elif data_type == "TEXT":
+            typed = str(value)
+        else:
+            typed = field_config["options"].get(value)
+            if not typed:
+                # The option or iteration may have been added since the schema was cached
+                field_config = self._project_schema(refresh=True)["fields"].get(field_name, field_config)
+                typed = field_config["options"].get(value)
+            if not typed:
+                raise ValueError(
+                    f"Invalid {field_name} value '{value}'. "
+                    f"Valid options: {', '.join(field_config['options'].keys())}"
                 )
-            except Exception as e:
-                logger.error(f"Failed to update {yaml_field}: {e}")
-                results[yaml_field] = False
+        return field_config["field_id"], {value_key: typed}
+    
+    @staticmethod
+    def build_mutation_batch(
+        project_id: str,
+        batch: List[Dict[str, Any]]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build one aliased document updating every operation in the batch.
         
-        return results
+        Args:
+            project_id: Project global ID
+            batch: Operations with item_id, field_id and value (ProjectV2FieldValue,
+                or None to clear the field)
+            
+        Returns:
+            Tuple of (GraphQL document, variables); operation i has alias m{i}
+        """
+        declarations = ["$projectId: ID!"]
+        selections = []
+        variables: Dict[str, Any] = {"projectId": project_id}
+        for i, op in enumerate(batch):
+            variables[f"item{i}"] = op["item_id"]
+            variables[f"field{i}"] = op["field_id"]
+            if op["value"] is None:
+                declarations.append(f"$item{i}: ID!, $field{i}: ID!")
+                selections.append(
+                    f"  m{i}: clearProjectV2ItemFieldValue(input: {{"
+                    f"projectId: $projectId, itemId: $item{i}, fieldId: $field{i}"
+                    f"}}) {{ projectV2Item {{ id }} }}"
+                )
+                continue
+            declarations.append(f"$item{i}: ID!, $field{i}: ID!, $value{i}: ProjectV2FieldValue!")
+            selections.append(
+                f"  m{i}: updateProjectV2ItemFieldValue(input: {{"
+                f"projectId: $projectId, itemId: $item{i}, fieldId: $field{i}, value: $value{i}"
+                f"}}) {{ projectV2Item {{ id }} }}"
+            )
+            variables[f"value{i}"] = op["value"]
+        
+        document = f"mutation({', '.join(declarations)}) {{\n" + "\n".join(selections) + "\n}"
+        return document, variables
+    
+    def _run_mutation_batch(
+        self,
+        project_id: str,
+        batch: List[Dict[str, Any]],
+        results: Dict[int, Dict[str, bool]]
+    ) -> None:
+        """Execute one batched mutation and record per-operation outcomes."""
+        document, variables = self.build_mutation_batch(project_id, batch)
+        
+        try:
+            response = self.client.execute(document, variables, allow_partial=True)
+        except GraphQLError as e:
+            for op in batch:
+                self._record_failure(results, op["issue_number"], op["yaml_field"], str(e))
+            errors = e.errors
+        else:
+            self._record_batch_response(batch, response, results)
+            errors = response.get("errors") or []
+        self._forget_project_items(self._unresolved_items(batch, errors))
+    
+    def _record_batch_response(
+        self,
+        batch: List[Dict[str, Any]],
+        response: Dict[str, Any],
+        results: Dict[int, Dict[str, bool]]
+    ) -> None:
+        """Record per-operation outcomes of a batched mutation response."""
+        # Errors carry the alias of the failed mutation as the first path element
+        alias_errors: Dict[str, str] = {}
+        for error in response.get("errors") or []:
+            path = error.get("path") or []
+            if path:
+                alias_errors[str(path[0])] = error.get("message", "Unknown error")
+        
+        data = response.get("data") or {}
+        for i, op in enumerate(batch):
+            alias = f"m{i}"
+            if data.get(alias) and alias not in alias_errors:
+                results[op["issue_number"]][op["yaml_field"]] = True
+                logger.info(f"Updated issue #{op['issue_number']} {op['yaml_field']} to {op['value']}")
+            else:
+                self._record_failure(
+                    results, op["issue_number"], op["yaml_field"],
+                    alias_errors.get(alias, "Mutation returned no result")
+                )
+    
+    def _record_failure(
+        self,
+        results: Dict[int, Dict[str, bool]],
+        issue_number: int,
+        yaml_field: str,
+        message: str
+    ) -> None:
+        """Mark an (issue, field) pair as failed and remember why."""
+        logger.error(f"Failed to update #{issue_number} {yaml_field}: {message}")
+        results[issue_number][yaml_field] = False
+        self.errors[(issue_number, yaml_field)] = message
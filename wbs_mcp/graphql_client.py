@@ -0,0 +1,384 @@
+"""Native GitHub GraphQL client over pooled keep-alive HTTP connections."""
+
+import gzip
+import http.client
+import json
+import logging
+import os
+import subprocess
+import threading
+from typing import Any, Dict, List, Optional, Protocol
+from urllib.parse import urlsplit
+
+from .executor import check_cancelled
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_POOL_SIZE = 4
+
+# Errors that mean a pooled keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+def is_mutation(query: str) -> bool:
+    """Whether a GraphQL document is a mutation."""
+    return query.lstrip().startswith("mutation")
+
+
+def _is_mutation_payload(payload: bytes) -> bool:
+    """Whether a request payload carries a mutation (assumed if unreadable)."""
+    try:
+        query = json.loads(payload).get("query", "")
+    except (ValueError, AttributeError):
+        return True
+    return not isinstance(query, str) or is_mutation(query)
+
+
+class GraphQLError(RuntimeError):
+    """Raised when a GraphQL request fails or returns errors."""
+
+    def __init__(
+        self,
+        message: str,
+        errors: Optional[List[Dict[str, Any]]] = None,
+        status: Optional[int] = None,
+    ):
+        super().__init__(message)
+        self.errors = errors or []
+        self.status = status
+
+
+class RateLimitError(GraphQLError):
+    """Raised when GitHub rejects a request because of a rate limit.
+
+    ``retry_after`` is the number of seconds GitHub asked us to wait, if it
+    said so; ``reset_at`` is the epoch time the primary limit resets.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        retry_after: Optional[float] = None,
+        reset_at: Optional[float] = None,
+        status: Optional[int] = None,
+    ):
+        super().__init__(message, status=status)
+        self.retry_after = retry_after
+        self.reset_at = reset_at
+
+
+def get_github_token() -> str:
+    """Get GitHub token from environment or gh CLI.
+
+    The gh CLI is only used to discover a token when GITHUB_TOKEN is unset;
+    API calls themselves never go through it.
+
+    Raises:
+        RuntimeError: If no token is available
+    """
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+
+    # Fallback to gh CLI
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=10
+        )
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError) as e:
+        raise RuntimeError(
+            "No GitHub token found. Set GITHUB_TOKEN or run 'gh auth login'"
+        ) from e
+
+
+def graphql_url_from_env() -> str:
+    """Resolve the GraphQL endpoint.
+
+    Uses GITHUB_GRAPHQL_URL if set, otherwise GITHUB_API_URL + '/graphql'
+    (both as provided by GitHub Actions), defaulting to api.github.com.
+    """
+    url = os.environ.get("GITHUB_GRAPHQL_URL")
+    if url:
+        return url
+    base = os.environ.get("GITHUB_API_URL", DEFAULT_API_URL)
+    return base.rstrip("/") + "/graphql"
+
+
+class Transport(Protocol):
+    """Sends an encoded GraphQL request and returns the raw response."""
+
+    def post(self, payload: bytes) -> tuple[int, Dict[str, str], bytes]:
+        """Send a JSON request body.
+
+        Returns:
+            Tuple of (HTTP status, lower-cased response headers, decoded body)
+        """
+        ...
+
+    def close(self) -> None:
+        """Release any resources held by the transport."""
+        ...
+
+
+class HTTPTransport:
+    """HTTP(S) transport that reuses connections across requests.
+
+    Connections are kept alive in a small pool, so repeated queries skip
+    process startup and TLS handshakes. Responses are requested gzipped.
+    Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        timeout: float = DEFAULT_TIMEOUT,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ):
+        """Initialize the transport.
+
+        Args:
+            url: Endpoint URL (http:// allowed for local stand-ins)
+            headers: Request headers, including authorization
+            timeout: Socket timeout in seconds
+            pool_size: Maximum number of idle connections kept open
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Invalid GraphQL URL: {url}")
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = parts.path or "/"
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._headers = {**headers, "Accept-Encoding": "gzip"}
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def post(self, payload: bytes) -> tuple[int, Dict[str, str], bytes]:
+        """POST a payload, retrying once if a pooled connection went stale.
+
+        A mutation is only retried if the connection failed while sending
+        it. Once it has been sent, the server may have applied it, so a
+        failure reading the response is raised rather than risking a
+        duplicate (e.g. a review reply posted twice).
+
+        Returns:
+            Tuple of (HTTP status, lower-cased response headers, decoded body)
+        """
+        for attempt in range(2):
+            conn, reused = self._acquire()
+            sent = False
+            try:
+                conn.request("POST", self._path, body=payload, headers=self._headers)
+                sent = True
+                response = conn.getresponse()
+                body = response.read()
+                if response.getheader("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                status = response.status
+                headers = {name.lower(): value for name, value in response.getheaders()}
+                keep = not response.will_close
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused and attempt == 0 and not (sent and _is_mutation_payload(payload)):
+                    logger.debug("Pooled connection was closed by server, reconnecting")
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+
+            self._release(conn, keep)
+            return status, headers, body
+
+        raise AssertionError("unreachable")
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Take an idle connection from the pool or open a new one."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+
+        conn: http.client.HTTPConnection
+        if self._scheme == "https":
+            conn = http.client.HTTPSConnection(self._host, self._port, timeout=self.timeout)
+        else:
+            conn = http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+        return conn, False
+
+    def _release(self, conn: http.client.HTTPConnection, keep: bool) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        if keep:
+            with self._lock:
+                if len(self._idle) < self.pool_size:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+
+
+class GraphQLClient:
+    """GraphQL client over a pluggable transport.
+
+    By default requests go over pooled keep-alive HTTP connections
+    (HTTPTransport); record/replay transports (see replay.py) allow
+    running offline. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        url: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        transport: Optional[Transport] = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            token: GitHub token sent as bearer authorization
+            url: GraphQL endpoint URL (http:// allowed for local stand-ins)
+            timeout: Socket timeout in seconds
+            pool_size: Maximum number of idle connections kept open
+            transport: Transport to use instead of HTTP to url
+        """
+        self.url = url or graphql_url_from_env()
+        self.transport: Transport = transport or HTTPTransport(
+            self.url,
+            {
+                "Authorization": f"bearer {token}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "User-Agent": "wbs-mcp-server",
+            },
+            timeout=timeout,
+            pool_size=pool_size,
+        )
+        # Latest primary rate limit state from response headers:
+        # limit, remaining, used and reset (epoch seconds)
+        self.rate_limit: Dict[str, int] = {}
+
+    def execute(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        allow_partial: bool = False,
+    ) -> Dict[str, Any]:
+        """Execute a GraphQL query or mutation.
+
+        Args:
+            query: GraphQL document
+            variables: Query variables
+            allow_partial: Return responses that carry both data and errors
+                instead of raising (used for batched documents)
+
+        Returns:
+            Full GraphQL response ({"data": ..., "errors": ...})
+
+        Raises:
+            GraphQLError: On HTTP errors or GraphQL errors
+            OperationCancelled: If the tool call making the request was cancelled
+        """
+        # Paginated and batched loops stop here once their call is abandoned
+        check_cancelled()
+        payload = json.dumps({"query": query, "variables": variables or {}}).encode("utf-8")
+        try:
+            with metrics.time("wbs_github_request_seconds"):
+                status, headers, body = self.transport.post(payload)
+        except Exception:
+            metrics.inc("wbs_github_requests_total", status="error")
+            raise
+        metrics.inc("wbs_github_requests_total", status=str(status))
+        self._update_rate_limit(headers)
+
+        try:
+            response: Dict[str, Any] = json.loads(body)
+        except json.JSONDecodeError as e:
+            raise GraphQLError(f"GitHub API returned invalid JSON (HTTP {status})", status=status) from e
+
+        if status != 200:
+            message = response.get("message") if isinstance(response, dict) else None
+            text = f"GitHub API error (HTTP {status}): {message or body[:200]!r}"
+            if status == 429 or (status == 403 and (
+                "retry-after" in headers or headers.get("x-ratelimit-remaining") == "0"
+                or "rate limit" in str(message).lower()
+            )):
+                raise self._rate_limit_error(text, headers, status)
+            raise GraphQLError(text, status=status)
+
+        errors = response.get("errors")
+        if errors and any(err.get("type") == "RATE_LIMITED" for err in errors):
+            raise self._rate_limit_error("GitHub API rate limit exceeded", headers, status)
+
+        if errors and not (allow_partial and response.get("data")):
+            messages = "; ".join(str(err.get("message", err)) for err in errors)
+            logger.error(f"GraphQL query failed: {messages}")
+            raise GraphQLError(f"GitHub API error: {messages}", errors=errors, status=status)
+
+        return response
+
+    def _update_rate_limit(self, headers: Dict[str, str]) -> None:
+        """Record primary rate limit headers from a response."""
+        state = {}
+        for name in ("limit", "remaining", "used", "reset"):
+            value = headers.get(f"x-ratelimit-{name}")
+            if value is not None and value.isdigit():
+                state[name] = int(value)
+        if state:
+            self.rate_limit = state
+
+    @staticmethod
+    def _rate_limit_error(message: str, headers: Dict[str, str], status: int) -> RateLimitError:
+        """Build a RateLimitError from response headers."""
+        retry_after = headers.get("retry-after")
+        reset = headers.get("x-ratelimit-reset")
+        return RateLimitError(
+            message,
+            retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+            reset_at=float(reset) if reset and reset.isdigit() and headers.get("x-ratelimit-remaining") == "0" else None,
+            status=status,
+        )
+
+    def close(self) -> None:
+        """Close the transport (idle connections for HTTP)."""
+        self.transport.close()
+
+
+_client: Optional[GraphQLClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> GraphQLClient:
+    """Get the process-wide GraphQL client, creating it on first use.
+
+    WBS_GITHUB_TRANSPORT=record/replay selects an offline-capable transport
+    (see replay.py).
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            from .replay import client_from_env
+
+            _client = client_from_env() or GraphQLClient(get_github_token())
+        return _client
@@ -0,0 +1,217 @@
+"""Streamable HTTP transport: one server process shared by many MCP clients.
+
+All sessions use the same loader snapshot, response cache and GitHub
+caches. A connection limit protects the process, and each client gets a
+bounded number of concurrent tool calls so one busy agent can't occupy
+the whole worker pool.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from mcp.server.lowlevel import Server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Mount, Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = os.environ.get("WBS_HTTP_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.environ.get("WBS_HTTP_PORT", "8765"))
+
+# Open HTTP requests (including SSE streams) before new ones get 503
+DEFAULT_MAX_CONNECTIONS = int(os.environ.get("WBS_HTTP_MAX_CONNECTIONS", "64"))
+
+# Concurrent tool calls per client; further calls wait their turn
+DEFAULT_CLIENT_CONCURRENCY = int(os.environ.get("WBS_HTTP_CLIENT_CONCURRENCY", "4"))
+
+# Largest request body inspected for tool calls (bytes)
+MAX_BODY_BYTES = 4 * 1024 * 1024
+
+
+class ConnectionLimiter:
+    """ASGI middleware enforcing a connection limit and per-client fairness.
+
+    Requests over ``max_connections`` are rejected with 503. JSON-RPC
+    ``tools/call`` requests are additionally limited to
+    ``client_concurrency`` at a time per client (MCP session ID, else
+    remote address); others, such as cancellations, are never held back.
+    """
+
+    def __init__(self, app: ASGIApp, max_connections: int, client_concurrency: int):
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            max_connections: Maximum open requests
+            client_concurrency: Maximum concurrent tool calls per client
+        """
+        self.app = app
+        self.max_connections = max_connections
+        self.client_concurrency = client_concurrency
+        self.active = 0
+        # Client key -> (semaphore, number of requests using it)
+        self._clients: Dict[str, Tuple[asyncio.Semaphore, int]] = {}
+        metrics.register_collector(lambda: [
+            ("wbs_http_active_requests", {}, self.active),
+            ("wbs_http_clients", {}, len(self._clients)),
+        ])
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self.active >= self.max_connections:
+            metrics.inc("wbs_http_rejected_total", reason="connections")
+            await _reject(send, 503, "Too many connections", retry_after=1)
+            return
+
+        self.active += 1
+        try:
+            if scope["method"] != "POST":
+                await self.app(scope, receive, send)
+                return
+
+            body = await _read_body(receive)
+            if body is None:
+                metrics.inc("wbs_http_rejected_total", reason="body_size")
+                await _reject(send, 413, "Request body too large")
+                return
+            replay = _replay_receive(body, receive)
+            if not _is_tool_call(body):
+                await self.app(scope, replay, send)
+                return
+
+            key = _client_key(scope)
+            semaphore, users = self._clients.get(key) or (asyncio.Semaphore(self.client_concurrency), 0)
+            self._clients[key] = (semaphore, users + 1)
+            try:
+                async with semaphore:
+                    await self.app(scope, replay, send)
+            finally:
+                semaphore, users = self._clients[key]
+                if users == 1:
+                    del self._clients[key]
+                else:
+                    self._clients[key] = (semaphore, users - 1)
+        finally:
+            self.active -= 1
+
+
+def create_http_app(
+    server: Server[Any, Any],
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    client_concurrency: int = DEFAULT_CLIENT_CONCURRENCY,
+) -> ASGIApp:
+    """Build the ASGI application serving MCP at /mcp and metrics at /metrics.
+
+    Args:
+        server: MCP server handling the sessions
+        max_connections: Maximum open requests
+        client_concurrency: Maximum concurrent tool calls per client
+
+    Returns:
+        ASGI application (run with uvicorn)
+    """
+    session_manager = StreamableHTTPSessionManager(app=server)
+
+    async def handle_mcp(scope: Scope, receive: Receive, send: Send) -> None:
+        await session_manager.handle_request(scope, receive, send)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with session_manager.run():
+            yield
+
+    async def prometheus_metrics(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+    starlette_app = Starlette(
+        routes=[Route("/metrics", prometheus_metrics), Mount("/mcp", app=handle_mcp)],
+        lifespan=lifespan,
+    )
+    return ConnectionLimiter(starlette_app, max_connections, client_concurrency)
+
+
+async def serve_http(
+    server: Server[Any, Any],
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+) -> None:
+    """Serve MCP over streamable HTTP until interrupted."""
+    import uvicorn
+
+    config = uvicorn.Config(create_http_app(server), host=host, port=port, log_level="info")
+    logger.info(f"Serving MCP over streamable HTTP at http://{host}:{port}/mcp")
+    await uvicorn.Server(config).serve()
+
+
+def _client_key(scope: Scope) -> str:
+    """Identify the client of a request: MCP session ID, else remote address."""
+    for name, value in scope.get("headers") or []:
+        if name == b"mcp-session-id":
+            return "session:" + str(value.decode("latin-1"))
+    client = scope.get("client")
+    return "addr:" + str(client[0]) if client else "addr:unknown"
+
+
+def _is_tool_call(body: bytes) -> bool:
+    """Check whether a JSON-RPC message (or batch) contains a tools/call request."""
+    try:
+        message = json.loads(body)
+    except ValueError:
+        return False
+    messages = message if isinstance(message, list) else [message]
+    return any(isinstance(m, dict) and m.get("method") == "tools/call" for m in messages)
+
+
+async def _read_body(receive: Receive) -> Optional[bytes]:
+    """Read the whole request body (None if over MAX_BODY_BYTES)."""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay_receive(body: bytes, receive: Receive) -> Receive:
+    """Receive callable yielding the already-read body, then the original stream."""
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+async def _reject(send: Send, status: int, message: str, retry_after: Optional[int] = None) -> None:
+    """Send a plain-text error response."""
+    body = message.encode("utf-8")
+    headers = [(b"content-type", b"text/plain; charset=utf-8"), (b"content-length", str(len(body)).encode())]
+    if retry_after is not None:
+        headers.append((b"retry-after", str(retry_after).encode()))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,307 @@
+"""In-process metrics: counters, gauges and latency histograms.
+
+Instrumented code records into the process-wide ``metrics`` registry;
+the ``server_stats`` tool reports it and ``render_prometheus()`` formats
+it in the Prometheus text exposition format, served at /metrics in HTTP
+mode or written to ``WBS_METRICS_FILE`` periodically.
+"""
+
+import bisect
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, cast
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in seconds (+Inf is implicit)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Seconds between Prometheus text file writes
+DEFAULT_FILE_INTERVAL = float(os.environ.get("WBS_METRICS_INTERVAL", "15"))
+
+Labels = Tuple[Tuple[str, str], ...]
+Sample = Tuple[str, Dict[str, str], float]
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Histogram:
+    """Cumulative latency histogram with fixed buckets."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of the bucket containing it."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class MetricsRegistry:
+    """Thread-safe store of labelled counters, gauges and histograms.
+
+    Gauges that describe other objects' state (cache sizes, snapshot
+    size) are read on demand from collectors instead of being updated on
+    every change.
+    """
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._gauges: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._help: Dict[str, str] = {}
+        self._collectors: List[Callable[[], List[Sample]]] = []
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, help_text: str) -> None:
+        """Set the help text shown for a metric in Prometheus output."""
+        self._help[name] = help_text
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """Increment a counter."""
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        """Set a gauge."""
+        with self._lock:
+            self._gauges.setdefault(name, {})[_labels(labels)] = value
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """Record a latency in a histogram."""
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def time(self, name: str, **labels: str) -> Iterator[None]:
+        """Record the duration of a block in a histogram (also on errors)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed(self, histogram: str, counter: str) -> Callable[[F], F]:
+        """Decorator recording a function's latency and outcome.
+
+        The counter is labelled outcome="ok" or with the exception's class
+        name, e.g. outcome="WriteConflictError".
+        """
+        def decorator(func: F) -> F:
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                outcome = "ok"
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                except BaseException as e:
+                    outcome = type(e).__name__
+                    raise
+                finally:
+                    self.observe(histogram, time.perf_counter() - start)
+                    self.inc(counter, outcome=outcome)
+            return cast(F, wrapper)
+        return decorator
+
+    def register_collector(self, collector: Callable[[], List[Sample]]) -> None:
+        """Add a callable returning (gauge name, labels, value) samples."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def reset(self) -> None:
+        """Drop all recorded values (collectors are kept)."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def _collect(self) -> Dict[str, Dict[Labels, float]]:
+        """Current gauges, including collector samples."""
+        with self._lock:
+            gauges = {name: dict(series) for name, series in self._gauges.items()}
+            collectors = list(self._collectors)
+        for collector in collectors:
+            try:
+                samples = collector()
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {e}")
+                continue
+            for name, labels, value in samples:
+                gauges.setdefault(name, {})[_labels(labels)] = value
+        return gauges
+
+    def snapshot(self) -> Dict[str, List[Dict[str, object]]]:
+        """All metrics as plain data.
+
+        Returns:
+            Dictionary with counters, gauges and histograms, each a list of
+            {name, labels, ...} entries; histograms carry count, sum, mean
+            and bucket-based p50/p95/p99 estimates (seconds)
+        """
+        gauges = self._collect()
+        with self._lock:
+            counters: List[Dict[str, object]] = [
+                {"name": name, "labels": dict(key), "value": value}
+                for name, series in sorted(self._counters.items())
+                for key, value in sorted(series.items())
+            ]
+            histograms: List[Dict[str, object]] = [
+                {
+                    "name": name,
+                    "labels": dict(key),
+                    "count": h.count,
+                    "sum": h.sum,
+                    "mean": h.sum / h.count if h.count else None,
+                    "p50": h.quantile(0.5),
+                    "p95": h.quantile(0.95),
+                    "p99": h.quantile(0.99),
+                }
+                for name, series in sorted(self._histograms.items())
+                for key, h in sorted(series.items())
+            ]
+        return {
+            "counters": counters,
+            "gauges": [
+                {"name": name, "labels": dict(key), "value": value}
+                for name, series in sorted(gauges.items())
+                for key, value in sorted(series.items())
+            ],
+            "histograms": histograms,
+        }
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        gauges = self._collect()
+        lines: List[str] = []
+        with self._lock:
+            for kind, families in (("counter", self._counters), ("gauge", gauges)):
+                for name, series in sorted(families.items()):
+                    self._header(lines, name, kind)
+                    for key, value in sorted(series.items()):
+                        lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+            for name, hseries in sorted(self._histograms.items()):
+                self._header(lines, name, "histogram")
+                for key, h in sorted(hseries.items()):
+                    cumulative = 0
+                    for bound, count in zip(h.buckets + (float("inf"),), h.counts):
+                        cumulative += count
+                        le = key + (("le", _format_value(bound)),)
+                        lines.append(f"{name}_bucket{_format_labels(le)} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(h.sum)}")
+                    lines.append(f"{name}_count{_format_labels(key)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def _header(self, lines: List[str], name: str, kind: str) -> None:
+        """Append the HELP and TYPE lines of a metric family."""
+        if name in self._help:
+            lines.append(f"# HELP {name} {self._help[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+
+class MetricsFileWriter:
+    """Background thread writing the Prometheus text file periodically.
+
+    For node_exporter's textfile collector and similar scrapers. The file
+    is replaced atomically so readers never see a partial write.
+    """
+
+    def __init__(self, path: Path, interval: float = DEFAULT_FILE_INTERVAL):
+        """Start writing.
+
+        Args:
+            path: Output file (e.g. /var/lib/node_exporter/wbs_mcp.prom)
+            interval: Seconds between writes
+        """
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="wbs-metrics-file", daemon=True)
+        self._thread.start()
+
+    def write(self) -> None:
+        """Write the current metrics now."""
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(metrics.render_prometheus(), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def stop(self) -> None:
+        """Stop the thread after a final write."""
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while True:
+            stopping = self._stop.wait(self.interval)
+            try:
+                self.write()
+            except OSError as e:
+                logger.warning(f"Failed to write metrics to {self.path}: {e}")
+            if stopping:
+                return
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    """Canonical, hashable form of a label set."""
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(labels: Labels) -> str:
+    """Prometheus label syntax, e.g. {tool="get_work_item"}."""
+    if not labels:
+        return ""
+    escaped = (f'{k}="{_escape(v)}"' for k, v in labels)
+    return "{" + ",".join(escaped) + "}"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value (backslash, double quote, newline)."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Prometheus number syntax."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(int(value)) if float(value).is_integer() else repr(value)
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
+
+metrics.describe("wbs_tool_calls_total", "Tool calls by tool and outcome")
+metrics.describe("wbs_tool_call_seconds", "Tool call latency including queueing and warm-up wait")
+metrics.describe("wbs_tool_handler_seconds", "Tool handler run time in the worker pool")
+metrics.describe("wbs_response_cache_requests_total", "Response cache lookups by tool and result")
+metrics.describe("wbs_loader_loads_total", "WorkItemsLoader.load calls by result (cached or parsed)")
+metrics.describe("wbs_loader_phase_seconds", "Work items file load time by phase (read, parse, validate, index)")
+metrics.describe("wbs_writer_updates_total", "WorkItemWriter.update_work_item calls by outcome")
+metrics.describe("wbs_writer_update_seconds", "WorkItemWriter.update_work_item latency")
+metrics.describe("wbs_github_requests_total", "GitHub GraphQL requests by HTTP status")
+metrics.describe("wbs_github_request_seconds", "GitHub GraphQL round-trip latency")
@@ -0,0 +1,385 @@
+"""Durable outbox for GitHub pushes, drained by a background worker."""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from .cache import cache_dir, project_from_env
+
+if TYPE_CHECKING:
+    from .github_sync import GitHubProjectSync
+
+logger = logging.getLogger(__name__)
+
+# Attempts before an entry is marked failed
+DEFAULT_MAX_ATTEMPTS = 8
+
+# Retry backoff: base * 2**(attempts - 1), capped (seconds)
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 300.0
+
+# Entries claimed longer ago than this are assumed abandoned by a crashed
+# worker and become due again (seconds)
+CLAIM_TIMEOUT = 300.0
+
+# Maximum entries pushed per worker round
+BATCH_SIZE = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    wbs_id TEXT NOT NULL,
+    issue_number INTEGER NOT NULL,
+    updates TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    claimed_at REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+"""
+
+STATUSES = ("pending", "in_progress", "done", "failed")
+
+
+def default_outbox_path() -> Path:
+    """Outbox database path.
+
+    Uses WBS_OUTBOX_PATH if set, otherwise one database per GitHub project
+    in the cache directory.
+    """
+    configured = os.environ.get("WBS_OUTBOX_PATH")
+    if configured:
+        return Path(configured)
+    org, project_number = project_from_env()
+    return cache_dir() / f"sync-outbox-{org}-{project_number}.sqlite3"
+
+
+def has_unfinished_entries(path: Path) -> bool:
+    """Check whether an outbox database holds pending or in-progress entries.
+
+    Doesn't create the database, so it is cheap to call at startup.
+    """
+    if not path.exists():
+        return False
+    conn = sqlite3.connect(path, timeout=10)
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM outbox WHERE status IN ('pending', 'in_progress') LIMIT 1"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        # Not an outbox (yet): the schema is created with the first SyncOutbox
+        return False
+    finally:
+        conn.close()
+    return row is not None
+
+
+class SyncOutbox:
+    """SQLite-backed queue of field updates waiting to be pushed to GitHub.
+
+    Entries survive restarts and are shared safely between server
+    processes; claiming uses an immediate transaction so each entry is
+    pushed by one worker at a time.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """Initialize the outbox, creating the database if needed.
+
+        Args:
+            path: Database file (default: default_outbox_path())
+            max_attempts: Attempts before an entry is marked failed
+        """
+        self.path = path or default_outbox_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def enqueue(self, wbs_id: str, issue_number: int, updates: Dict[str, Any]) -> int:
+        """Add a push to the outbox.
+
+        Fields also set by older entries for the same issue that haven't
+        been pushed yet are dropped from those entries, so a retry can never
+        overwrite a newer value.
+
+        Returns:
+            Ticket number for get()
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.execute(
+                    "INSERT INTO outbox (wbs_id, issue_number, updates, next_attempt_at, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (wbs_id, issue_number, json.dumps(updates), now, now, now),
+                )
+                ticket = cursor.lastrowid
+                assert ticket is not None
+                older = self._conn.execute(
+                    "SELECT id, updates FROM outbox WHERE issue_number = ? AND id < ? AND status = 'pending'",
+                    (issue_number, ticket),
+                ).fetchall()
+                for row in older:
+                    self._drop_fields(row["id"], json.loads(row["updates"]), set(updates), ticket, now)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        logger.info(f"Queued GitHub push #{ticket} for {wbs_id}: {', '.join(updates)}")
+        return ticket
+
+    def claim_due(self, limit: int = BATCH_SIZE) -> List[Dict[str, Any]]:
+        """Claim pending entries that are due, oldest first.
+
+        Returns:
+            Claimed entries, now marked in_progress
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT * FROM outbox WHERE (status = 'pending' AND next_attempt_at <= ?) "
+                    "OR (status = 'in_progress' AND claimed_at <= ?) ORDER BY id LIMIT ?",
+                    (now, now - CLAIM_TIMEOUT, limit),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE outbox SET status = 'in_progress', claimed_at = ?, updated_at = ? WHERE id = ?",
+                    [(now, now, row["id"]) for row in rows],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return [self._entry(row) for row in rows]
+
+    def mark_done(self, ticket: int) -> None:
+        """Record a successful push."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = 'done', attempts = attempts + 1, last_error = NULL, "
+                "claimed_at = NULL, updated_at = ? WHERE id = ?",
+                (time.time(), ticket),
+            )
+
+    def mark_failed(self, ticket: int, error: str) -> None:
+        """Record a failed attempt; schedule a retry or give up after max_attempts.
+
+        Fields that newer entries for the same issue have set since are not
+        retried.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM outbox WHERE id = ?", (ticket,)).fetchone()
+            if row is None:
+                return
+            newer = self._conn.execute(
+                "SELECT id, updates FROM outbox WHERE issue_number = ? AND id > ? AND status != 'failed'",
+                (row["issue_number"], ticket),
+            ).fetchall()
+            superseded = {field for newer_row in newer for field in json.loads(newer_row["updates"])}
+            if superseded and self._drop_fields(
+                ticket, json.loads(row["updates"]), superseded, newer[-1]["id"], now
+            ):
+                return
+            attempts = row["attempts"] + 1
+            delay = min(RETRY_BASE_DELAY * 2 ** (attempts - 1), RETRY_MAX_DELAY)
+            status = "failed" if attempts >= self.max_attempts else "pending"
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, last_error = ?, claimed_at = NULL, "
+                "next_attempt_at = ?, updated_at = ? WHERE id = ?",
+                (status, attempts, error, now + random.uniform(delay / 2, delay), now, ticket),
+            )
+        if status == "failed":
+            logger.error(f"GitHub push #{ticket} failed after {attempts} attempts: {error}")
+        else:
+            logger.warning(f"GitHub push #{ticket} failed (attempt {attempts}), will retry: {error}")
+
+    def get(self, ticket: int) -> Optional[Dict[str, Any]]:
+        """Get an entry by ticket number."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM outbox WHERE id = ?", (ticket,)).fetchone()
+        return self._entry(row) if row else None
+
+    def counts(self) -> Dict[str, int]:
+        """Number of entries per status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS n FROM outbox GROUP BY status"
+            ).fetchall()
+        counts = {status: 0 for status in STATUSES}
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
+
+    def recent(self, status: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recently updated entries, optionally filtered by status."""
+        query = "SELECT * FROM outbox"
+        params: List[Any] = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY updated_at DESC, id DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _drop_fields(
+        self,
+        ticket: int,
+        updates: Dict[str, Any],
+        fields: set[str],
+        newer_ticket: int,
+        now: float,
+    ) -> bool:
+        """Remove fields superseded by a newer entry. Caller must hold the lock.
+
+        Returns:
+            True if nothing was left and the entry was closed as done
+        """
+        remaining = {k: v for k, v in updates.items() if k not in fields}
+        if len(remaining) == len(updates):
+            return False
+        if remaining:
+            self._conn.execute(
+                "UPDATE outbox SET updates = ?, updated_at = ? WHERE id = ?",
+                (json.dumps(remaining), now, ticket),
+            )
+            return False
+        self._conn.execute(
+            "UPDATE outbox SET status = 'done', last_error = ?, claimed_at = NULL, updated_at = ? "
+            "WHERE id = ?",
+            (f"Superseded by #{newer_ticket}", now, ticket),
+        )
+        return True
+
+    @staticmethod
+    def _entry(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a row to an entry dictionary."""
+        entry = dict(row)
+        entry["updates"] = json.loads(entry["updates"])
+        return entry
+
+
+class OutboxWorker:
+    """Background thread that pushes due outbox entries to GitHub.
+
+    Entries claimed in one round are combined into one batched sync, with
+    later updates to the same issue taking precedence. Each entry is then
+    marked done, or failed with the reason for its fields.
+    """
+
+    def __init__(
+        self,
+        outbox: SyncOutbox,
+        sync_factory: Optional[Callable[[], "GitHubProjectSync"]] = None,
+        poll_interval: float = 5.0,
+    ):
+        """Initialize the worker.
+
+        Args:
+            outbox: Outbox to drain
+            sync_factory: Creates the GitHub sync client on first use
+                (default: GitHubProjectSync)
+            poll_interval: Seconds between checks for due retries
+        """
+        self.outbox = outbox
+        self.sync_factory = sync_factory
+        self.poll_interval = poll_interval
+        self._sync: Optional["GitHubProjectSync"] = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="wbs-outbox", daemon=True)
+            self._thread.start()
+
+    def notify(self) -> None:
+        """Wake the worker after an enqueue."""
+        self._wake.set()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the worker, letting the current round finish."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def drain_once(self) -> int:
+        """Push one round of due entries.
+
+        The round's mutation batches are sent concurrently through
+        ``sync_work_items_async``, paced by GitHub's rate limits.
+
+        Returns:
+            Number of entries processed
+        """
+        entries = self.outbox.claim_due()
+        if not entries:
+            return 0
+
+        updates_by_issue: Dict[int, Dict[str, Any]] = {}
+        for entry in entries:
+            updates_by_issue.setdefault(entry["issue_number"], {}).update(entry["updates"])
+
+        try:
+            if self._sync is None:
+                if self.sync_factory is None:
+                    from .github_sync import GitHubProjectSync
+                    self.sync_factory = GitHubProjectSync
+                self._sync = self.sync_factory()
+            sync = self._sync
+            results = asyncio.run(sync.sync_work_items_async(updates_by_issue))
+        except Exception as e:
+            for entry in entries:
+                self.outbox.mark_failed(entry["id"], str(e))
+            return len(entries)
+
+        for entry in entries:
+            outcome = results[entry["issue_number"]]
+            failed = [
+                f"{field} ({sync.errors.get((entry['issue_number'], field), 'unknown error')})"
+                for field in entry["updates"]
+                if outcome.get(field) is False
+            ]
+            if failed:
+                self.outbox.mark_failed(entry["id"], f"Failed to sync fields: {', '.join(failed)}")
+            else:
+                self.outbox.mark_done(entry["id"])
+        return len(entries)
+
+    def _run(self) -> None:
+        """Worker loop."""
+        while not self._stop.is_set():
+            try:
+                processed = self.drain_once()
+            except Exception as e:
+                logger.error(f"Outbox worker error: {e}")
+                processed = 0
+            if not processed:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
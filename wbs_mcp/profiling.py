@@ -0,0 +1,185 @@
+"""On-demand profiling of individual tool calls.
+
+A profiled call runs under cProfile and a sampling profiler and leaves two
+artifacts in the profile directory, named after the tool, a hash of its
+arguments and the snapshot id (the first 12 hex digits of the backlog
+file's SHA-256, so a profile sent in by a user identifies its backlog):
+
+- ``<tag>.pstats``: cProfile statistics (``python -m pstats`` or snakeviz)
+- ``<tag>.collapsed.txt``: sampled stacks in collapsed format, one
+  ``frame;frame;frame count`` line per stack (flamegraph.pl, speedscope)
+
+Profiling is requested per call with the ``profile`` argument, or for every
+call of the tools listed in ``WBS_PROFILE``. Calls that aren't profiled only
+pay for one set lookup; the profilers are imported on first use.
+
+cProfile runs for one call at a time: only one profiler can be active in
+the process on Python 3.12+, and it would record the other requests
+running alongside. A call profiled while another one is (or while some
+other profiler is active) gets the sampled stacks only.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from .cache import cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Tools profiled on every call (comma-separated names, or "all")
+PROFILE_TOOLS = frozenset(t.strip() for t in os.environ.get("WBS_PROFILE", "").split(",") if t.strip())
+
+# Stack sampling interval in seconds
+SAMPLE_INTERVAL = float(os.environ.get("WBS_PROFILE_SAMPLE_MS", "1")) / 1000
+
+# Optional argument added to every tool's schema when WBS_PROFILE_DIR is set
+PROFILE_ARGUMENT = {
+    "profile": {
+        "type": "boolean",
+        "description": "Profile this call and write .pstats and collapsed-stack files to WBS_PROFILE_DIR",
+    },
+}
+
+T = TypeVar("T")
+
+# Held by the call running under cProfile
+_cprofile_lock = threading.Lock()
+
+
+def profile_dir() -> Path:
+    """Directory for profile artifacts: WBS_PROFILE_DIR, else <cache dir>/profiles."""
+    configured = os.environ.get("WBS_PROFILE_DIR")
+    return Path(configured) if configured else cache_dir() / "profiles"
+
+
+def should_profile(tool: str, requested: bool = False) -> bool:
+    """Check whether a tool call should be profiled.
+
+    Args:
+        tool: Tool name
+        requested: The call's ``profile`` argument
+    """
+    return requested or tool in PROFILE_TOOLS or "all" in PROFILE_TOOLS
+
+
+def profile_call(
+    tool: str,
+    arguments: Optional[Dict[str, Any]],
+    func: Callable[[], T],
+    snapshot: Callable[[], Optional[str]],
+) -> Tuple[T, Path]:
+    """Run a function under cProfile and the stack sampler, writing artifacts.
+
+    Artifacts are written even if the function raises. The .pstats file is
+    skipped when cProfile is busy with another call.
+
+    Args:
+        tool: Tool name (artifact tag)
+        arguments: Tool arguments (hashed into the artifact tag)
+        func: Function to profile
+        snapshot: Returns the content hash of the snapshot after the call
+            (artifact tag)
+
+    Returns:
+        The function's result and the artifact path without suffix
+    """
+    import cProfile
+
+    sampler = StackSampler(sys._getframe())
+    profiler: Optional[cProfile.Profile] = None
+    try:
+        sampler.start()
+        if _cprofile_lock.acquire(blocking=False):
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError as e:
+                # Another profiling tool is already active (Python 3.12+)
+                logger.info(f"Profiling {tool} with the sampler only: {e}")
+                profiler = None
+                _cprofile_lock.release()
+        else:
+            logger.info(f"Profiling {tool} with the sampler only: another call is under cProfile")
+        result = func()
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            _cprofile_lock.release()
+        sampler.stop()
+        base = _artifact_base(tool, arguments, snapshot())
+        try:
+            base.parent.mkdir(parents=True, exist_ok=True)
+            if profiler is not None:
+                profiler.dump_stats(base.with_name(base.name + ".pstats"))
+            base.with_name(base.name + ".collapsed.txt").write_text(sampler.collapsed(), encoding="utf-8")
+            logger.info(f"Wrote profile of {tool} to {base}.*")
+        except OSError as e:
+            logger.warning(f"Failed to write profile of {tool} to {base}: {e}")
+    return result, base
+
+
+class StackSampler:
+    """Samples one thread's stack at a fixed interval from a helper thread.
+
+    Stacks are recorded from the given root frame down, so frames of the
+    worker pool around the profiled call don't appear.
+    """
+
+    def __init__(self, root: FrameType, interval: float = SAMPLE_INTERVAL):
+        """Initialize the sampler.
+
+        Args:
+            root: Frame of the calling function; sampling covers the calling
+                thread from here down
+            interval: Seconds between samples
+        """
+        self.root = root
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="wbs-profile-sampler", daemon=True)
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread, if it was started."""
+        self._stop.set()
+        if self._thread.ident is not None:
+            self._thread.join()
+
+    def collapsed(self) -> str:
+        """Sampled stacks in collapsed format, most frequent first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            frames = []
+            while frame is not None and frame is not self.root:
+                code = frame.f_code
+                frames.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if frame is self.root and frames:
+                self.stacks[";".join(reversed(frames))] += 1
+
+
+def _artifact_base(tool: str, arguments: Optional[Dict[str, Any]], snapshot: Optional[str]) -> Path:
+    """Artifact path without suffix: <tool>-<args hash>-<snapshot id>-<timestamp>."""
+    normalized = json.dumps(
+        {k: v for k, v in (arguments or {}).items() if v is not None}, sort_keys=True, default=str
+    )
+    args_hash = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:12]
+    stamp = time.strftime("%Y%m%dT%H%M%S") + f"{time.time() % 1:.3f}"[1:]
+    return profile_dir() / f"{tool}-{args_hash}-{(snapshot or 'unloaded')[:12]}-{stamp}"
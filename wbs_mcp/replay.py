@@ -0,0 +1,234 @@
+"""Record/replay transports for running GitHub API calls offline.
+
+A recording transport wraps the real HTTP transport and appends every
+request/response pair to a JSON Lines fixture file. A replay transport
+serves those responses without network access, optionally with the
+recorded or a fixed latency, so sync and PR review tools can be tested
+and benchmarked offline. ``python -m wbs_mcp.replay FIXTURE`` serves a
+fixture over HTTP as a local stand-in for GitHub (e.g. in CI).
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from .graphql_client import GraphQLClient, GraphQLError, Transport, get_github_token
+
+logger = logging.getLogger(__name__)
+
+# Response headers worth keeping in fixtures (rate limit feedback)
+RECORDED_HEADERS = ("retry-after", "x-ratelimit-limit", "x-ratelimit-remaining",
+                    "x-ratelimit-used", "x-ratelimit-reset")
+
+# Latency setting: None (serve immediately), "recorded", or seconds
+Latency = Union[None, str, float]
+
+
+def request_key(payload: bytes) -> Tuple[str, str]:
+    """Match key for a request: whitespace-normalized query and sorted variables."""
+    request = json.loads(payload)
+    query = re.sub(r"\s+", " ", request.get("query", "")).strip()
+    return query, json.dumps(request.get("variables") or {}, sort_keys=True)
+
+
+class RecordingTransport:
+    """Forward requests to another transport and append each exchange to a fixture."""
+
+    def __init__(self, inner: Transport, fixture_path: Path):
+        """Initialize the transport.
+
+        Args:
+            inner: Transport that talks to GitHub
+            fixture_path: JSON Lines file to append exchanges to
+        """
+        self.inner = inner
+        self.fixture_path = fixture_path
+        self.fixture_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def post(self, payload: bytes) -> tuple[int, Dict[str, str], bytes]:
+        """Send the request and record the exchange.
+
+        Bodies that aren't JSON are recorded as ``response_text``.
+        """
+        start = time.monotonic()
+        status, headers, body = self.inner.post(payload)
+        elapsed = time.monotonic() - start
+
+        exchange: Dict[str, Any] = {
+            "request": json.loads(payload),
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k in RECORDED_HEADERS},
+        }
+        try:
+            exchange["response"] = json.loads(body)
+        except ValueError:
+            # Proxy error pages, empty bodies: keep the raw text to replay as is
+            exchange["response_text"] = body.decode("utf-8", errors="replace")
+        exchange["elapsed"] = round(elapsed, 4)
+        with self._lock:
+            with open(self.fixture_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(exchange, ensure_ascii=False) + "\n")
+        return status, headers, body
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.inner.close()
+
+
+class ReplayTransport:
+    """Serve recorded responses for matching requests without network access.
+
+    Requests match on the whitespace-normalized query and variables.
+    Repeated identical requests get the recorded responses in order; the
+    last one is served again once they run out. Unmatched requests raise.
+    """
+
+    def __init__(self, fixture_path: Path, latency: Latency = None):
+        """Load a fixture.
+
+        Args:
+            fixture_path: JSON Lines file written by RecordingTransport
+            latency: None to respond immediately, "recorded" to sleep for the
+                recorded duration, or a fixed number of seconds
+        """
+        self.fixture_path = fixture_path
+        self.latency = latency
+        self._exchanges: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._lock = threading.Lock()
+        with open(fixture_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    exchange = json.loads(line)
+                    key = request_key(json.dumps(exchange["request"]).encode("utf-8"))
+                    self._exchanges[key].append(exchange)
+        logger.info(f"Loaded {sum(map(len, self._exchanges.values()))} recorded exchanges")
+
+    def post(self, payload: bytes) -> tuple[int, Dict[str, str], bytes]:
+        """Serve the recorded response for a request.
+
+        Raises:
+            GraphQLError: If no recorded exchange matches the request
+        """
+        key = request_key(payload)
+        with self._lock:
+            queue = self._exchanges.get(key)
+            if not queue:
+                raise GraphQLError(f"No recorded response for request: {key[0][:120]}")
+            exchange = queue.popleft() if len(queue) > 1 else queue[0]
+
+        if self.latency == "recorded":
+            time.sleep(exchange.get("elapsed", 0))
+        elif self.latency:
+            time.sleep(float(self.latency))
+
+        if "response_text" in exchange:
+            body = exchange["response_text"].encode("utf-8")
+        else:
+            body = json.dumps(exchange["response"]).encode("utf-8")
+        return exchange["status"], dict(exchange.get("headers") or {}), body
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def latency_from_env() -> Latency:
+    """Replay latency from WBS_REPLAY_LATENCY_MS ("recorded" or milliseconds)."""
+    raw = os.environ.get("WBS_REPLAY_LATENCY_MS")
+    if not raw:
+        return None
+    if raw == "recorded":
+        return raw
+    return float(raw) / 1000
+
+
+def client_from_env() -> Optional[GraphQLClient]:
+    """Create a record or replay client if WBS_GITHUB_TRANSPORT asks for one.
+
+    WBS_GITHUB_TRANSPORT is "http" (default), "record" or "replay", and
+    WBS_GITHUB_FIXTURES names the fixture file. Replay needs no token.
+
+    Returns:
+        Configured client, or None for the default HTTP transport
+    """
+    mode = os.environ.get("WBS_GITHUB_TRANSPORT", "http").lower()
+    if mode == "http":
+        return None
+    fixtures = os.environ.get("WBS_GITHUB_FIXTURES")
+    if mode not in ("record", "replay") or not fixtures:
+        raise ValueError(
+            "WBS_GITHUB_TRANSPORT must be 'http', 'record' or 'replay', "
+            "and record/replay need WBS_GITHUB_FIXTURES"
+        )
+
+    if mode == "replay":
+        logger.info(f"Replaying GitHub API responses from {fixtures}")
+        return GraphQLClient("replay", transport=ReplayTransport(Path(fixtures), latency_from_env()))
+
+    client = GraphQLClient(get_github_token())
+    client.transport = RecordingTransport(client.transport, Path(fixtures))
+    logger.info(f"Recording GitHub API exchanges to {fixtures}")
+    return client
+
+
+def serve(fixture_path: Path, host: str = "127.0.0.1", port: int = 8787, latency: Latency = None) -> None:
+    """Serve a fixture over HTTP as a GraphQL endpoint until interrupted."""
+    transport = ReplayTransport(fixture_path, latency)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            payload = self.rfile.read(int(self.headers["Content-Length"]))
+            try:
+                status, headers, body = transport.post(payload)
+            except GraphQLError as e:
+                status, headers, body = 404, {}, json.dumps({"message": str(e)}).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(format % args)
+
+    httpd = ThreadingHTTPServer((host, port), Handler)
+    logger.info(f"Serving {fixture_path} at http://{host}:{httpd.server_port}/graphql")
+    try:
+        httpd.serve_forever()
+    finally:
+        httpd.server_close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point for the replay server."""
+    parser = argparse.ArgumentParser(description="Serve recorded GitHub GraphQL responses")
+    parser.add_argument("fixture", type=Path, help="JSON Lines fixture from a recording")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency-ms", help="Fixed latency in ms, or 'recorded'")
+    args = parser.parse_args(argv)
+
+    latency: Latency = None
+    if args.latency_ms == "recorded":
+        latency = "recorded"
+    elif args.latency_ms:
+        latency = float(args.latency_ms) / 1000
+
+    logging.basicConfig(level=logging.INFO)
+    serve(args.fixture, args.host, args.port, latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""LRU cache of rendered tool responses, bounded by size in bytes."""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from mcp.types import TextContent
+
+logger = logging.getLogger(__name__)
+
+# Default cache budget (bytes of UTF-8 response text)
+DEFAULT_MAX_BYTES = int(os.environ.get("WBS_RESPONSE_CACHE_BYTES", str(8 * 1024 * 1024)))
+
+CacheKey = Tuple[str, str, Hashable]
+
+
+class ResponseCache:
+    """Least-recently-used cache of tool responses.
+
+    Keys combine the tool name, its normalized arguments and the loader's
+    snapshot version, so any change to the work items (a reload or a
+    write) makes older entries unreachable; they age out under the byte
+    budget or are dropped with clear().
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Total size of cached response text (0 disables caching)
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[List[TextContent], int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(tool: str, arguments: Optional[Dict[str, Any]], version: Hashable) -> CacheKey:
+        """Build a cache key; argument order and None values don't matter."""
+        normalized = {k: v for k, v in (arguments or {}).items() if v is not None}
+        return tool, json.dumps(normalized, sort_keys=True, default=str), version
+
+    @property
+    def size(self) -> int:
+        """Bytes of response text currently cached."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> Optional[List[TextContent]]:
+        """Get a cached response, marking it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: CacheKey, response: List[TextContent]) -> None:
+        """Cache a response, evicting least recently used entries to fit.
+
+        Responses larger than the whole budget are not cached.
+        """
+        size = sum(len(content.text.encode("utf-8")) for content in response)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._entries[key] = (response, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
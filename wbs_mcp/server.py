@@ -1,34 +1,28 @@
 """MCP server for GitHub Projects with WBS structure."""
 
+import asyncio
 import logging
 import os
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
 from .data_loader import WorkItemsLoader, find_workspace_root
+from .executor import get_executor, run_blocking, shutdown_executor
+from .metrics import MetricsFileWriter, metrics
 from .models import WorkItem, WorkItemSummary
-from .tools import (
-    build_hierarchy,
-    calculate_milestone_progress,
-    find_orphan_items,
-    validate_work_items,
-)
-from .tools.get_hierarchy import format_hierarchy
-from .tools.validate_sync import format_validation_result
-from .tools.find_orphans import format_orphans
-from .tools.get_milestone_coverage import format_milestone_progress
-from .tools.update_work_item import update_work_item, format_update_result
-from .tools.pr_review_read import list_pr_review_threads, format_review_threads
-from .tools.pr_review_write import (
-    reply_to_review_thread,
-    resolve_review_thread,
-    format_reply_result,
-    format_resolve_result,
-)
+from .profiling import PROFILE_ARGUMENT, profile_call, should_profile
+from .response_cache import ResponseCache
+from .tool_registry import ToolRegistry, ToolSpec
+
+if TYPE_CHECKING:
+    from .outbox import OutboxWorker, SyncOutbox
+    from .write_queue import WriteQueue
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -40,32 +34,85 @@ app = Server("wbs-mcp-server")
 # Global loader instance
 loader: WorkItemsLoader | None = None
 
+# Write-behind queue (only when WBS_WRITE_BEHIND is enabled)
+write_queue: "WriteQueue | None" = None
+
+# Durable GitHub push outbox and its worker (unless WBS_SYNC_OUTBOX=0)
+sync_outbox: "SyncOutbox | None" = None
+outbox_worker: "OutboxWorker | None" = None
+
+# Guards creation of the globals above; handlers run in worker threads
+_init_lock = threading.Lock()
+
+# Startup warm-up running in the worker pool (see warm_up)
+warmup: Future[None] | None = None
+
+# Rendered responses of read-only tools, keyed by snapshot version
+response_cache = ResponseCache()
+
+# Tool schemas and handlers, registered below with @registry.tool
+registry = ToolRegistry(PROFILE_ARGUMENT if os.environ.get("WBS_PROFILE_DIR") else None)
+
 
 def get_loader() -> WorkItemsLoader:
     """Get or create the work items loader."""
-    global loader
-    if loader is None:
-        # Get path from environment variable (required)
-        yaml_path_str = os.environ.get("WBS_WORK_ITEMS_PATH")
+    global loader, write_queue
+    with _init_lock:
+        if loader is None:
+            # Get path from environment variable (required)
+            yaml_path_str = os.environ.get("WBS_WORK_ITEMS_PATH")
         
-        if not yaml_path_str:
-            raise ValueError(
-                "WBS_WORK_ITEMS_PATH environment variable is required. "
-                "Set it to the absolute path of your work-items.yaml file."
-            )
+            if not yaml_path_str:
+                raise ValueError(
+                    "WBS_WORK_ITEMS_PATH environment variable is required. "
+                    "Set it to the absolute path of your work-items.yaml file."
+                )
         
-        yaml_path = Path(yaml_path_str)
+            yaml_path = Path(yaml_path_str)
         
-        if not yaml_path.exists():
-            raise FileNotFoundError(
-                f"Work items file not found: {yaml_path}. "
-                "Check that WBS_WORK_ITEMS_PATH points to a valid file."
-            )
+            if not yaml_path.exists():
+                raise FileNotFoundError(
+                    f"Work items file not found: {yaml_path}. "
+                    "Check that WBS_WORK_ITEMS_PATH points to a valid file."
+                )
         
-        logger.info(f"Loading work items from: {yaml_path}")
-        loader = WorkItemsLoader(yaml_path)
+            logger.info(f"Loading work items from: {yaml_path}")
+            loader = WorkItemsLoader(yaml_path)
+            from .write_queue import WriteQueue
+            write_queue = WriteQueue.from_env(loader)
+        
+        return loader
+
+
+def outbox_enabled() -> bool:
+    """Whether GitHub pushes go through the outbox (WBS_SYNC_OUTBOX, default on)."""
+    return os.environ.get("WBS_SYNC_OUTBOX", "1").lower() not in ("0", "false", "no")
+
+
+def get_outbox(create: bool = True) -> "SyncOutbox | None":
+    """Get or create the sync outbox and start its worker.
     
-    return loader
+    Args:
+        create: Create the outbox database if it doesn't exist yet
+    
+    Returns:
+        The outbox, or None when disabled with WBS_SYNC_OUTBOX=0 or, without
+        create, when no outbox database exists
+    """
+    global sync_outbox, outbox_worker
+    if not outbox_enabled():
+        return None
+    with _init_lock:
+        if sync_outbox is None:
+            from .outbox import OutboxWorker, SyncOutbox, default_outbox_path
+            path = default_outbox_path()
+            if not create and not path.exists():
+                return None
+            sync_outbox = SyncOutbox(path)
+            outbox_worker = OutboxWorker(sync_outbox)
+            outbox_worker.start()
+            logger.info(f"GitHub sync outbox: {sync_outbox.path}")
+        return sync_outbox
 
 
 def format_work_item_summary(item: WorkItem) -> str:
@@ -134,222 +181,146 @@ def format_work_item_detail(item: WorkItem) -> str:
 @app.list_tools()  # type: ignore[no-untyped-call, untyped-decorator]
 async def list_tools() -> list[Tool]:
     """List available tools."""
-    return [
-        Tool(
-            name="list_work_items",
-            description="List and filter work items from work-items.yaml. Returns items matching the specified criteria. Use this to explore the backlog, find items by status, type, milestone, or work stream.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "status": {
-                        "type": "string",
-                        "description": "Filter by status (e.g., 'Todo', 'In Progress', 'Done', 'Blocked')",
-                    },
-                    "wbs_type": {
-                        "type": "string",
-                        "description": "Filter by type (e.g., 'Epic', 'Feature', 'Task')",
-                    },
-                    "milestone": {
-                        "type": "string",
-                        "description": "Filter by milestone (partial match, e.g., 'M1.1')",
-                    },
-                    "work_stream": {
-                        "type": "string",
-                        "description": "Filter by work stream (partial match, e.g., 'WS1', 'Repository')",
-                    },
-                    "parent_wbs": {
-                        "type": "string",
-                        "description": "Filter by parent WBS ID (e.g., 'WS-11100' for all features under that epic)",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return (default: 50)",
-                        "default": 50,
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="get_work_item",
-            description="Get detailed information about a specific work item by WBS ID or GitHub issue number. Returns full description, relationships, and metadata.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "wbs_id": {
-                        "type": "string",
-                        "description": "WBS ID of the work item (e.g., 'WS-17101')",
-                    },
-                    "issue_number": {
-                        "type": "integer",
-                        "description": "GitHub issue number (alternative to wbs_id)",
-                    },
-                },
-                "oneOf": [
-                    {"required": ["wbs_id"]},
-                    {"required": ["issue_number"]},
-                ],
-            },
-        ),
-        Tool(
-            name="get_hierarchy",
-            description="Get hierarchical view of work items (epic → features → tasks) with status rollup and progress calculation. Shows parent-child relationships with effort totals.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "root_wbs": {
-                        "type": "string",
-                        "description": "Optional root WBS ID to start from (e.g., 'WS-17001'). If not provided, shows all top-level epics.",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="validate_sync",
-            description="Validate work-items.yaml for consistency issues: missing parents, broken references, orphaned items, invalid statuses. Use this to check data quality.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
-        ),
-        Tool(
-            name="find_orphans",
-            description="Find orphan work items: features without epics, items without milestones, broken parent references. Use this to identify cleanup tasks.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
-        ),
-        Tool(
-            name="get_milestone_coverage",
-            description="Get progress summary by milestone: item counts, effort totals, completion percentage. Use this for milestone tracking and reporting.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "milestone_filter": {
-                        "type": "string",
-                        "description": "Optional milestone filter (partial match, e.g., 'M1')",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="update_work_item",
-            description="Update a work item in work-items.yaml. Can modify status, priority, milestone, assignees, dates, and other fields. Optionally syncs changes to GitHub Project.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "wbs_id": {
-                        "type": "string",
-                        "description": "WBS ID of the work item to update (e.g., 'WS-17101')",
-                    },
-                    "updates": {
-                        "type": "object",
-                        "description": "Dictionary of fields to update",
-                        "properties": {
-                            "status": {"type": "string", "description": "Status (e.g., 'To Do', 'In Progress', 'Done', 'Blocked')"},
-                            "priority": {"type": "string", "description": "Priority (🚨 Critical, 🟡 Medium, 🟢 Low)"},
-                            "milestone": {"type": "string", "description": "Milestone (e.g., 'M1.2: Logical Layer Integration')"},
-                            "assignees": {"type": "array", "items": {"type": "string"}, "description": "List of assignee usernames"},
-                            "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
-                            "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
-                            "effort_days": {"type": "number", "description": "Effort in days"},
-                            "description": {"type": "string", "description": "Full description"},
-                            "responsible_architect": {"type": "string", "description": "Responsible architect name"},
-                            "allow_yaml_override": {"type": "boolean", "description": "Whether to allow YAML overrides of GitHub data"},
-                        },
-                    },
-                    "push_to_github": {
-                        "type": "boolean",
-                        "description": "Whether to sync changes to GitHub Project (default: false)",
-                        "default": False,
-                    },
-                },
-                "required": ["wbs_id", "updates"],
-            },
-        ),
-        Tool(
-            name="list_pr_review_threads",
-            description="List unresolved review threads for a pull request. Auto-detects PR from current branch if pr_number not provided. Use this to see what review comments need addressing.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pr_number": {
-                        "type": "integer",
-                        "description": "PR number (optional - auto-detects from current branch)",
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="reply_to_review_thread",
-            description="Add a reply comment to a review thread. Use this to respond to reviewer feedback with explanations of fixes made.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "thread_id": {
-                        "type": "string",
-                        "description": "Review thread ID (from list_pr_review_threads)",
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Reply text (supports markdown)",
-                    },
-                },
-                "required": ["thread_id", "body"],
-            },
-        ),
-        Tool(
-            name="resolve_review_thread",
-            description="Mark a review thread as resolved. Use after addressing the feedback and replying to the thread.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "thread_id": {
-                        "type": "string",
-                        "description": "Review thread ID (from list_pr_review_threads)",
-                    },
-                },
-                "required": ["thread_id"],
-            },
-        ),
-    ]
+    return registry.list_tools()
 
 
 @app.call_tool()  # type: ignore[untyped-decorator]
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """Handle tool calls."""
+    """Handle tool calls.
+    
+    Handlers run in the worker pool so YAML parsing, file writes and GitHub
+    requests never block the event loop (and other clients' requests). A
+    cancelled call stops at its next cancellation check.
+    """
     try:
-        data_loader = get_loader()
-        
-        if name == "list_work_items":
-            return await handle_list_work_items(data_loader, arguments)
-        elif name == "get_work_item":
-            return await handle_get_work_item(data_loader, arguments)
-        elif name == "get_hierarchy":
-            return await handle_get_hierarchy(data_loader, arguments)
-        elif name == "validate_sync":
-            return await handle_validate_sync(data_loader, arguments)
-        elif name == "find_orphans":
-            return await handle_find_orphans(data_loader, arguments)
-        elif name == "get_milestone_coverage":
-            return await handle_get_milestone_coverage(data_loader, arguments)
-        elif name == "update_work_item":
-            return await handle_update_work_item(data_loader, arguments)
-        elif name == "list_pr_review_threads":
-            return await handle_list_pr_review_threads(arguments)
-        elif name == "reply_to_review_thread":
-            return await handle_reply_to_review_thread(arguments)
-        elif name == "resolve_review_thread":
-            return await handle_resolve_review_thread(arguments)
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        if warmup is not None and not warmup.done():
+            # Reuse the startup load instead of parsing in parallel with it
+            # (shielded: a cancelled request must not cancel the warm-up)
+            await asyncio.shield(asyncio.wrap_future(warmup))
+        with metrics.time("wbs_tool_call_seconds", tool=name):
+            result = await run_blocking(dispatch_tool, name, arguments)
+        metrics.inc("wbs_tool_calls_total", tool=name, outcome="ok")
+        return result
     
+    except asyncio.CancelledError:
+        metrics.inc("wbs_tool_calls_total", tool=name, outcome="cancelled")
+        raise
     except Exception as e:
+        metrics.inc("wbs_tool_calls_total", tool=name, outcome="error")
         logger.error(f"Error handling tool call {name}: {e}", exc_info=True)
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_list_work_items(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+def dispatch_tool(name: str, arguments: Any) -> list[TextContent]:
+    """Run a tool handler (blocking; called from the worker pool).
+    
+    Read-only tool responses are served from the response cache while the
+    work items snapshot is unchanged. Profiled calls (``profile`` argument
+    or WBS_PROFILE) bypass the cache and report where their profile was
+    written.
+    """
+    spec = registry.get(name)
+    if spec is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    
+    data_loader = get_loader()
+    
+    requested = False
+    if arguments and "profile" in arguments:
+        arguments = dict(arguments)
+        requested = bool(arguments.pop("profile"))
+    if not should_profile(name, requested):
+        return run_tool(spec, data_loader, arguments)
+    
+    result, artifact = profile_call(
+        name, arguments,
+        lambda: run_tool(spec, data_loader, arguments, use_cache=False),
+        lambda: data_loader.content_hash,
+    )
+    written = [
+        str(path) for suffix in (".pstats", ".collapsed.txt")
+        if (path := artifact.with_name(artifact.name + suffix)).exists()
+    ]
+    note = f"🔬 Profile: {', '.join(written) or 'not written (see server log)'}"
+    return [*result, TextContent(type="text", text=note)]
+
+
+def run_tool(
+    spec: ToolSpec, data_loader: WorkItemsLoader, arguments: Any, use_cache: bool = True
+) -> list[TextContent]:
+    """Run a tool's handler, through the response cache if it is cacheable."""
+    name = spec.name
+    if not spec.cacheable:
+        try:
+            with metrics.time("wbs_tool_handler_seconds", tool=name):
+                return spec.handler(data_loader, arguments)
+        finally:
+            if spec.writes:
+                response_cache.clear()
+    
+    # Picks up external file changes, which bump the snapshot version
+    data_loader.load()
+    key = response_cache.make_key(name, arguments, data_loader.version)
+    cached = response_cache.get(key) if use_cache else None
+    if cached is not None:
+        metrics.inc("wbs_response_cache_requests_total", tool=name, result="hit")
+        return cached
+    metrics.inc("wbs_response_cache_requests_total", tool=name, result="miss")
+    with metrics.time("wbs_tool_handler_seconds", tool=name):
+        result = spec.handler(data_loader, arguments)
+    response_cache.put(key, result)
+    return result
+
+
+def collect_cache_metrics() -> list[tuple[str, dict[str, str], float]]:
+    """Response cache gauges for the metrics registry."""
+    return [
+        ("wbs_response_cache_entries", {}, len(response_cache)),
+        ("wbs_response_cache_bytes", {}, response_cache.size),
+        ("wbs_response_cache_hits", {}, response_cache.hits),
+        ("wbs_response_cache_misses", {}, response_cache.misses),
+    ]
+
+
+metrics.register_collector(collect_cache_metrics)
+
+
+@registry.tool(
+    name="list_work_items",
+    description="List and filter work items from work-items.yaml. Returns items matching the specified criteria. Use this to explore the backlog, find items by status, type, milestone, or work stream.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "status": {
+                "type": "string",
+                "description": "Filter by status (e.g., 'Todo', 'In Progress', 'Done', 'Blocked')",
+            },
+            "wbs_type": {
+                "type": "string",
+                "description": "Filter by type (e.g., 'Epic', 'Feature', 'Task')",
+            },
+            "milestone": {
+                "type": "string",
+                "description": "Filter by milestone (partial match, e.g., 'M1.1')",
+            },
+            "work_stream": {
+                "type": "string",
+                "description": "Filter by work stream (partial match, e.g., 'WS1', 'Repository')",
+            },
+            "parent_wbs": {
+                "type": "string",
+                "description": "Filter by parent WBS ID (e.g., 'WS-11100' for all features under that epic)",
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of results to return (default: 50)",
+                "default": 50,
+            },
+        },
+    },
+    cacheable=True,
+)
+def handle_list_work_items(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
     """Handle list_work_items tool call."""
     status = args.get("status")
     wbs_type = args.get("wbs_type")
@@ -393,7 +364,29 @@ async def handle_list_work_items(loader: WorkItemsLoader, args: dict[str, Any])
     return [TextContent(type="text", text="\n".join(lines))]
 
 
-async def handle_get_work_item(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+@registry.tool(
+    name="get_work_item",
+    description="Get detailed information about a specific work item by WBS ID or GitHub issue number. Returns full description, relationships, and metadata.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "wbs_id": {
+                "type": "string",
+                "description": "WBS ID of the work item (e.g., 'WS-17101')",
+            },
+            "issue_number": {
+                "type": "integer",
+                "description": "GitHub issue number (alternative to wbs_id)",
+            },
+        },
+        "oneOf": [
+            {"required": ["wbs_id"]},
+            {"required": ["issue_number"]},
+        ],
+    },
+    cacheable=True,
+)
+def handle_get_work_item(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
     """Handle get_work_item tool call."""
     wbs_id = args.get("wbs_id")
     issue_number = args.get("issue_number")
@@ -417,11 +410,30 @@ async def handle_get_work_item(loader: WorkItemsLoader, args: dict[str, Any]) ->
         return [TextContent(type="text", text="Must provide either wbs_id or issue_number")]
     
     # Format detailed view
-    return [TextContent(type="text", text=format_work_item_detail(item))]
+    text = format_work_item_detail(item)
+    if loader.content_hash:
+        text += f"\n\n---\nSnapshot: {loader.content_hash[:16]} (pass as expected_hash when updating)"
+    return [TextContent(type="text", text=text)]
 
 
-async def handle_get_hierarchy(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+@registry.tool(
+    name="get_hierarchy",
+    description="Get hierarchical view of work items (epic → features → tasks) with status rollup and progress calculation. Shows parent-child relationships with effort totals.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "root_wbs": {
+                "type": "string",
+                "description": "Optional root WBS ID to start from (e.g., 'WS-17001'). If not provided, shows all top-level epics.",
+            },
+        },
+    },
+    cacheable=True,
+)
+def handle_get_hierarchy(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
     """Handle get_hierarchy tool call."""
+    from .tools.get_hierarchy import build_hierarchy, format_hierarchy
+    
     root_wbs = args.get("root_wbs")
     
     items = loader.load()
@@ -437,8 +449,19 @@ async def handle_get_hierarchy(loader: WorkItemsLoader, args: dict[str, Any]) ->
     return [TextContent(type="text", text=output)]
 
 
-async def handle_validate_sync(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+@registry.tool(
+    name="validate_sync",
+    description="Validate work-items.yaml for consistency issues: missing parents, broken references, orphaned items, invalid statuses. Use this to check data quality.",
+    input_schema={
+        "type": "object",
+        "properties": {},
+    },
+    cacheable=True,
+)
+def handle_validate_sync(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
     """Handle validate_sync tool call."""
+    from .tools.validate_sync import format_validation_result, validate_work_items
+    
     items = loader.load()
     result = validate_work_items(items)
     
@@ -446,8 +469,19 @@ async def handle_validate_sync(loader: WorkItemsLoader, args: dict[str, Any]) ->
     return [TextContent(type="text", text=output)]
 
 
-async def handle_find_orphans(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+@registry.tool(
+    name="find_orphans",
+    description="Find orphan work items: features without epics, items without milestones, broken parent references. Use this to identify cleanup tasks.",
+    input_schema={
+        "type": "object",
+        "properties": {},
+    },
+    cacheable=True,
+)
+def handle_find_orphans(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
     """Handle find_orphans tool call."""
+    from .tools.find_orphans import find_orphan_items, format_orphans
+    
     items = loader.load()
     orphans = find_orphan_items(items)
     
@@ -455,8 +489,27 @@ async def handle_find_orphans(loader: WorkItemsLoader, args: dict[str, Any]) ->
     return [TextContent(type="text", text=output)]
 
 
-async def handle_get_milestone_coverage(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+@registry.tool(
+    name="get_milestone_coverage",
+    description="Get progress summary by milestone: item counts, effort totals, completion percentage. Use this for milestone tracking and reporting.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "milestone_filter": {
+                "type": "string",
+                "description": "Optional milestone filter (partial match, e.g., 'M1')",
+            },
+        },
+    },
+    cacheable=True,
+)
+def handle_get_milestone_coverage(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
     """Handle get_milestone_coverage tool call."""
+    from .tools.get_milestone_coverage import (
+        calculate_milestone_progress,
+        format_milestone_progress,
+    )
+    
     milestone_filter = args.get("milestone_filter")
     
     items = loader.load()
@@ -466,11 +519,62 @@ async def handle_get_milestone_coverage(loader: WorkItemsLoader, args: dict[str,
     return [TextContent(type="text", text=output)]
 
 
-async def handle_update_work_item(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+@registry.tool(
+    name="update_work_item",
+    description="Update a work item in work-items.yaml. Can modify status, priority, milestone, assignees, dates, and other fields. Optionally syncs changes to GitHub Project.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "wbs_id": {
+                "type": "string",
+                "description": "WBS ID of the work item to update (e.g., 'WS-17101')",
+            },
+            "updates": {
+                "type": "object",
+                "description": "Dictionary of fields to update",
+                "properties": {
+                    "status": {"type": "string", "description": "Status (e.g., 'To Do', 'In Progress', 'Done', 'Blocked')"},
+                    "priority": {"type": "string", "description": "Priority (🚨 Critical, 🟡 Medium, 🟢 Low)"},
+                    "milestone": {"type": "string", "description": "Milestone (e.g., 'M1.2: Logical Layer Integration')"},
+                    "assignees": {"type": "array", "items": {"type": "string"}, "description": "List of assignee usernames"},
+                    "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+                    "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+                    "effort_days": {"type": "number", "description": "Effort in days"},
+                    "description": {"type": "string", "description": "Full description"},
+                    "responsible_architect": {"type": "string", "description": "Responsible architect name"},
+                    "allow_yaml_override": {"type": "boolean", "description": "Whether to allow YAML overrides of GitHub data"},
+                },
+            },
+            "push_to_github": {
+                "type": "boolean",
+                "description": "Whether to sync changes to GitHub Project (default: false)",
+                "default": False,
+            },
+            "expected_hash": {
+                "type": "string",
+                "minLength": 16,
+                "description": "Snapshot hash (or 16+ char prefix) from get_work_item. If the file changed since, the update is rejected or merged per on_conflict.",
+            },
+            "on_conflict": {
+                "type": "string",
+                "enum": ["reject", "merge"],
+                "description": "On snapshot mismatch: 'reject' (default) or 'merge' when the updated fields were not changed concurrently",
+                "default": "reject",
+            },
+        },
+        "required": ["wbs_id", "updates"],
+    },
+    writes=True,
+)
+def handle_update_work_item(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
     """Handle update_work_item tool call."""
+    from .tools.update_work_item import format_update_result, update_work_item
+    
     wbs_id = args.get("wbs_id")
     updates = args.get("updates", {})
     push_to_github = args.get("push_to_github", False)
+    expected_hash = args.get("expected_hash")
+    on_conflict = args.get("on_conflict", "reject")
     
     if not wbs_id:
         return [TextContent(type="text", text="❌ Error: wbs_id is required")]
@@ -478,24 +582,284 @@ async def handle_update_work_item(loader: WorkItemsLoader, args: dict[str, Any])
     if not updates:
         return [TextContent(type="text", text="❌ Error: updates dictionary is required")]
     
-    result = update_work_item(loader, wbs_id, updates, push_to_github)
+    outbox = get_outbox() if push_to_github else None
+    result = update_work_item(
+        loader, wbs_id, updates, push_to_github, expected_hash, on_conflict, write_queue, outbox
+    )
+    if "sync_ticket" in result and outbox_worker is not None:
+        outbox_worker.notify()
     output = format_update_result(result)
     
     return [TextContent(type="text", text=output)]
 
 
-async def handle_list_pr_review_threads(args: dict[str, Any]) -> list[TextContent]:
+@registry.tool(
+    name="create_work_items",
+    description="Bulk-create work items in work-items.yaml from JSON Lines or CSV (one item per line/row, columns named like work item fields). Rows are validated and checked for duplicate WBS IDs and issue numbers; valid rows are appended in one write and invalid rows are reported individually.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "data": {
+                "type": "string",
+                "description": "Inline JSON Lines or CSV text",
+            },
+            "path": {
+                "type": "string",
+                "description": "Path to a .jsonl or .csv file inside the workspace (alternative to data)",
+            },
+            "format": {
+                "type": "string",
+                "enum": ["jsonl", "csv"],
+                "description": "Input format (default: from file suffix, otherwise jsonl)",
+            },
+        },
+        "oneOf": [
+            {"required": ["data"]},
+            {"required": ["path"]},
+        ],
+    },
+    writes=True,
+)
+def handle_create_work_items(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+    """Handle create_work_items tool call."""
+    from .tools.create_work_items import create_work_items, format_create_result
+    
+    result = create_work_items(
+        loader,
+        data=args.get("data"),
+        path=args.get("path"),
+        fmt=args.get("format"),
+    )
+    output = format_create_result(result)
+    
+    return [TextContent(type="text", text=output)]
+
+
+@registry.tool(
+    name="flush_writes",
+    description="Write all queued work item updates to work-items.yaml now. Only relevant when write-behind mode (WBS_WRITE_BEHIND) is enabled; otherwise updates are already written immediately.",
+    input_schema={
+        "type": "object",
+        "properties": {},
+    },
+    writes=True,
+)
+def handle_flush_writes(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+    """Handle flush_writes tool call."""
+    from .tools.update_work_item import flush_writes, format_flush_result
+    
+    result = flush_writes(write_queue)
+    output = format_flush_result(result)
+    
+    return [TextContent(type="text", text=output)]
+
+
+@registry.tool(
+    name="pull_from_github",
+    description="Pull changes to mapped fields (Status and Priority by default, see WBS_GITHUB_FIELD_MAP) made in the GitHub Project into work-items.yaml. Only items updated on GitHub since their last sync are fetched; all changes are applied in one write. Items with allow_yaml_override keep their YAML values.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "dry_run": {
+                "type": "boolean",
+                "description": "Show the changes without writing them (default: false)",
+                "default": False
+            },
+            "full": {
+                "type": "boolean",
+                "description": "Compare every tracked item, ignoring sync watermarks (default: false)",
+                "default": False
+            }
+        },
+    },
+    writes=True,
+)
+def handle_pull_from_github(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+    """Handle pull_from_github tool call."""
+    from .tools.pull_from_github import format_pull_result, pull_from_github
+    
+    result = pull_from_github(
+        loader,
+        dry_run=args.get("dry_run", False),
+        full=args.get("full", False),
+        write_queue=write_queue,
+    )
+    output = format_pull_result(result)
+    
+    return [TextContent(type="text", text=output)]
+
+
+@registry.tool(
+    name="plan_github_sync",
+    description="Compare work-items.yaml with the GitHub Project and list only the mapped field updates GitHub actually needs. Dry run by default; set execute=true to push just those changes.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "wbs_ids": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Work items to check (default: all items)"
+            },
+            "execute": {
+                "type": "boolean",
+                "description": "Push the planned changes (default: false, dry run)",
+                "default": False
+            }
+        },
+    },
+    writes=True,
+)
+def handle_plan_github_sync(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+    """Handle plan_github_sync tool call."""
+    from .tools.plan_github_sync import format_plan_result, plan_github_sync
+    
+    result = plan_github_sync(
+        loader,
+        wbs_ids=args.get("wbs_ids"),
+        execute=args.get("execute", False),
+        write_queue=write_queue,
+    )
+    output = format_plan_result(result)
+    
+    return [TextContent(type="text", text=output)]
+
+
+@registry.tool(
+    name="get_sync_status",
+    description="Show queued GitHub pushes from update_work_item (push_to_github=true): counts of pending, in-progress, failed and done entries, recent entries with errors, or a single sync ticket.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "ticket": {
+                "type": "integer",
+                "description": "Sync ticket returned by update_work_item"
+            },
+            "status": {
+                "type": "string",
+                "enum": ["pending", "in_progress", "done", "failed"],
+                "description": "Only list entries with this status"
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum entries to list (default: 20)",
+                "default": 20
+            }
+        },
+    },
+)
+def handle_get_sync_status(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+    """Handle get_sync_status tool call."""
+    from .tools.get_sync_status import format_sync_status, get_sync_status
+    
+    if not outbox_enabled():
+        return [TextContent(
+            type="text",
+            text="ℹ️  Sync outbox is disabled (WBS_SYNC_OUTBOX=0); GitHub pushes run synchronously"
+        )]
+    outbox = get_outbox(create=False)
+    if outbox is None:
+        return [TextContent(type="text", text="ℹ️  No GitHub pushes have been queued yet")]
+    
+    result = get_sync_status(
+        outbox,
+        ticket=args.get("ticket"),
+        status=args.get("status"),
+        limit=args.get("limit", 20),
+    )
+    output = format_sync_status(result)
+    
+    return [TextContent(type="text", text=output)]
+
+
+@registry.tool(
+    name="server_stats",
+    description="Show server metrics: per-tool call counts and latency percentiles, response cache hit rates, work items load timings by phase (read, parse, validate, index), snapshot size, YAML write latencies and GitHub request counts and round-trip times.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "prefix": {
+                "type": "string",
+                "description": "Only metrics whose name starts with this (e.g. 'wbs_loader', 'wbs_github')"
+            },
+            "format": {
+                "type": "string",
+                "enum": ["text", "prometheus"],
+                "description": "Output format (default: text)",
+                "default": "text"
+            }
+        },
+    },
+)
+def handle_server_stats(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+    """Handle server_stats tool call."""
+    from .tools.server_stats import format_server_stats, server_stats
+    
+    result = server_stats(
+        prefix=args.get("prefix"),
+        prometheus=args.get("format") == "prometheus",
+    )
+    output = format_server_stats(result)
+    
+    return [TextContent(type="text", text=output)]
+
+
+@registry.tool(
+    name="list_pr_review_threads",
+    description="List unresolved review threads for a pull request. Auto-detects PR from current branch if pr_number not provided. Use this to see what review comments need addressing.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "pr_number": {
+                "type": "integer",
+                "description": "PR number (optional - auto-detects from current branch)",
+            },
+            "path": {
+                "type": "string",
+                "description": "Only threads on files matching this glob (e.g. 'wbs_mcp/tools/*')",
+            },
+            "author": {
+                "type": "string",
+                "description": "Only threads started by this GitHub login",
+            },
+        },
+    },
+)
+def handle_list_pr_review_threads(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
     """Handle list_pr_review_threads tool call."""
+    from .tools.pr_review_read import format_review_threads, list_pr_review_threads
+    
     pr_number = args.get("pr_number")
+    path = args.get("path")
+    author = args.get("author")
     
-    result = list_pr_review_threads(pr_number)
+    result = list_pr_review_threads(pr_number, path=path, author=author)
     output = format_review_threads(result)
     
     return [TextContent(type="text", text=output)]
 
 
-async def handle_reply_to_review_thread(args: dict[str, Any]) -> list[TextContent]:
+@registry.tool(
+    name="reply_to_review_thread",
+    description="Add a reply comment to a review thread. Use this to respond to reviewer feedback with explanations of fixes made.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "thread_id": {
+                "type": "string",
+                "description": "Review thread ID (from list_pr_review_threads)",
+            },
+            "body": {
+                "type": "string",
+                "description": "Reply text (supports markdown)",
+            },
+        },
+        "required": ["thread_id", "body"],
+    },
+)
+def handle_reply_to_review_thread(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
     """Handle reply_to_review_thread tool call."""
+    from .tools.pr_review_write import format_reply_result, reply_to_review_thread
+    
     thread_id = args.get("thread_id")
     body = args.get("body")
     
@@ -508,8 +872,24 @@ async def handle_reply_to_review_thread(args: dict[str, Any]) -> list[TextConten
     return [TextContent(type="text", text=output)]
 
 
-async def handle_resolve_review_thread(args: dict[str, Any]) -> list[TextContent]:
+@registry.tool(
+    name="resolve_review_thread",
+    description="Mark a review thread as resolved. Use after addressing the feedback and replying to the thread.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "thread_id": {
+                "type": "string",
+                "description": "Review thread ID (from list_pr_review_threads)",
+            },
+        },
+        "required": ["thread_id"],
+    },
+)
+def handle_resolve_review_thread(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
     """Handle resolve_review_thread tool call."""
+    from .tools.pr_review_write import format_resolve_result, resolve_review_thread
+    
     thread_id = args.get("thread_id")
     
     if not thread_id:
@@ -521,18 +901,139 @@ async def handle_resolve_review_thread(args: dict[str, Any]) -> list[TextContent
     return [TextContent(type="text", text=output)]
 
 
-async def async_main() -> None:
-    """Run the MCP server (async)."""
-    logger.info("Starting WBS MCP Server")
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+@registry.tool(
+    name="address_review_threads",
+    description="Reply to and/or resolve many review threads at once. Replies and resolves are sent as batched GraphQL mutations; a thread whose reply fails is not resolved. Returns per-thread outcomes.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "threads": {
+                "type": "array",
+                "description": "Threads to address",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "thread_id": {
+                            "type": "string",
+                            "description": "Review thread ID (from list_pr_review_threads)",
+                        },
+                        "body": {
+                            "type": "string",
+                            "description": "Reply text (optional)",
+                        },
+                        "resolve": {
+                            "type": "boolean",
+                            "description": "Resolve the thread (default: true)",
+                        },
+                    },
+                    "required": ["thread_id"],
+                },
+            },
+        },
+        "required": ["threads"],
+    },
+)
+def handle_address_review_threads(loader: WorkItemsLoader, args: dict[str, Any]) -> list[TextContent]:
+    """Handle address_review_threads tool call."""
+    from .tools.pr_review_write import address_review_threads, format_address_result
+    
+    threads = args.get("threads")
+    
+    if not threads:
+        return [TextContent(type="text", text="❌ Error: threads is required")]
+    
+    result = address_review_threads(threads)
+    output = format_address_result(result)
+    
+    return [TextContent(type="text", text=output)]
+
+
+def warm_up() -> None:
+    """Load, validate and index the work items before the first request.
+    
+    Also renders the tools listed in WBS_PREWARM_TOOLS (comma-separated,
+    e.g. "get_hierarchy,validate_sync") with default arguments into the
+    response cache. Failures are logged; the first request reports them.
+    """
+    try:
+        get_loader().load()
+        for name in filter(None, (t.strip() for t in os.environ.get("WBS_PREWARM_TOOLS", "").split(","))):
+            spec = registry.get(name)
+            if spec is None or not spec.cacheable:
+                logger.warning(f"Not pre-warming {name}: not a cacheable tool")
+                continue
+            dispatch_tool(name, {})
+        logger.info("Warm-up complete")
+    except Exception as e:
+        logger.error(f"Warm-up failed: {e}")
+
+
+def resume_outbox() -> None:
+    """Start the outbox worker if a previous run left pushes to send.
+    
+    Otherwise nothing is created or started here: the first push_to_github
+    creates the outbox and its worker.
+    """
+    if not outbox_enabled():
+        return
+    try:
+        from .outbox import default_outbox_path, has_unfinished_entries
+        if has_unfinished_entries(default_outbox_path()):
+            get_outbox()
+    except Exception as e:
+        logger.error(f"Failed to start GitHub sync outbox: {e}")
+
+
+async def async_main(transport: str = "stdio", host: str | None = None, port: int | None = None) -> None:
+    """Run the MCP server (async).
+
+    Args:
+        transport: "stdio" for a single client, or "http" to serve many
+            clients over streamable HTTP from one shared snapshot and cache
+        host: HTTP bind address (default: WBS_HTTP_HOST or 127.0.0.1)
+        port: HTTP port (default: WBS_HTTP_PORT or 8765)
+    """
+    global warmup
+    logger.info(f"Starting WBS MCP Server ({transport})")
+    # Parse the backlog while the client runs the initialize handshake
+    if os.environ.get("WBS_PREWARM", "1").lower() not in ("0", "false", "no"):
+        warmup = get_executor().submit(warm_up)
+    # Resume pushes left in the outbox by a previous run, off the startup path
+    get_executor().submit(resume_outbox)
+    metrics_file = None
+    if os.environ.get("WBS_METRICS_FILE"):
+        metrics_file = MetricsFileWriter(Path(os.environ["WBS_METRICS_FILE"]))
+    try:
+        if transport == "http":
+            from .http_transport import DEFAULT_HOST, DEFAULT_PORT, serve_http
+            await serve_http(app, host or DEFAULT_HOST, port or DEFAULT_PORT)
+        else:
+            async with stdio_server() as (read_stream, write_stream):
+                await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        # Don't lose queued updates when the client disconnects
+        if write_queue is not None:
+            write_queue.close()
+        if outbox_worker is not None:
+            outbox_worker.stop()
+        if metrics_file is not None:
+            metrics_file.stop()
+        shutdown_executor()
 
 
 def main() -> None:
     """Entry point for the MCP server (sync wrapper)."""
-    import asyncio
-    asyncio.run(async_main())
+    import argparse
 
+    parser = argparse.ArgumentParser(prog="wbs-mcp", description="WBS MCP server")
+    parser.add_argument(
+        "--transport", choices=("stdio", "http"), default=os.environ.get("WBS_TRANSPORT", "stdio"),
+        help="stdio (one client per process) or http (streamable HTTP, many clients)",
+    )
+    parser.add_argument("--host", help="HTTP bind address (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, help="HTTP port (default 8765)")
+    args = parser.parse_args()
+    asyncio.run(async_main(args.transport, args.host, args.port))
 
 if __name__ == "__main__":
     main()
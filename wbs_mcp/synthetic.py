@@ -0,0 +1,209 @@
+"""Seeded generator of realistic synthetic backlogs for benchmarks.
+
+Backlogs are trees of Epics, Features and Tasks with configurable depth,
+fan-out, description sizes and milestone distribution. The same seed and
+options always produce the same file. ``python -m wbs_mcp.synthetic OUT
+--items 100000`` writes one to disk.
+
+Files are written directly rather than through a YAML emitter, so a
+million items take seconds rather than minutes.
+"""
+
+import argparse
+import json
+import logging
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+STATUSES = ("Done", "In Progress", "Todo", "Blocked")
+STATUS_WEIGHTS = (40, 20, 35, 5)
+PRIORITIES = ("🚨 Critical", "🔥 High", "🟡 Medium", "🟢 Low")
+PRIORITY_WEIGHTS = (5, 20, 50, 25)
+
+_WORDS = (
+    "implement add refactor validate sync parse render cache index query "
+    "milestone backlog hierarchy schema workflow endpoint pipeline migration "
+    "report dashboard review integration deployment config error handling "
+    "performance storage client server api token permission audit export "
+    "import batch update status priority owner timeline dependency release"
+).split()
+
+
+@dataclass(frozen=True)
+class BacklogSpec:
+    """Shape of a synthetic backlog.
+
+    Attributes:
+        items: Total number of work items
+        seed: Random seed
+        depth: Levels per tree (1: Epics only, 2: + Features, 3+: + Tasks)
+        fan_out: Mean children per item; actual counts vary ±50%
+        description_words: (min, max) words per description
+        milestones: Number of distinct milestones
+        milestone_skew: Zipf exponent of milestone popularity (0: uniform)
+        unassigned_ratio: Fraction of items without a milestone
+        work_streams: Number of distinct work streams
+    """
+
+    items: int = 1000
+    seed: int = 0
+    depth: int = 3
+    fan_out: int = 8
+    description_words: tuple[int, int] = (5, 60)
+    milestones: int = 8
+    milestone_skew: float = 1.0
+    unassigned_ratio: float = 0.05
+    work_streams: int = 6
+
+
+def generate_items(spec: BacklogSpec) -> Iterator[Dict[str, Any]]:
+    """Generate work item dictionaries, parents before children.
+
+    Trees are generated depth-first one Epic at a time until the item
+    count is reached, so the last tree may be partial.
+
+    Args:
+        spec: Backlog shape
+
+    Yields:
+        Work item dictionaries as they appear in work-items.yaml
+    """
+    rng = random.Random(spec.seed)
+    milestones = [f"M{i // 3 + 1}.{i % 3 + 1} Milestone {i + 1}" for i in range(spec.milestones)]
+    milestone_weights = [1 / (rank + 1) ** spec.milestone_skew for rank in range(spec.milestones)]
+    streams = [f"WS{i + 1}-Stream" for i in range(spec.work_streams)]
+    min_children = max(1, spec.fan_out // 2)
+    max_children = max(min_children, spec.fan_out + spec.fan_out // 2)
+    width = len(str(max_children))
+    counter = 0
+
+    def milestone(parent: Optional[str]) -> Optional[str]:
+        # Children mostly stay in their parent's milestone
+        if parent is not None and rng.random() < 0.8:
+            return parent
+        if rng.random() < spec.unassigned_ratio:
+            return None
+        return rng.choices(milestones, milestone_weights)[0]
+
+    def make(level: int, wbs_id: str, parent: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        nonlocal counter
+        counter += 1
+        wbs_type = ("Epic", "Feature")[level] if level < 2 else "Task"
+        status = rng.choices(STATUSES, STATUS_WEIGHTS)[0]
+        item: Dict[str, Any] = {
+            "issue_number": counter,
+            "wbs_id": wbs_id,
+            "wbs_type": wbs_type,
+            "title": f"{rng.choice(_WORDS).capitalize()} {rng.choice(_WORDS)} {rng.choice(_WORDS)} ({wbs_id})",
+            "status": status,
+            "priority": rng.choices(PRIORITIES, PRIORITY_WEIGHTS)[0],
+            "effort_days": round(rng.uniform(0.5, 5.0) * (3 - min(level, 2)), 1),
+            "work_stream": parent["work_stream"] if parent else rng.choice(streams),
+        }
+        if parent is not None:
+            item["wbs_parent"] = parent["wbs_id"]
+            item["issue_parent"] = parent["issue_number"]
+        item_milestone = milestone(parent.get("milestone") if parent else None)
+        if item_milestone:
+            item["milestone"] = item_milestone
+        if status != "Todo":
+            month, day = rng.randint(1, 12), rng.randint(1, 28)
+            item["start_date"] = f"2026-{month:02d}-{day:02d}"
+            if status == "Done":
+                item["end_date"] = f"2026-{month:02d}-{min(28, day + rng.randint(0, 10)):02d}"
+        words = rng.randint(*spec.description_words)
+        item["description"] = " ".join(rng.choice(_WORDS) for _ in range(words))
+        return item
+
+    def tree(level: int, wbs_id: str, parent: Optional[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        item = make(level, wbs_id, parent)
+        yield item
+        if level + 1 >= spec.depth:
+            return
+        for child in range(1, rng.randint(min_children, max_children) + 1):
+            if counter >= spec.items:
+                return
+            yield from tree(level + 1, f"{wbs_id}-{child:0{width}d}", item)
+
+    epic = 0
+    while counter < spec.items:
+        epic += 1
+        yield from tree(0, f"WS-{epic:05d}", None)
+
+
+def write_backlog(path: Path, spec: BacklogSpec) -> int:
+    """Write a synthetic work-items.yaml.
+
+    Args:
+        path: Output file
+        spec: Backlog shape
+
+    Returns:
+        Number of items written
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"# Synthetic backlog: {spec}\nwork_items:\n")
+        for item in generate_items(spec):
+            _write_item(f, item)
+            count += 1
+    logger.info(f"Wrote {count} synthetic work items to {path}")
+    return count
+
+
+def _write_item(f: TextIO, item: Dict[str, Any]) -> None:
+    """Write one item in the layout of hand-written work-items.yaml files."""
+    first = True
+    for key, value in item.items():
+        prefix = "  - " if first else "    "
+        first = False
+        if key == "description":
+            # Literal block wrapped at 12 words per line, like real descriptions
+            words = value.split()
+            lines = [" ".join(words[i:i + 12]) for i in range(0, len(words), 12)]
+            f.write(f"{prefix}description: |\n")
+            f.writelines(f"      {line}\n" for line in lines)
+        elif isinstance(value, str):
+            # JSON strings are valid double-quoted YAML scalars
+            f.write(f"{prefix}{key}: {json.dumps(value, ensure_ascii=False)}\n")
+        else:
+            f.write(f"{prefix}{key}: {value}\n")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point for the generator."""
+    defaults = BacklogSpec()
+    parser = argparse.ArgumentParser(description="Generate a synthetic work-items.yaml")
+    parser.add_argument("output", type=Path, help="File to write")
+    parser.add_argument("--items", type=int, default=defaults.items)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--depth", type=int, default=defaults.depth)
+    parser.add_argument("--fan-out", type=int, default=defaults.fan_out)
+    parser.add_argument("--description-words", type=int, nargs=2, default=defaults.description_words,
+                        metavar=("MIN", "MAX"))
+    parser.add_argument("--milestones", type=int, default=defaults.milestones)
+    parser.add_argument("--milestone-skew", type=float, default=defaults.milestone_skew)
+    parser.add_argument("--unassigned-ratio", type=float, default=defaults.unassigned_ratio)
+    parser.add_argument("--work-streams", type=int, default=defaults.work_streams)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    write_backlog(args.output, BacklogSpec(
+        items=args.items,
+        seed=args.seed,
+        depth=args.depth,
+        fan_out=args.fan_out,
+        description_words=tuple(args.description_words),
+        milestones=args.milestones,
+        milestone_skew=args.milestone_skew,
+        unassigned_ratio=args.unassigned_ratio,
+        work_streams=args.work_streams,
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Registry of MCP tools: schema, handler and caching behaviour in one place."""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from mcp.types import TextContent, Tool
+
+from .data_loader import WorkItemsLoader
+
+Handler = Callable[[WorkItemsLoader, Dict[str, Any]], List[TextContent]]
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """A registered tool.
+
+    Attributes:
+        name: Tool name
+        description: Description shown to the client
+        input_schema: JSON schema of the arguments
+        handler: Called with the loader and arguments; imports the tool's
+            implementation on first use
+        cacheable: Output depends only on arguments and the work items snapshot
+        writes: May change the work items
+    """
+
+    name: str
+    description: str
+    input_schema: Dict[str, Any]
+    handler: Handler
+    cacheable: bool = False
+    writes: bool = False
+
+
+class ToolRegistry:
+    """Tools by name, with the list_tools response built once."""
+
+    def __init__(self, common_properties: Optional[Dict[str, Any]] = None) -> None:
+        """Initialize the registry.
+
+        Args:
+            common_properties: Schema properties added to every tool's
+                arguments in list_tools (handled by the dispatcher)
+        """
+        self.common_properties = common_properties or {}
+        self._specs: Dict[str, ToolSpec] = {}
+        self._tools: Optional[List[Tool]] = None
+
+    def tool(
+        self,
+        name: str,
+        description: str,
+        input_schema: Dict[str, Any],
+        cacheable: bool = False,
+        writes: bool = False,
+    ) -> Callable[[Handler], Handler]:
+        """Decorator registering a handler under a tool name.
+
+        Raises:
+            ValueError: If the name is already registered
+        """
+        def register(handler: Handler) -> Handler:
+            if name in self._specs:
+                raise ValueError(f"Tool already registered: {name}")
+            self._specs[name] = ToolSpec(name, description, input_schema, handler, cacheable, writes)
+            self._tools = None
+            return handler
+        return register
+
+    def get(self, name: str) -> Optional[ToolSpec]:
+        """Look up a tool by name."""
+        return self._specs.get(name)
+
+    def list_tools(self) -> List[Tool]:
+        """MCP tool definitions in registration order (built on first call)."""
+        if self._tools is None:
+            self._tools = [
+                Tool(name=spec.name, description=spec.description, inputSchema=self._schema(spec))
+                for spec in self._specs.values()
+            ]
+        return self._tools
+
+    def _schema(self, spec: ToolSpec) -> Dict[str, Any]:
+        """Input schema of a tool including the common properties."""
+        if not self.common_properties:
+            return spec.input_schema
+        properties = {**spec.input_schema.get("properties", {}), **self.common_properties}
+        return {**spec.input_schema, "properties": properties}
+
+    def __iter__(self) -> Iterator[ToolSpec]:
+        return iter(self._specs.values())
+
+    def __len__(self) -> int:
+        return len(self._specs)
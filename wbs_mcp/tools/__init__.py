@@ -1,9 +1,25 @@
-"""Tool implementations for MCP server."""
+"""Tool implementations for MCP server.
 
-from .get_hierarchy import build_hierarchy
-from .validate_sync import validate_work_items
-from .find_orphans import find_orphan_items
-from .get_milestone_coverage import calculate_milestone_progress
+Submodules are imported on first attribute access, so importing the
+package (or one tool module) doesn't load every tool.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .find_orphans import find_orphan_items
+    from .get_hierarchy import build_hierarchy
+    from .get_milestone_coverage import calculate_milestone_progress
+    from .validate_sync import validate_work_items
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "build_hierarchy": "get_hierarchy",
+    "validate_work_items": "validate_sync",
+    "find_orphan_items": "find_orphans",
+    "calculate_milestone_progress": "get_milestone_coverage",
+}
 
 __all__ = [
     "build_hierarchy",
@@ -11,3 +27,13 @@ __all__ = [
     "find_orphan_items",
     "calculate_milestone_progress",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining an exported name on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
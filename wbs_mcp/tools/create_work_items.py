@@ -0,0 +1,260 @@
+"""Bulk creation of work items from JSON Lines or CSV input."""
+
+import csv
+import io
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from pydantic import ValidationError
+
+from ..data_loader import WorkItemsLoader, find_workspace_root
+from ..models import WorkItem
+from ..yaml_writer import WorkItemWriter
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of row errors to display
+MAX_ERRORS_DISPLAYED = 50
+
+SUPPORTED_FORMATS = ("jsonl", "csv")
+
+
+def create_work_items(
+    loader: WorkItemsLoader,
+    data: Optional[str] = None,
+    path: Optional[str] = None,
+    fmt: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Import new work items into work-items.yaml.
+
+    Rows are streamed from the input, validated against WorkItem and checked
+    for duplicate WBS IDs and issue numbers, both against the existing
+    backlog and within the import. Valid rows are appended in a single write;
+    invalid rows are reported without stopping the import.
+
+    Args:
+        loader: Data loader instance
+        data: Inline JSON Lines or CSV text
+        path: Path to a .jsonl/.json or .csv file inside the workspace
+            (alternative to data); relative paths are resolved against the
+            workspace root
+        fmt: 'jsonl' or 'csv' (default: inferred from path suffix, else jsonl)
+
+    Returns:
+        Result dictionary with created WBS IDs and per-row errors
+    """
+    if (data is None) == (path is None):
+        return {"success": False, "error": "Provide exactly one of data or path"}
+
+    if fmt is None:
+        fmt = "csv" if path and Path(path).suffix.lower() == ".csv" else "jsonl"
+    if fmt not in SUPPORTED_FORMATS:
+        return {
+            "success": False,
+            "error": f"Unsupported format '{fmt}' (must be one of: {', '.join(SUPPORTED_FORMATS)})"
+        }
+
+    try:
+        source = _resolve_source_path(loader, path) if path is not None else None
+        loader.load()
+
+        valid: List[Tuple[int, WorkItem]] = []
+        errors: List[Dict[str, Any]] = []
+        seen_wbs_ids: set[str] = set()
+        seen_issue_numbers: set[int] = set()
+        total_rows = 0
+
+        with _open_source(data, source) as stream:
+            for row_number, row in _iter_rows(stream, fmt):
+                total_rows += 1
+                wbs_id = row.get("wbs_id") if isinstance(row, dict) else None
+
+                try:
+                    item = _validate_row(row)
+                except ValueError as e:
+                    errors.append({"row": row_number, "wbs_id": wbs_id, "error": str(e)})
+                    continue
+
+                # Index lookups against the snapshot loaded above
+                if item.wbs_id in seen_wbs_ids or loader.cached_item(item.wbs_id):
+                    error = f"Duplicate WBS ID: {item.wbs_id}"
+                elif (
+                    item.issue_number in seen_issue_numbers
+                    or loader.cached_item_by_issue_number(item.issue_number)
+                ):
+                    error = f"Duplicate issue number: #{item.issue_number}"
+                else:
+                    seen_wbs_ids.add(item.wbs_id)
+                    seen_issue_numbers.add(item.issue_number)
+                    valid.append((row_number, item))
+                    continue
+
+                errors.append({"row": row_number, "wbs_id": item.wbs_id, "error": error})
+
+        created: List[str] = []
+        if valid:
+            writer = WorkItemWriter(loader.yaml_path)
+            skipped = set(writer.append_work_items([item for _, item in valid]))
+
+            appended = []
+            for row_number, item in valid:
+                if item.wbs_id in skipped:
+                    errors.append({
+                        "row": row_number,
+                        "wbs_id": item.wbs_id,
+                        "error": "Duplicate added concurrently by another writer"
+                    })
+                else:
+                    appended.append(item)
+
+            if appended:
+                # Write-through: add the new items without re-parsing the file
+                loader.apply_updates(
+                    appended, writer.file_identity, writer.content_hash, writer.base_hash
+                )
+            created = [item.wbs_id for item in appended]
+
+        errors.sort(key=lambda e: e["row"])
+        return {
+            "success": True,
+            "total_rows": total_rows,
+            "created": created,
+            "errors": errors
+        }
+
+    except (OSError, ValueError) as e:
+        return {"success": False, "error": str(e)}
+    except Exception as e:
+        logger.error(f"Unexpected error importing work items: {e}")
+        return {"success": False, "error": f"Unexpected error: {str(e)}"}
+
+
+def _resolve_source_path(loader: WorkItemsLoader, path: str) -> Path:
+    """Resolve an import path, rejecting files outside the workspace.
+
+    The workspace is the git repository containing work-items.yaml, or its
+    directory outside a repository. Symlinks are resolved before the check,
+    so they can't point the import elsewhere.
+
+    Raises:
+        ValueError: If the path resolves outside the workspace
+    """
+    yaml_dir = loader.yaml_path.resolve().parent
+    root = find_workspace_root(yaml_dir) or yaml_dir
+    resolved = (root / path).resolve()
+    if not resolved.is_relative_to(root):
+        raise ValueError(f"Import path must be inside the workspace ({root}): {path}")
+    return resolved
+
+
+def _open_source(data: Optional[str], path: Optional[Path]) -> TextIO:
+    """Open the import source as a text stream."""
+    if path is not None:
+        return open(path, "r", encoding="utf-8", newline="")
+    return io.StringIO(data or "", newline="")
+
+
+def _iter_rows(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Any]]:
+    """Yield (row number, raw row) pairs from the stream without reading it all.
+
+    Row numbers are line numbers for JSON Lines and record numbers (header
+    is row 1) for CSV. Malformed JSON lines are yielded as the raw text so
+    they can be reported like any other invalid row.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row_number, row in enumerate(reader, start=2):
+            yield row_number, _from_csv(row)
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, f"Invalid JSON: {e}"
+
+
+def _from_csv(row: Dict[str, Any]) -> Any:
+    """Convert a CSV record into WorkItem keyword arguments.
+
+    Empty cells mean "not set", and assignees are separated by ';' or ','.
+    Returns an error string for records that don't fit the header.
+    """
+    if None in row:
+        return "Row has more cells than the header"
+
+    values: Dict[str, Any] = {}
+    for key, value in row.items():
+        if value is None or value.strip() == "":
+            continue
+        value = value.strip()
+        if key == "assignees":
+            values[key] = [a.strip() for a in value.replace(";", ",").split(",") if a.strip()]
+        else:
+            values[key] = value
+    return values
+
+
+def _validate_row(row: Any) -> WorkItem:
+    """Validate a raw row as a WorkItem.
+
+    Raises:
+        ValueError: With a compact description of what is wrong
+    """
+    if isinstance(row, str):
+        raise ValueError(row)
+    if not isinstance(row, dict):
+        raise ValueError("Row must be an object")
+
+    unknown = set(row) - set(WorkItem.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    try:
+        return WorkItem(**row)
+    except ValidationError as e:
+        problems = [
+            f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+        ]
+        raise ValueError("; ".join(problems)) from None
+
+
+def format_create_result(result: Dict[str, Any]) -> str:
+    """Format import result as human-readable text.
+
+    Args:
+        result: Result dictionary from create_work_items
+
+    Returns:
+        Formatted text output
+    """
+    if not result["success"]:
+        return f"❌ Import failed: {result['error']}"
+
+    created = result["created"]
+    errors = result["errors"]
+    icon = "✅" if not errors else "⚠️ "
+    lines = [
+        f"{icon} Imported {len(created)} of {result['total_rows']} row(s)",
+    ]
+
+    if created:
+        preview = ", ".join(created[:20])
+        more = f" (+{len(created) - 20} more)" if len(created) > 20 else ""
+        lines.append(f"   Created: {preview}{more}")
+
+    if errors:
+        lines.extend(["", f"**Rejected rows ({len(errors)})**:"])
+        for error in errors[:MAX_ERRORS_DISPLAYED]:
+            label = f" {error['wbs_id']}" if error.get("wbs_id") else ""
+            lines.append(f"- Row {error['row']}{label}: {error['error']}")
+        if len(errors) > MAX_ERRORS_DISPLAYED:
+            lines.append(f"- ... {len(errors) - MAX_ERRORS_DISPLAYED} more")
+
+    return "\n".join(lines)
@@ -0,0 +1,85 @@
+"""Status of queued GitHub pushes in the sync outbox."""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..outbox import STATUSES, SyncOutbox
+
+logger = logging.getLogger(__name__)
+
+
+def get_sync_status(
+    outbox: SyncOutbox,
+    ticket: Optional[int] = None,
+    status: Optional[str] = None,
+    limit: int = 20,
+) -> Dict[str, Any]:
+    """
+    Report on queued GitHub pushes.
+
+    Args:
+        outbox: Sync outbox
+        ticket: Report a single entry by its ticket number
+        status: Only list entries with this status
+        limit: Maximum number of entries to list
+
+    Returns:
+        Result dictionary with status counts and entries
+    """
+    if status is not None and status not in STATUSES:
+        return {
+            "success": False,
+            "error": f"Invalid status '{status}' (must be one of: {', '.join(STATUSES)})"
+        }
+
+    try:
+        if ticket is not None:
+            entry = outbox.get(ticket)
+            if entry is None:
+                return {"success": False, "error": f"Sync ticket not found: {ticket}"}
+            entries = [entry]
+        else:
+            entries = outbox.recent(status, limit)
+        return {"success": True, "counts": outbox.counts(), "entries": entries}
+    except Exception as e:
+        logger.error(f"Failed to read sync outbox: {e}")
+        return {"success": False, "error": str(e)}
+
+
+def format_sync_status(result: Dict[str, Any]) -> str:
+    """Format sync status as human-readable text.
+
+    Args:
+        result: Result dictionary from get_sync_status
+
+    Returns:
+        Formatted text output
+    """
+    if not result["success"]:
+        return f"❌ Sync status unavailable: {result['error']}"
+
+    counts = result["counts"]
+    lines = [
+        "# GitHub Sync Outbox",
+        "",
+        f"Pending: {counts['pending']} | In progress: {counts['in_progress']} | "
+        f"Failed: {counts['failed']} | Done: {counts['done']}",
+    ]
+
+    icons = {"pending": "⏳", "in_progress": "🔄", "done": "✅", "failed": "❌"}
+    if result["entries"]:
+        lines.append("")
+    for entry in result["entries"]:
+        fields = ", ".join(f"{k}={v}" for k, v in entry["updates"].items())
+        updated = datetime.fromtimestamp(entry["updated_at"]).strftime("%Y-%m-%d %H:%M:%S")
+        line = (
+            f"{icons[entry['status']]} Ticket {entry['id']}: {entry['wbs_id']} "
+            f"(#{entry['issue_number']}) {fields} — {entry['status']}, "
+            f"{entry['attempts']} attempt(s), {updated}"
+        )
+        if entry["last_error"]:
+            line += f"\n   {entry['last_error']}"
+        lines.append(line)
+
+    return "\n".join(lines)
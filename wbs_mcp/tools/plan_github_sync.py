@@ -0,0 +1,139 @@
+"""Minimal-diff push of work item fields to GitHub Projects."""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from ..data_loader import WorkItemsLoader
+from ..github_sync import FIELD_MAPPING, GitHubProjectSync
+from ..graphql_client import GraphQLError
+from ..write_queue import WriteQueue
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of planned changes to display
+MAX_CHANGES_DISPLAYED = 50
+
+
+def plan_github_sync(
+    loader: WorkItemsLoader,
+    wbs_ids: Optional[List[str]] = None,
+    execute: bool = False,
+    write_queue: Optional[WriteQueue] = None,
+    sync: Optional[GitHubProjectSync] = None,
+) -> Dict[str, Any]:
+    """
+    Plan (and optionally push) the GitHub field updates needed to match the YAML.
+
+    Current project field values are fetched in bulk and compared with the
+    YAML, so only fields that differ are mutated. Runs its own event loop
+    when executing, so call it from a worker thread, not from async code.
+
+    Args:
+        loader: Data loader instance
+        wbs_ids: Work items to consider (default: all items)
+        execute: Push the planned changes instead of only reporting them
+        write_queue: Write-behind queue to flush before planning
+        sync: GitHub sync client (default: new client)
+
+    Returns:
+        Result dictionary with planned changes and, when executed, outcomes
+    """
+    try:
+        if write_queue is not None:
+            write_queue.flush()
+        items = loader.load()
+        sync = sync or GitHubProjectSync()
+
+        if wbs_ids is not None:
+            missing = [wbs_id for wbs_id in wbs_ids if loader.cached_item(wbs_id) is None]
+            if missing:
+                return {"success": False, "error": f"Work items not found: {', '.join(missing)}"}
+            items = [item for wbs_id in wbs_ids if (item := loader.cached_item(wbs_id))]
+
+        wbs_by_issue = {item.issue_number: item.wbs_id for item in items}
+        plan = sync.plan_sync({
+            item.issue_number: {field: getattr(item, field) for field in FIELD_MAPPING}
+            for item in items
+        })
+
+        changes = [{"wbs_id": wbs_by_issue[c["issue_number"]], **c} for c in plan["changes"]]
+        result: Dict[str, Any] = {
+            "success": True,
+            "executed": execute,
+            "checked": len(items),
+            "changes": changes,
+            "not_in_project": [wbs_by_issue[n] for n in plan["not_in_project"]],
+        }
+
+        if execute and changes:
+            updates_by_issue: Dict[int, Dict[str, Any]] = {}
+            for change in changes:
+                fields = updates_by_issue.setdefault(change["issue_number"], {})
+                fields[change["yaml_field"]] = change["desired"]
+            outcomes = asyncio.run(sync.sync_work_items_async(updates_by_issue))
+            for change in changes:
+                key = (change["issue_number"], change["yaml_field"])
+                change["pushed"] = outcomes[key[0]].get(key[1], False)
+                if key in sync.errors:
+                    change["error"] = sync.errors[key]
+
+        return result
+
+    except (GraphQLError, TimeoutError) as e:
+        return {"success": False, "error": f"GitHub request failed: {e}"}
+    except (OSError, ValueError, RuntimeError) as e:
+        return {"success": False, "error": str(e)}
+    except Exception as e:
+        logger.error(f"Unexpected error planning GitHub sync: {e}")
+        return {"success": False, "error": f"Unexpected error: {str(e)}"}
+
+
+def format_plan_result(result: Dict[str, Any]) -> str:
+    """Format sync plan as human-readable text.
+
+    Args:
+        result: Result dictionary from plan_github_sync
+
+    Returns:
+        Formatted text output
+    """
+    if not result["success"]:
+        return f"❌ Sync plan failed: {result['error']}"
+
+    changes = result["changes"]
+    if not changes:
+        lines = [f"✅ GitHub is up to date ({result['checked']} item(s) checked)"]
+    elif result["executed"]:
+        failed = [c for c in changes if not c.get("pushed")]
+        icon = "✅" if not failed else "⚠️ "
+        lines = [
+            f"{icon} Pushed {len(changes) - len(failed)} of {len(changes)} field change(s) "
+            f"({result['checked']} item(s) checked)"
+        ]
+    else:
+        lines = [
+            f"📋 Sync plan: {len(changes)} field change(s) for "
+            f"{len({c['wbs_id'] for c in changes})} of {result['checked']} item(s)"
+        ]
+
+    for change in changes[:MAX_CHANGES_DISPLAYED]:
+        line = (
+            f"- {change['wbs_id']} (#{change['issue_number']}) {change['yaml_field']}: "
+            f"{change['current'] or '(empty)'} → {change['desired']}"
+        )
+        if result["executed"] and not change.get("pushed"):
+            line += f" ❌ {change.get('error', 'failed')}"
+        lines.append(line)
+    if len(changes) > MAX_CHANGES_DISPLAYED:
+        lines.append(f"- ... {len(changes) - MAX_CHANGES_DISPLAYED} more")
+
+    if result["not_in_project"]:
+        lines.extend([
+            "",
+            f"Not in GitHub Project: {', '.join(result['not_in_project'])}",
+        ])
+    if changes and not result["executed"]:
+        lines.extend(["", "Dry run: run with execute=true to push these changes."])
+
+    return "\n".join(lines)
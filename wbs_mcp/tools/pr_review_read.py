@@ -1,9 +1,11 @@
 """PR review thread tools - read operations."""
 
-import json
 import logging
-import subprocess
-from typing import Any, Dict, List, Optional
+from fnmatch import fnmatch
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..git_context import cached_pr_number, read_git_context, remember_pr_number
+from ..graphql_client import GraphQLError, get_client
 
 logger = logging.getLogger(__name__)
 
@@ -11,146 +13,241 @@ logger = logging.getLogger(__name__)
 MAX_COMMENT_DISPLAY_LENGTH = 500
 
 
-def list_pr_review_threads(pr_number: Optional[int] = None) -> Dict[str, Any]:
+# Review threads per page (GitHub's maximum)
+THREADS_PAGE_SIZE = 100
+
+# Unresolved threads per PR: (owner, repo, pr) -> (PR updatedAt, threads)
+_thread_cache: Dict[Tuple[str, str, int], Tuple[str, List[Dict[str, Any]]]] = {}
+
+# Review thread fields shared by the by-number and by-branch queries. Only
+# the first comment is shown, so comments are counted rather than fetched.
+_THREAD_FIELDS = '''
+fragment threadFields on PullRequest {
+    number
+    updatedAt
+    reviewThreads(first: %d, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+            id
+            isResolved
+            comments(first: 1) {
+                totalCount
+                nodes {
+                    author { login }
+                    body
+                    path
+                    line
+                    createdAt
+                }
+            }
+        }
+    }
+}
+''' % THREADS_PAGE_SIZE
+
+PR_BY_NUMBER_QUERY = '''
+query($owner: String!, $repo: String!, $pr: Int!, $cursor: String) {
+    repository(owner: $owner, name: $repo) {
+        pullRequest(number: $pr) { ...threadFields }
+    }
+}
+''' + _THREAD_FIELDS
+
+# Finds the branch's open PR and its first page of threads in one request
+PR_BY_BRANCH_QUERY = '''
+query($owner: String!, $repo: String!, $branch: String!, $cursor: String) {
+    repository(owner: $owner, name: $repo) {
+        pullRequests(headRefName: $branch, states: OPEN, first: 1,
+                     orderBy: {field: UPDATED_AT, direction: DESC}) {
+            nodes { ...threadFields }
+        }
+    }
+}
+''' + _THREAD_FIELDS
+
+# Cache validator
+PR_UPDATED_AT_QUERY = '''
+query($owner: String!, $repo: String!, $pr: Int!) {
+    repository(owner: $owner, name: $repo) {
+        pullRequest(number: $pr) { updatedAt }
+    }
+}
+'''
+
+
+def list_pr_review_threads(
+    pr_number: Optional[int] = None,
+    path: Optional[str] = None,
+    author: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     List unresolved review threads for a PR.
     
+    Owner, repository and branch come from the local .git directory. When
+    the PR number isn't given, it is taken from the branch → PR cache for
+    the current HEAD commit, or looked up together with the first page of
+    threads in a single request. All thread pages are fetched, and the
+    result is cached per PR until its updatedAt changes.
+    
     Args:
         pr_number: PR number (if None, auto-detect from current branch)
+        path: Only threads on files matching this glob (e.g. "wbs_mcp/*")
+        author: Only threads started by this GitHub login
         
     Returns:
         Dictionary with PR number and list of unresolved threads
     """
     try:
+        context = read_git_context()
+        if context is None:
+            return {"success": False, "error": "Could not determine repository info"}
+        
         # Auto-detect PR number if not provided
         if pr_number is None:
-            pr_number = _get_current_pr_number()
-            if pr_number is None:
+            pr_number = cached_pr_number(context)
+            if pr_number is None and not context["branch"]:
                 return {
                     "success": False,
                     "error": "Could not determine PR number from current branch"
                 }
         
-        # GraphQL query to get review threads
-        query = '''
-        query($owner: String!, $repo: String!, $pr: Int!) {
-            repository(owner: $owner, name: $repo) {
-                pullRequest(number: $pr) {
-                    reviewThreads(first: 50) {
-                        nodes {
-                            id
-                            isResolved
-                            comments(first: 10) {
-                                nodes {
-                                    author { login }
-                                    body
-                                    path
-                                    line
-                                    createdAt
-                                }
-                            }
-                        }
+        try:
+            if pr_number is None:
+                pull_request = _fetch_branch_pr(context)
+                if pull_request is None:
+                    return {
+                        "success": False,
+                        "error": f"No open PR found for branch '{context['branch']}'"
                     }
-                }
-            }
-        }
-        '''
-        
-        # Get repo info
-        repo_info = _get_repo_info()
-        if not repo_info:
-            return {"success": False, "error": "Could not determine repository info"}
-        
-        # Execute query
-        result = subprocess.run(
-            [
-                "gh", "api", "graphql",
-                "-f", f"query={query}",
-                "-f", f"owner={repo_info['owner']}",
-                "-f", f"repo={repo_info['repo']}",
-                "-F", f"pr={pr_number}"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if result.returncode != 0:
+                pr_number = pull_request["number"]
+                remember_pr_number(context, pull_request["number"])
+                threads, cached = _fetch_threads(context, pr_number, pull_request), False
+            else:
+                threads, cached = _cached_threads(context, pr_number)
+        except GraphQLError as e:
             return {
                 "success": False,
-                "error": f"GraphQL query failed: {result.stderr}"
+                "error": f"GraphQL query failed: {e}"
             }
+        except LookupError as e:
+            return {"success": False, "error": str(e)}
         
-        data = json.loads(result.stdout)
-        threads = data["data"]["repository"]["pullRequest"]["reviewThreads"]["nodes"]
-        
-        # Filter to unresolved threads
-        unresolved = []
-        for thread in threads:
-            if not thread["isResolved"] and thread["comments"]["nodes"]:
-                first_comment = thread["comments"]["nodes"][0]
-                unresolved.append({
-                    "thread_id": thread["id"],
-                    "file_path": first_comment.get("path"),
-                    "line": first_comment.get("line"),
-                    "author": first_comment["author"]["login"],
-                    "body": first_comment["body"],
-                    "created_at": first_comment["createdAt"],
-                    "comment_count": len(thread["comments"]["nodes"])
-                })
+        unresolved = [
+            thread for thread in threads
+            if (path is None or fnmatch(thread["file_path"] or "", path))
+            and (author is None or thread["author"].lower() == author.lower())
+        ]
         
         return {
             "success": True,
             "pr_number": pr_number,
             "unresolved_threads": unresolved,
-            "total_unresolved": len(unresolved)
+            "total_unresolved": len(unresolved),
+            "filters": {k: v for k, v in (("path", path), ("author", author)) if v is not None},
+            "cached": cached
         }
         
-    except subprocess.TimeoutExpired:
+    except TimeoutError:
         return {"success": False, "error": "Request timed out after 30s"}
-    except json.JSONDecodeError as e:
-        return {"success": False, "error": f"Failed to parse response: {e}"}
     except Exception as e:
         logger.error(f"Unexpected error listing review threads: {e}")
         return {"success": False, "error": str(e)}
 
 
-def _get_current_pr_number() -> Optional[int]:
-    """Get PR number for current branch."""
-    try:
-        result = subprocess.run(
-            ["gh", "pr", "view", "--json", "number"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            number = data.get("number")
-            return int(number) if number is not None else None
-    except Exception as e:
-        logger.error(f"Failed to get PR number: {e}")
-    return None
+def invalidate_thread_cache() -> None:
+    """Drop cached review threads (after replying to or resolving a thread)."""
+    _thread_cache.clear()
 
 
-def _get_repo_info() -> Optional[Dict[str, str]]:
-    """Get current repository owner and name."""
-    try:
-        result = subprocess.run(
-            ["gh", "repo", "view", "--json", "owner,name"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            return {
-                "owner": data["owner"]["login"],
-                "repo": data["name"]
-            }
-    except Exception as e:
-        logger.error(f"Failed to get repo info: {e}")
-    return None
+def _cached_threads(context: Dict[str, Any], pr_number: int) -> Tuple[List[Dict[str, Any]], bool]:
+    """Unresolved threads of a PR, reusing the cache while updatedAt is unchanged.
+
+    Returns:
+        Tuple of (threads, whether they came from the cache)
+
+    Raises:
+        LookupError: If the PR doesn't exist
+    """
+    key = (context["owner"], context["repo"], pr_number)
+    entry = _thread_cache.get(key)
+    if entry is not None:
+        data = get_client().execute(PR_UPDATED_AT_QUERY, {
+            "owner": context["owner"], "repo": context["repo"], "pr": pr_number
+        })
+        pull_request = data["data"]["repository"]["pullRequest"]
+        if pull_request is None:
+            raise LookupError(f"PR #{pr_number} not found")
+        if pull_request["updatedAt"] == entry[0]:
+            logger.debug(f"Review threads for PR #{pr_number} unchanged since {entry[0]}")
+            return entry[1], True
+
+    return _fetch_threads(context, pr_number), False
+
+
+def _fetch_branch_pr(context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Open PR for the current branch, with its first page of threads."""
+    data = get_client().execute(PR_BY_BRANCH_QUERY, {
+        "owner": context["owner"], "repo": context["repo"],
+        "branch": context["branch"], "cursor": None
+    })
+    nodes: List[Dict[str, Any]] = data["data"]["repository"]["pullRequests"]["nodes"]
+    return nodes[0] if nodes else None
+
+
+def _fetch_threads(
+    context: Dict[str, Any],
+    pr_number: int,
+    first_page: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Fetch all review thread pages of a PR and cache its unresolved threads.
+
+    Args:
+        context: Repository context
+        pr_number: PR number
+        first_page: Pull request node already fetched with the first page
+
+    Raises:
+        LookupError: If the PR doesn't exist
+    """
+    pull_request = first_page
+    cursor = None
+    unresolved: List[Dict[str, Any]] = []
+    updated_at = None
+    while True:
+        if pull_request is None:
+            data = get_client().execute(PR_BY_NUMBER_QUERY, {
+                "owner": context["owner"], "repo": context["repo"],
+                "pr": pr_number, "cursor": cursor
+            })
+            pull_request = data["data"]["repository"]["pullRequest"]
+            if pull_request is None:
+                raise LookupError(f"PR #{pr_number} not found")
+
+        # Keep the first page's timestamp so changes made while paging
+        # invalidate the cache on the next call
+        updated_at = updated_at or pull_request["updatedAt"]
+        page = pull_request["reviewThreads"]
+        for thread in page["nodes"]:
+            comments = thread["comments"]
+            if not thread["isResolved"] and comments["nodes"]:
+                first_comment = comments["nodes"][0]
+                unresolved.append({
+                    "thread_id": thread["id"],
+                    "file_path": first_comment.get("path"),
+                    "line": first_comment.get("line"),
+                    "author": (first_comment.get("author") or {}).get("login", "ghost"),
+                    "body": first_comment["body"],
+                    "created_at": first_comment["createdAt"],
+                    "comment_count": comments["totalCount"]
+                })
+
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        cursor = page["pageInfo"]["endCursor"]
+        pull_request = None
+
+    _thread_cache[(context["owner"], context["repo"], pr_number)] = (updated_at, unresolved)
+    return unresolved
 
 
 def format_review_threads(result: Dict[str, Any]) -> str:
@@ -168,11 +265,15 @@ def format_review_threads(result: Dict[str, Any]) -> str:
     pr_num = result["pr_number"]
     threads = result["unresolved_threads"]
     
+    matching = ""
+    if result.get("filters"):
+        matching = " matching " + ", ".join(f"{k}={v}" for k, v in result["filters"].items())
+    
     if not threads:
-        return f"✅ PR #{pr_num}: No unresolved review threads"
+        return f"✅ PR #{pr_num}: No unresolved review threads{matching}"
     
     lines = [
-        f"📋 PR #{pr_num}: {result['total_unresolved']} unresolved review thread(s)",
+        f"📋 PR #{pr_num}: {result['total_unresolved']} unresolved review thread(s){matching}",
         ""
     ]
     
@@ -182,6 +283,8 @@ def format_review_threads(result: Dict[str, Any]) -> str:
         lines.append(f"{i}. {file_path}:{line}")
         lines.append(f"   Author: @{thread['author']}")
         lines.append(f"   Thread ID: {thread['thread_id']}")
+        if thread['comment_count'] > 1:
+            lines.append(f"   Comments: {thread['comment_count']}")
         
         # Truncate long comments
         body = thread['body']
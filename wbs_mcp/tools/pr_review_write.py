@@ -1,12 +1,17 @@
 """PR review thread tools - write operations."""
 
-import json
 import logging
-import subprocess
-from typing import Any, Dict, Optional
+import os
+from typing import Any, Dict, List, Tuple
+
+from ..graphql_client import GraphQLError, get_client
+from .pr_review_read import invalidate_thread_cache
 
 logger = logging.getLogger(__name__)
 
+# Aliased mutations per GraphQL request for bulk thread updates
+MAX_THREAD_MUTATIONS_PER_REQUEST = int(os.environ.get("WBS_MUTATION_BATCH_SIZE", "25"))
+
 
 def reply_to_review_thread(thread_id: str, body: str) -> Dict[str, Any]:
     """
@@ -31,26 +36,16 @@ def reply_to_review_thread(thread_id: str, body: str) -> Dict[str, Any]:
         }
         '''
         
-        result = subprocess.run(
-            [
-                "gh", "api", "graphql",
-                "-f", f"query={mutation}",
-                "-f", f"thread={thread_id}",
-                "-f", f"body={body}"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if result.returncode != 0:
+        try:
+            data = get_client().execute(mutation, {"thread": thread_id, "body": body})
+        except GraphQLError as e:
             return {
                 "success": False,
-                "error": f"GraphQL mutation failed: {result.stderr}"
+                "error": f"GraphQL mutation failed: {e}"
             }
         
-        data = json.loads(result.stdout)
         comment_id = data["data"]["addPullRequestReviewThreadReply"]["comment"]["id"]
+        invalidate_thread_cache()
         
         return {
             "success": True,
@@ -58,7 +53,7 @@ def reply_to_review_thread(thread_id: str, body: str) -> Dict[str, Any]:
             "comment_id": comment_id
         }
         
-    except subprocess.TimeoutExpired:
+    except TimeoutError:
         return {"success": False, "error": "Request timed out after 30s"}
     except Exception as e:
         logger.error(f"Failed to reply to thread: {e}")
@@ -84,25 +79,16 @@ def resolve_review_thread(thread_id: str) -> Dict[str, Any]:
         }
         '''
         
-        result = subprocess.run(
-            [
-                "gh", "api", "graphql",
-                "-f", f"query={mutation}",
-                "-f", f"id={thread_id}"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if result.returncode != 0:
+        try:
+            data = get_client().execute(mutation, {"id": thread_id})
+        except GraphQLError as e:
             return {
                 "success": False,
-                "error": f"GraphQL mutation failed: {result.stderr}"
+                "error": f"GraphQL mutation failed: {e}"
             }
         
-        data = json.loads(result.stdout)
         is_resolved = data["data"]["resolveReviewThread"]["thread"]["isResolved"]
+        invalidate_thread_cache()
         
         return {
             "success": True,
@@ -110,13 +96,136 @@ def resolve_review_thread(thread_id: str) -> Dict[str, Any]:
             "is_resolved": is_resolved
         }
         
-    except subprocess.TimeoutExpired:
+    except TimeoutError:
         return {"success": False, "error": "Request timed out after 30s"}
     except Exception as e:
         logger.error(f"Failed to resolve thread: {e}")
         return {"success": False, "error": str(e)}
 
 
+def address_review_threads(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Reply to and/or resolve many review threads with batched mutations.
+    
+    Replies go out first as aliased mutations, several per request. Threads
+    are then resolved the same way, skipping any whose reply failed so a
+    thread is never closed without its explanation.
+    
+    Args:
+        entries: List of {"thread_id", "body" (optional), "resolve" (default True)}
+        
+    Returns:
+        Result dictionary with per-thread outcomes
+    """
+    for i, entry in enumerate(entries, 1):
+        if not entry.get("thread_id"):
+            return {"success": False, "error": f"Entry {i}: thread_id is required"}
+        if not entry.get("body") and not entry.get("resolve", True):
+            return {"success": False, "error": f"Entry {i}: nothing to do (no body and resolve is false)"}
+    
+    try:
+        outcomes: List[Dict[str, Any]] = [
+            {"thread_id": entry["thread_id"], "replied": None, "comment_id": None,
+             "resolved": None, "error": None}
+            for entry in entries
+        ]
+        requests = 0
+        
+        replies = [i for i, entry in enumerate(entries) if entry.get("body")]
+        for start in range(0, len(replies), MAX_THREAD_MUTATIONS_PER_REQUEST):
+            batch = replies[start:start + MAX_THREAD_MUTATIONS_PER_REQUEST]
+            fields = {
+                f"r{n}": f"addPullRequestReviewThreadReply(input: {{"
+                         f"pullRequestReviewThreadId: $t{n}, body: $b{n}}}) {{ comment {{ id }} }}"
+                for n in range(len(batch))
+            }
+            variables: Dict[str, Any] = {}
+            for n, i in enumerate(batch):
+                variables[f"t{n}"] = entries[i]["thread_id"]
+                variables[f"b{n}"] = entries[i]["body"]
+            declarations = ", ".join(f"$t{n}: ID!, $b{n}: String!" for n in range(len(batch)))
+            data, errors = _execute_batch(declarations, fields, variables)
+            requests += 1
+            for n, i in enumerate(batch):
+                node = data.get(f"r{n}")
+                if node and f"r{n}" not in errors:
+                    outcomes[i].update(replied=True, comment_id=node["comment"]["id"])
+                else:
+                    outcomes[i].update(replied=False, error=errors.get(f"r{n}", "Reply returned no result"))
+        
+        resolves = [
+            i for i, entry in enumerate(entries)
+            if entry.get("resolve", True) and outcomes[i]["replied"] is not False
+        ]
+        for start in range(0, len(resolves), MAX_THREAD_MUTATIONS_PER_REQUEST):
+            batch = resolves[start:start + MAX_THREAD_MUTATIONS_PER_REQUEST]
+            fields = {
+                f"s{n}": f"resolveReviewThread(input: {{threadId: $t{n}}}) {{ thread {{ isResolved }} }}"
+                for n in range(len(batch))
+            }
+            variables = {f"t{n}": entries[i]["thread_id"] for n, i in enumerate(batch)}
+            declarations = ", ".join(f"$t{n}: ID!" for n in range(len(batch)))
+            data, errors = _execute_batch(declarations, fields, variables)
+            requests += 1
+            for n, i in enumerate(batch):
+                node = data.get(f"s{n}")
+                if node and f"s{n}" not in errors:
+                    outcomes[i]["resolved"] = node["thread"]["isResolved"]
+                else:
+                    outcomes[i].update(resolved=False, error=errors.get(f"s{n}", "Resolve returned no result"))
+        
+        if requests:
+            invalidate_thread_cache()
+        
+        return {
+            "success": True,
+            "threads": outcomes,
+            "replied": sum(1 for o in outcomes if o["replied"]),
+            "resolved": sum(1 for o in outcomes if o["resolved"]),
+            "failed": sum(1 for o in outcomes if o["error"]),
+            "requests": requests
+        }
+        
+    except TimeoutError:
+        return {"success": False, "error": "Request timed out after 30s"}
+    except Exception as e:
+        logger.error(f"Failed to address review threads: {e}")
+        return {"success": False, "error": str(e)}
+
+
+def _execute_batch(
+    declarations: str,
+    fields: Dict[str, str],
+    variables: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """Run aliased mutations as one document.
+    
+    Args:
+        declarations: Variable declarations of the mutation
+        fields: Mutation selection by alias
+        variables: Variable values
+        
+    Returns:
+        Tuple of (data by alias, error message by alias). A request that
+        fails as a whole reports its error for every alias.
+    """
+    document = f"mutation({declarations}) {{\n" + "".join(
+        f"  {alias}: {selection}\n" for alias, selection in fields.items()
+    ) + "}"
+    try:
+        response = get_client().execute(document, variables, allow_partial=True)
+    except GraphQLError as e:
+        return {}, {alias: f"GraphQL mutation failed: {e}" for alias in fields}
+    
+    # Errors carry the alias of the failed mutation as the first path element
+    errors: Dict[str, str] = {}
+    for error in response.get("errors") or []:
+        path = error.get("path") or []
+        if path:
+            errors[str(path[0])] = error.get("message", "Unknown error")
+    return response.get("data") or {}, errors
+
+
 def format_reply_result(result: Dict[str, Any]) -> str:
     """Format reply result as text."""
     if not result["success"]:
@@ -131,3 +240,20 @@ def format_resolve_result(result: Dict[str, Any]) -> str:
         return f"❌ Failed to resolve: {result['error']}"
     
     return f"✅ Resolved thread {result['thread_id'][:12]}..."
+
+
+def format_address_result(result: Dict[str, Any]) -> str:
+    """Format bulk reply/resolve result as text."""
+    if not result["success"]:
+        return f"❌ Failed to address threads: {result['error']}"
+    
+    icon = "✅" if not result["failed"] else "⚠️ "
+    lines = [
+        f"{icon} {len(result['threads'])} thread(s): {result['replied']} replied, "
+        f"{result['resolved']} resolved, {result['failed']} failed "
+        f"({result['requests']} request(s))"
+    ]
+    for outcome in result["threads"]:
+        if outcome["error"]:
+            lines.append(f"- ❌ {outcome['thread_id']}: {outcome['error']}")
+    return "\n".join(lines)
@@ -0,0 +1,153 @@
+"""Incremental pull of GitHub Project field values into work-items.yaml."""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from ..data_loader import WorkItemsLoader
+from ..github_sync import FIELD_MAPPING, GitHubProjectSync
+from ..graphql_client import GraphQLError
+from ..write_queue import WriteQueue
+from ..yaml_writer import SYNC_FIELDS, UPDATABLE_FIELDS, WorkItemWriter
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of field changes to display
+MAX_CHANGES_DISPLAYED = 50
+
+
+def pull_from_github(
+    loader: WorkItemsLoader,
+    dry_run: bool = False,
+    full: bool = False,
+    write_queue: Optional[WriteQueue] = None,
+    sync: Optional[GitHubProjectSync] = None,
+) -> Dict[str, Any]:
+    """
+    Pull changed GitHub Project field values into work-items.yaml.
+
+    Each item's ``github_updated_at`` is its sync watermark: only project
+    items updated since then have their field values fetched. Mapped fields
+    that differ from the YAML are applied, together with the new watermark
+    and ``last_synced_at``, in a single write. Items with
+    ``allow_yaml_override`` keep their YAML values.
+
+    Args:
+        loader: Data loader instance
+        dry_run: Report the changes without writing them
+        full: Ignore watermarks and compare every tracked item
+        write_queue: Write-behind queue to flush before pulling
+        sync: GitHub sync client (default: new client)
+
+    Returns:
+        Result dictionary with field changes and skipped items
+    """
+    try:
+        if write_queue is not None:
+            write_queue.flush()
+        loader.load()
+        sync = sync or GitHubProjectSync()
+
+        untracked = 0
+        changed = []
+        for entry in sync.fetch_item_timestamps():
+            item = loader.cached_item_by_issue_number(entry["issue_number"])
+            if item is None:
+                untracked += 1
+            elif full or entry["updated_at"] != item.github_updated_at:
+                changed.append((item, entry))
+
+        values = sync.fetch_item_field_values([entry["item_id"] for _, entry in changed])
+
+        synced_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        batch: Dict[str, Dict[str, Any]] = {}
+        changes: List[Dict[str, Any]] = []
+        overridden: List[str] = []
+        for item, entry in changed:
+            github_values = values.get(entry["item_id"], {})
+            diffs = {
+                yaml_field: github_values[github_field]
+                for yaml_field, github_field in FIELD_MAPPING.items()
+                if github_field in github_values
+                and github_values[github_field] != getattr(item, yaml_field)
+            }
+            if diffs and item.allow_yaml_override:
+                overridden.append(item.wbs_id)
+                diffs = {}
+            for yaml_field, value in diffs.items():
+                changes.append({
+                    "wbs_id": item.wbs_id,
+                    "issue_number": item.issue_number,
+                    "field": yaml_field,
+                    "old": getattr(item, yaml_field),
+                    "new": value,
+                })
+            batch[item.wbs_id] = {
+                **diffs,
+                "github_updated_at": entry["updated_at"],
+                "last_synced_at": synced_at,
+            }
+
+        if batch and not dry_run:
+            writer = WorkItemWriter(loader.yaml_path)
+            items = writer.update_work_items(batch, allowed_fields=UPDATABLE_FIELDS | SYNC_FIELDS)
+            loader.apply_updates(
+                list(items.values()), writer.file_identity, writer.content_hash, writer.base_hash
+            )
+
+        return {
+            "success": True,
+            "dry_run": dry_run,
+            "checked": len(changed),
+            "untracked": untracked,
+            "changes": changes,
+            "overridden": overridden,
+        }
+
+    except (GraphQLError, TimeoutError) as e:
+        return {"success": False, "error": f"GitHub request failed: {e}"}
+    except (OSError, ValueError, RuntimeError) as e:
+        return {"success": False, "error": str(e)}
+    except Exception as e:
+        logger.error(f"Unexpected error pulling from GitHub: {e}")
+        return {"success": False, "error": f"Unexpected error: {str(e)}"}
+
+
+def format_pull_result(result: Dict[str, Any]) -> str:
+    """Format pull result as human-readable text.
+
+    Args:
+        result: Result dictionary from pull_from_github
+
+    Returns:
+        Formatted text output
+    """
+    if not result["success"]:
+        return f"❌ Pull failed: {result['error']}"
+
+    changes = result["changes"]
+    verb = "Would apply" if result["dry_run"] else "Applied"
+    lines = [
+        f"✅ {verb} {len(changes)} field change(s) from GitHub "
+        f"({result['checked']} item(s) updated since last sync)",
+    ]
+
+    for change in changes[:MAX_CHANGES_DISPLAYED]:
+        lines.append(
+            f"- {change['wbs_id']} (#{change['issue_number']}) {change['field']}: "
+            f"{change['old']} → {change['new']}"
+        )
+    if len(changes) > MAX_CHANGES_DISPLAYED:
+        lines.append(f"- ... {len(changes) - MAX_CHANGES_DISPLAYED} more")
+
+    if result["overridden"]:
+        lines.extend([
+            "",
+            f"Kept YAML values (allow_yaml_override): {', '.join(result['overridden'])}",
+        ])
+    if result["untracked"]:
+        lines.append(f"Project items not in work-items.yaml: {result['untracked']}")
+    if result["dry_run"]:
+        lines.extend(["", "Dry run: work-items.yaml was not modified."])
+
+    return "\n".join(lines)
@@ -0,0 +1,89 @@
+"""Server metrics: tool latencies, cache hit rates, load and GitHub timings."""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from ..metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def server_stats(prefix: Optional[str] = None, prometheus: bool = False) -> Dict[str, Any]:
+    """
+    Report the server's metrics.
+
+    Args:
+        prefix: Only include metrics whose name starts with this
+        prometheus: Also render the Prometheus text exposition format
+
+    Returns:
+        Result dictionary with counters, gauges and histograms
+    """
+    snapshot = metrics.snapshot()
+    if prefix:
+        snapshot = {
+            kind: [entry for entry in entries if str(entry["name"]).startswith(prefix)]
+            for kind, entries in snapshot.items()
+        }
+    result: Dict[str, Any] = {"success": True, **snapshot}
+    if prometheus:
+        result["prometheus"] = metrics.render_prometheus()
+    return result
+
+
+def format_server_stats(result: Dict[str, Any]) -> str:
+    """Format server metrics as human-readable text.
+
+    Args:
+        result: Result dictionary from server_stats
+
+    Returns:
+        Formatted text output
+    """
+    if "prometheus" in result:
+        return f"```\n{result['prometheus']}```"
+
+    lines = ["# Server Stats"]
+
+    if result["histograms"]:
+        lines.extend([
+            "",
+            "## Latency",
+            "",
+            "| Metric | Count | Mean | p50 | p95 | p99 |",
+            "|---|---|---|---|---|---|",
+        ])
+        for h in result["histograms"]:
+            lines.append(
+                f"| {_series(h)} | {h['count']} | {_ms(h['mean'])} | "
+                f"≤{_ms(h['p50'])} | ≤{_ms(h['p95'])} | ≤{_ms(h['p99'])} |"
+            )
+
+    for title, entries in (("Counters", result["counters"]), ("Gauges", result["gauges"])):
+        if entries:
+            lines.extend(["", f"## {title}", ""])
+            lines.extend(f"- {_series(entry)}: {_number(entry['value'])}" for entry in entries)
+
+    if len(lines) == 1:
+        lines.extend(["", "No metrics recorded yet."])
+    return "\n".join(lines)
+
+
+def _series(entry: Dict[str, Any]) -> str:
+    """Metric name with its labels, e.g. wbs_tool_call_seconds{tool=get_work_item}."""
+    labels: List[str] = [f"{k}={v}" for k, v in entry["labels"].items()]
+    return f"{entry['name']}{{{','.join(labels)}}}" if labels else str(entry["name"])
+
+
+def _ms(seconds: Optional[float]) -> str:
+    """Seconds as milliseconds for display."""
+    if seconds is None:
+        return "-"
+    if seconds == float("inf"):
+        return "∞"
+    return f"{seconds * 1000:.1f} ms"
+
+
+def _number(value: float) -> str:
+    """Integral values without a decimal point."""
+    return str(int(value)) if float(value).is_integer() else f"{value:.3f}"
@@ -1,11 +1,13 @@
 """Write operations for work items."""
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from ..data_loader import WorkItemsLoader
-from ..github_sync import GitHubProjectSync
-from ..yaml_writer import WorkItemWriter
+from ..github_sync import FIELD_MAPPING, GitHubProjectSync
+from ..outbox import SyncOutbox
+from ..write_queue import WriteQueue
+from ..yaml_writer import WorkItemWriter, WriteConflictError
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +16,11 @@ def update_work_item(
     loader: WorkItemsLoader,
     wbs_id: str,
     updates: Dict[str, Any],
-    push_to_github: bool = False
+    push_to_github: bool = False,
+    expected_hash: Optional[str] = None,
+    on_conflict: str = "reject",
+    write_queue: Optional[WriteQueue] = None,
+    outbox: Optional[SyncOutbox] = None
 ) -> Dict[str, Any]:
     """
     Update a work item in work-items.yaml.
@@ -24,6 +30,12 @@ def update_work_item(
         wbs_id: WBS ID to update
         updates: Dictionary of fields to update
         push_to_github: Whether to sync to GitHub after update
+        expected_hash: Snapshot hash the caller based the update on
+        on_conflict: 'reject' or 'merge' when the file changed since that snapshot
+        write_queue: Write-behind queue; when set, updates are queued instead
+            of written unless expected_hash requires an immediate checked write
+        outbox: Sync outbox; when set, GitHub pushes are queued for the
+            background worker and a sync ticket is returned instead
         
     Returns:
         Result dictionary with success status and updated fields
@@ -32,19 +44,65 @@ def update_work_item(
     writer = WorkItemWriter(yaml_path)
     
     try:
-        # Update the work item
-        updated_item = writer.update_work_item(wbs_id, updates)
+        if on_conflict not in ("reject", "merge"):
+            raise ValueError(f"Invalid on_conflict '{on_conflict}' (must be 'reject' or 'merge')")
+        
+        queued = write_queue is not None and not expected_hash
+        if write_queue is not None and queued:
+            # Write-behind: readers see the update now, disk catches up on flush
+            updated_item = write_queue.enqueue(wbs_id, updates)
+        else:
+            # The caller's view of the item (queued updates included), which is
+            # only known when the loader snapshot is the one the caller saw
+            snapshot_hash = loader.content_hash
+            base_item = loader.cached_item(wbs_id)
+            caller_is_current = bool(
+                expected_hash and snapshot_hash and snapshot_hash.startswith(expected_hash.lower())
+            )
+            
+            if write_queue is not None:
+                # Checked writes must compare against everything queued so far
+                flushed = write_queue.flush()["flushed"]
+                if flushed and caller_is_current and write_queue.writer.base_hash == snapshot_hash:
+                    # The caller already saw the queued updates, so the file the
+                    # flush produced is their base, not a concurrent change
+                    expected_hash = write_queue.writer.content_hash
+            
+            base_values = None
+            if expected_hash and on_conflict == "merge" and caller_is_current and base_item:
+                base_values = {key: getattr(base_item, key) for key in updates}
+            
+            # Update the work item
+            updated_item = writer.update_work_item(
+                wbs_id,
+                updates,
+                expected_hash=expected_hash,
+                base_values=base_values
+            )
+            
+            # Patch the loader cache with the written item instead of re-parsing
+            loader.apply_update(
+                updated_item, writer.file_identity, writer.content_hash, writer.base_hash
+            )
         
         result = {
             "success": True,
             "wbs_id": wbs_id,
             "updated_fields": list(updates.keys()),
             "github_synced": False,
-            "issue_number": updated_item.issue_number
+            "issue_number": updated_item.issue_number,
+            "content_hash": writer.content_hash,
+            "queued": queued
         }
         
         # Optionally push to GitHub
-        if push_to_github and updated_item.issue_number:
+        if push_to_github and updated_item.issue_number and outbox is not None:
+            mapped = {k: v for k, v in updates.items() if k in FIELD_MAPPING}
+            if mapped:
+                result["sync_ticket"] = outbox.enqueue(wbs_id, updated_item.issue_number, mapped)
+            else:
+                result["github_synced"] = True
+        elif push_to_github and updated_item.issue_number:
             try:
                 sync = GitHubProjectSync()
                 sync_results = sync.sync_work_item(
@@ -55,7 +113,10 @@ def update_work_item(
                 result["github_sync_details"] = sync_results
                 
                 if not result["github_synced"]:
-                    failed = [k for k, v in sync_results.items() if not v]
+                    failed = [
+                        f"{k} ({sync.errors.get((updated_item.issue_number, k), 'unknown error')})"
+                        for k, v in sync_results.items() if not v
+                    ]
                     result["github_error"] = f"Failed to sync fields: {', '.join(failed)}"
             except Exception as e:
                 logger.error(f"GitHub sync failed: {e}")
@@ -63,11 +124,15 @@ def update_work_item(
         elif push_to_github and not updated_item.issue_number:
             result["github_error"] = "No GitHub issue linked to work item"
         
-        # Reload data loader cache
-        loader.load(force_reload=True)
-        
         return result
         
+    except WriteConflictError as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "wbs_id": wbs_id,
+            "content_hash": e.current_hash
+        }
     except ValueError as e:
         return {
             "success": False,
@@ -93,6 +158,11 @@ def format_update_result(result: Dict[str, Any]) -> str:
         Formatted text output
     """
     if not result["success"]:
+        if result.get("content_hash"):
+            return (
+                f"❌ Update failed: {result['error']}\n"
+                f"   Re-read the item and retry with expected_hash: {result['content_hash'][:16]}"
+            )
         return f"❌ Update failed: {result['error']}"
     
     lines = [
@@ -100,9 +170,56 @@ def format_update_result(result: Dict[str, Any]) -> str:
         f"   Updated fields: {', '.join(result['updated_fields'])}"
     ]
     
-    if result.get("github_synced"):
+    if result.get("queued"):
+        lines.append("   ⏳ Queued for write (write-behind mode)")
+    elif result.get("content_hash"):
+        lines.append(f"   Snapshot: {result['content_hash'][:16]}")
+    
+    if "sync_ticket" in result:
+        lines.append(
+            f"   🔄 GitHub push queued for issue #{result['issue_number']} "
+            f"(ticket {result['sync_ticket']}, see get_sync_status)"
+        )
+    elif result.get("github_synced"):
         lines.append(f"   ✓ Synced to GitHub issue #{result['issue_number']}")
     elif "github_error" in result:
         lines.append(f"   ⚠️  GitHub sync failed: {result['github_error']}")
     
     return "\n".join(lines)
+
+
+def flush_writes(write_queue: Optional[WriteQueue]) -> Dict[str, Any]:
+    """Flush queued work item updates to work-items.yaml.
+    
+    Args:
+        write_queue: Write-behind queue, or None when the mode is disabled
+        
+    Returns:
+        Result dictionary with success status and flushed WBS IDs
+    """
+    if write_queue is None:
+        return {"success": True, "flushed": [], "enabled": False}
+    
+    try:
+        result = write_queue.flush()
+        return {"success": True, "flushed": result["flushed"], "enabled": True}
+    except Exception as e:
+        logger.error(f"Flush failed: {e}")
+        return {"success": False, "error": str(e), "pending": write_queue.pending_count}
+
+
+def format_flush_result(result: Dict[str, Any]) -> str:
+    """Format flush result as text."""
+    if not result["success"]:
+        return (
+            f"❌ Flush failed: {result['error']}\n"
+            f"   {result['pending']} item(s) remain queued"
+        )
+    
+    if not result.get("enabled"):
+        return "ℹ️  Write-behind mode is disabled; updates are written immediately"
+    
+    if not result["flushed"]:
+        return "✅ No queued updates to flush"
+    
+    return f"✅ Flushed updates for {len(result['flushed'])} item(s): {', '.join(result['flushed'])}"
@@ -0,0 +1,176 @@
+"""Write-behind queue that coalesces bursts of work item updates."""
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from .data_loader import WorkItemsLoader
+from .models import WorkItem
+from .yaml_writer import UPDATABLE_FIELDS, WorkItemWriter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEBOUNCE_SECONDS = 0.5
+DEFAULT_MAX_PENDING = 50
+
+# Longest wait between retries of a failed automatic flush
+MAX_RETRY_SECONDS = 30.0
+
+
+class WriteQueue:
+    """Queue updates in memory, merged per item, and flush them in one write.
+
+    Queued updates are staged on the loader so reads see them immediately.
+    A flush happens after ``debounce_seconds`` without new updates, when
+    ``max_pending`` items are queued, or when ``flush()`` is called. A
+    failed flush is retried with exponential backoff, so queued updates
+    don't sit in memory until something else triggers a write.
+    """
+
+    def __init__(
+        self,
+        loader: WorkItemsLoader,
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        """Initialize the queue.
+
+        Args:
+            loader: Loader whose snapshot reflects queued updates
+            debounce_seconds: Quiet period before an automatic flush
+            max_pending: Number of queued items that triggers an immediate flush
+        """
+        self.loader = loader
+        self.writer = WorkItemWriter(loader.yaml_path)
+        self.debounce_seconds = debounce_seconds
+        self.max_pending = max_pending
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        # Consecutive failed flushes, for the retry backoff
+        self._failures = 0
+
+    @classmethod
+    def from_env(cls, loader: WorkItemsLoader) -> Optional["WriteQueue"]:
+        """Create a queue if write-behind mode is enabled via environment.
+
+        Reads WBS_WRITE_BEHIND, WBS_WRITE_DEBOUNCE_MS and WBS_WRITE_MAX_PENDING.
+
+        Returns:
+            Configured queue, or None when write-behind is disabled
+        """
+        if os.environ.get("WBS_WRITE_BEHIND", "").lower() not in ("1", "true", "yes"):
+            return None
+        debounce_ms = float(os.environ.get("WBS_WRITE_DEBOUNCE_MS", DEFAULT_DEBOUNCE_SECONDS * 1000))
+        max_pending = int(os.environ.get("WBS_WRITE_MAX_PENDING", DEFAULT_MAX_PENDING))
+        logger.info(f"Write-behind enabled (debounce {debounce_ms:.0f}ms, max {max_pending} items)")
+        return cls(loader, debounce_ms / 1000, max_pending)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of items with queued updates."""
+        with self._lock:
+            return len(self._pending)
+
+    def enqueue(self, wbs_id: str, updates: Dict[str, Any]) -> WorkItem:
+        """Queue field updates for a work item.
+
+        Args:
+            wbs_id: WBS ID of the item to update
+            updates: Dictionary of fields to update
+
+        Returns:
+            Work item with the queued updates applied
+
+        Raises:
+            ValueError: If WBS ID not found or invalid fields/values
+        """
+        invalid_fields = set(updates.keys()) - UPDATABLE_FIELDS
+        if invalid_fields:
+            raise ValueError(f"Invalid fields for update: {invalid_fields}")
+
+        with self._lock:
+            item = self.loader.stage_update(wbs_id, updates)
+            self._pending.setdefault(wbs_id, {}).update(updates)
+            flush_now = len(self._pending) >= self.max_pending
+            if not flush_now:
+                self._schedule()
+
+        logger.info(f"Queued update for {wbs_id}: {', '.join(updates)}")
+        if flush_now:
+            self.flush()
+        return item
+
+    def flush(self) -> Dict[str, Any]:
+        """Write all queued updates to disk in a single write.
+
+        Returns:
+            Dictionary with the flushed WBS IDs
+
+        Raises:
+            Exception: Errors from the writer; the updates stay queued
+        """
+        with self._flush_lock:
+            with self._lock:
+                self._cancel_timer()
+                batch = self._pending
+                self._pending = {}
+
+            if not batch:
+                return {"flushed": []}
+
+            try:
+                items = self.writer.update_work_items(batch)
+            except Exception:
+                with self._lock:
+                    # Newer updates queued during the flush take precedence
+                    for wbs_id, fields in batch.items():
+                        self._pending[wbs_id] = {**fields, **self._pending.get(wbs_id, {})}
+                    self._failures += 1
+                    self._schedule(min(self.debounce_seconds * 2 ** self._failures, MAX_RETRY_SECONDS))
+                raise
+
+            with self._lock:
+                self._failures = 0
+
+            self.loader.apply_updates(
+                list(items.values()),
+                self.writer.file_identity,
+                self.writer.content_hash,
+                self.writer.base_hash,
+                committed=batch,
+            )
+
+        logger.info(f"Flushed queued updates for {len(batch)} item(s)")
+        return {"flushed": list(batch)}
+
+    def close(self) -> None:
+        """Flush remaining updates; call on shutdown."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush queued updates on shutdown: {e}")
+
+    def _schedule(self, delay: Optional[float] = None) -> None:
+        """Restart the flush timer (default: the debounce period). Caller must hold the lock."""
+        self._cancel_timer()
+        self._timer = threading.Timer(
+            self.debounce_seconds if delay is None else delay, self._flush_from_timer
+        )
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        """Cancel a pending debounce timer. Caller must hold the lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _flush_from_timer(self) -> None:
+        """Debounce timer callback."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Debounced flush failed, updates remain queued and will be retried: {e}")
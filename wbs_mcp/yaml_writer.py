@@ -1,105 +1,375 @@
 """YAML writer with formatting preservation for work items."""
 
+import hashlib
+import io
 import logging
+import os
 import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
 from ruamel.yaml import YAML
+from ruamel.yaml.scalarstring import LiteralScalarString
 
+from .data_loader import FileIdentity, stat_identity
+from .metrics import metrics
 from .models import WorkItem
 
+if sys.platform != "win32":
+    import fcntl
+
 logger = logging.getLogger(__name__)
 
+# Fields that may be modified through update_work_item
+UPDATABLE_FIELDS = frozenset({
+    'status', 'priority', 'milestone', 'assignees',
+    'start_date', 'end_date', 'effort_days', 'description',
+    'title', 'responsible_architect', 'allow_yaml_override'
+})
+
+# Bookkeeping fields written by GitHub sync, not by users
+SYNC_FIELDS = frozenset({'github_updated_at', 'last_synced_at'})
+
+# Default time to wait for the cross-process write lock
+DEFAULT_LOCK_TIMEOUT = 10.0
+
+# Shortest expected_hash prefix accepted (conflict messages show 16)
+MIN_HASH_PREFIX = 16
+
+
+class WriteConflictError(ValueError):
+    """Raised when the file changed since the caller's snapshot."""
+
+    def __init__(self, message: str, current_hash: str):
+        super().__init__(message)
+        self.current_hash = current_hash
+
+
+@contextmanager
+def file_lock(lock_path: Path, timeout: float = DEFAULT_LOCK_TIMEOUT) -> Iterator[None]:
+    """Hold an exclusive advisory lock on a sidecar lock file.
+
+    Polls with a non-blocking flock and short, growing sleeps so contended
+    writers retry quickly without spinning. No-op where fcntl is unavailable.
+
+    Args:
+        lock_path: Path of the lock file (created if missing)
+        timeout: Seconds to wait before giving up
+
+    Raises:
+        TimeoutError: If the lock could not be acquired in time
+    """
+    if sys.platform == "win32":
+        yield
+        return
+
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        delay = 0.002
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for write lock: {lock_path}")
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
 
 class WorkItemWriter:
     """Write work items to YAML while preserving formatting and comments."""
-    
-    def __init__(self, yaml_path: Path):
+
+    def __init__(self, yaml_path: Path, lock_timeout: float = DEFAULT_LOCK_TIMEOUT):
         """Initialize the writer.
-        
+
         Args:
             yaml_path: Path to work-items.yaml file
+            lock_timeout: Seconds to wait for the cross-process write lock
         """
         self.yaml_path = yaml_path
+        self.lock_path = yaml_path.with_name(yaml_path.name + '.lock')
+        self.lock_timeout = lock_timeout
         self.yaml = YAML()
         self.yaml.preserve_quotes = True
         self.yaml.default_flow_style = False
         self.yaml.indent(mapping=2, sequence=2, offset=0)
-    
+        # Hash of the content the last write was applied to, and the
+        # identity and hash of the file after that write
+        self.base_hash: Optional[str] = None
+        self.file_identity: Optional[FileIdentity] = None
+        self.content_hash: Optional[str] = None
+
+    @metrics.timed("wbs_writer_update_seconds", "wbs_writer_updates_total")
     def update_work_item(
-        self, 
-        wbs_id: str, 
+        self,
+        wbs_id: str,
         updates: Dict[str, Any],
-        create_backup: bool = True
+        create_backup: bool = True,
+        expected_hash: Optional[str] = None,
+        base_values: Optional[Dict[str, Any]] = None,
     ) -> WorkItem:
         """Update a work item in the YAML file.
-        
+
+        The read-modify-write cycle runs under an exclusive file lock. When
+        ``expected_hash`` is given and the file has changed since, the update
+        is rejected unless ``base_values`` shows that none of the updated
+        fields were changed by someone else (per-field merge).
+
         Args:
             wbs_id: WBS ID of the item to update
             updates: Dictionary of fields to update
             create_backup: Whether to create a backup before writing
-            
+            expected_hash: Content hash of the caller's snapshot, or a prefix of
+                at least MIN_HASH_PREFIX characters
+            base_values: Caller's view of the updated fields, enables merging
+
         Returns:
             Updated WorkItem object
-            
+
         Raises:
             ValueError: If WBS ID not found or invalid field values
+            WriteConflictError: If the file changed and the update can't be merged
             FileNotFoundError: If YAML file doesn't exist
+            TimeoutError: If the write lock could not be acquired
         """
-        # Create backup
-        backup_path = self.yaml_path.with_suffix('.yaml.bak')
-        if create_backup:
-            shutil.copy2(self.yaml_path, backup_path)
-            logger.info(f"Created backup: {backup_path}")
-        
-        # Load current YAML
-        with open(self.yaml_path, 'r') as f:
-            data = self.yaml.load(f)
-        
-        if not data or 'work_items' not in data:
-            raise ValueError("Invalid YAML structure: missing 'work_items' key")
-        
-        # Find the work item
-        item_dict = None
-        item_index = None
-        for idx, item in enumerate(data['work_items']):
-            if item.get('wbs_id') == wbs_id:
-                item_dict = item
-                item_index = idx
-                break
-        
-        if item_dict is None:
-            raise ValueError(f"Work item not found: {wbs_id}")
-        
+        if expected_hash is not None and len(expected_hash) < MIN_HASH_PREFIX:
+            raise ValueError(f"expected_hash must be at least {MIN_HASH_PREFIX} characters")
+
         # Validate updates
-        valid_fields = {
-            'status', 'priority', 'milestone', 'assignees', 
-            'start_date', 'end_date', 'effort_days', 'description',
-            'title', 'responsible_architect', 'allow_yaml_override'
-        }
-        
-        invalid_fields = set(updates.keys()) - valid_fields
+        invalid_fields = set(updates.keys()) - UPDATABLE_FIELDS
         if invalid_fields:
             raise ValueError(f"Invalid fields for update: {invalid_fields}")
-        
-        # Apply updates
-        original_values = {}
+
+        with file_lock(self.lock_path, self.lock_timeout):
+            data, current_hash = self._load()
+
+            # Find the work item
+            item_dict = self._index_items(data).get(wbs_id)
+            if item_dict is None:
+                raise ValueError(f"Work item not found: {wbs_id}")
+
+            if expected_hash and not current_hash.startswith(expected_hash.lower()):
+                self._check_mergeable(wbs_id, item_dict, updates, base_values, current_hash)
+
+            if create_backup:
+                self._backup()
+
+            self._apply(wbs_id, item_dict, updates)
+
+            # Write back to file
+            self._write(data)
+            self.base_hash = current_hash
+            logger.info(f"Successfully wrote updates to {self.yaml_path}")
+
+        # Return updated WorkItem
+        return WorkItem(**item_dict)
+
+    def update_work_items(
+        self,
+        batch: Dict[str, Dict[str, Any]],
+        create_backup: bool = True,
+        allowed_fields: frozenset[str] = UPDATABLE_FIELDS,
+    ) -> Dict[str, WorkItem]:
+        """Update several work items with a single read-modify-write.
+
+        Args:
+            batch: Mapping of WBS ID to the fields to update on that item
+            create_backup: Whether to create a backup before writing
+            allowed_fields: Fields that may be written (sync adds SYNC_FIELDS)
+
+        Returns:
+            Mapping of WBS ID to the updated WorkItem
+
+        Raises:
+            ValueError: If any WBS ID is not found or fields are invalid
+            FileNotFoundError: If YAML file doesn't exist
+            TimeoutError: If the write lock could not be acquired
+        """
+        invalid_fields = {key for updates in batch.values() for key in updates} - allowed_fields
+        if invalid_fields:
+            raise ValueError(f"Invalid fields for update: {invalid_fields}")
+
+        with file_lock(self.lock_path, self.lock_timeout):
+            data, current_hash = self._load()
+            index = self._index_items(data)
+
+            missing = [wbs_id for wbs_id in batch if wbs_id not in index]
+            if missing:
+                raise ValueError(f"Work items not found: {', '.join(missing)}")
+
+            if create_backup:
+                self._backup()
+
+            for wbs_id, updates in batch.items():
+                self._apply(wbs_id, index[wbs_id], updates)
+
+            self._write(data)
+            self.base_hash = current_hash
+            logger.info(f"Successfully wrote updates for {len(batch)} items to {self.yaml_path}")
+
+        return {wbs_id: WorkItem(**index[wbs_id]) for wbs_id in batch}
+
+    def append_work_items(
+        self,
+        items: List[WorkItem],
+        create_backup: bool = True,
+    ) -> List[str]:
+        """Append new work items to the YAML file in a single write.
+
+        Items whose WBS ID or issue number already exist in the file are
+        skipped; this re-check happens under the write lock so concurrent
+        imports can't create duplicates.
+
+        Args:
+            items: Validated work items to append
+            create_backup: Whether to create a backup before writing
+
+        Returns:
+            WBS IDs of the items that were skipped as duplicates
+
+        Raises:
+            ValueError: If the YAML structure is invalid
+            TimeoutError: If the write lock could not be acquired
+        """
+        with file_lock(self.lock_path, self.lock_timeout):
+            data, current_hash = self._load()
+            wbs_ids = {entry.get('wbs_id') for entry in data['work_items']}
+            issue_numbers = {entry.get('issue_number') for entry in data['work_items']}
+
+            skipped = []
+            for item in items:
+                if item.wbs_id in wbs_ids or item.issue_number in issue_numbers:
+                    skipped.append(item.wbs_id)
+                    continue
+                data['work_items'].append(self._to_yaml(item))
+                wbs_ids.add(item.wbs_id)
+                issue_numbers.add(item.issue_number)
+
+            if len(skipped) == len(items):
+                return skipped
+
+            if create_backup:
+                self._backup()
+
+            self._write(data)
+            self.base_hash = current_hash
+            logger.info(
+                f"Appended {len(items) - len(skipped)} work items to {self.yaml_path}"
+            )
+
+        return skipped
+
+    @staticmethod
+    def _to_yaml(item: WorkItem) -> Dict[str, Any]:
+        """Convert a work item to a YAML mapping in the file's style."""
+        entry = item.model_dump(exclude_defaults=True)
+        for key, value in entry.items():
+            # Multi-line text reads best as a literal block, like hand-written entries
+            if isinstance(value, str) and '\n' in value:
+                entry[key] = LiteralScalarString(value)
+        return entry
+
+    def _load(self) -> tuple[Any, str]:
+        """Read and parse the YAML file, returning the data and its content hash."""
+        with open(self.yaml_path, 'rb') as f:
+            raw = f.read()
+        data = self.yaml.load(raw.decode('utf-8'))
+
+        if not data or 'work_items' not in data:
+            raise ValueError("Invalid YAML structure: missing 'work_items' key")
+
+        return data, hashlib.sha256(raw).hexdigest()
+
+    @staticmethod
+    def _index_items(data: Any) -> Dict[str, Any]:
+        """Map WBS IDs to their YAML mappings (first occurrence wins)."""
+        index: Dict[str, Any] = {}
+        for item in data['work_items']:
+            index.setdefault(item.get('wbs_id'), item)
+        return index
+
+    def _backup(self) -> None:
+        """Copy the current file to work-items.yaml.bak."""
+        backup_path = self.yaml_path.with_suffix('.yaml.bak')
+        shutil.copy2(self.yaml_path, backup_path)
+        logger.info(f"Created backup: {backup_path}")
+
+    @staticmethod
+    def _apply(wbs_id: str, item_dict: Any, updates: Dict[str, Any]) -> None:
+        """Apply field updates to a YAML mapping in place."""
         for key, value in updates.items():
-            original_values[key] = item_dict.get(key)
+            original = item_dict.get(key)
             item_dict[key] = value
-            logger.info(f"Updated {wbs_id}.{key}: {original_values[key]} → {value}")
-        
-        # Write back to file
+            logger.info(f"Updated {wbs_id}.{key}: {original} → {value}")
+
+    def _check_mergeable(
+        self,
+        wbs_id: str,
+        item_dict: Any,
+        updates: Dict[str, Any],
+        base_values: Optional[Dict[str, Any]],
+        current_hash: str,
+    ) -> None:
+        """Reject a stale update unless its fields can be merged.
+
+        A field conflicts when its current value differs both from the
+        caller's base value and from the value being written.
+        """
+        if base_values is None:
+            raise WriteConflictError(
+                f"Work items file changed since snapshot (current: {current_hash[:16]})",
+                current_hash,
+            )
+
+        current = WorkItem(**item_dict)
+        conflicts = [
+            key for key, value in updates.items()
+            if key not in base_values
+            or getattr(current, key) not in (base_values[key], value)
+        ]
+        if conflicts:
+            raise WriteConflictError(
+                f"Concurrent change to {wbs_id} fields: {', '.join(sorted(conflicts))} "
+                f"(current: {current_hash[:16]})",
+                current_hash,
+            )
+        logger.info(f"Merged update to {wbs_id} onto newer snapshot {current_hash[:16]}")
+
+    def _write(self, data: Any) -> None:
+        """Atomically replace the file and record its new identity and hash.
+
+        Writing to a temporary file and renaming it means concurrent readers
+        never observe a partially written file.
+        """
+        buffer = io.StringIO()
+        self.yaml.dump(data, buffer)
+        content = buffer.getvalue().encode('utf-8')
+
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.yaml_path.parent, prefix=f".{self.yaml_path.name}.", suffix=".tmp"
+        )
         try:
-            with open(self.yaml_path, 'w') as f:
-                self.yaml.dump(data, f)
-            logger.info(f"Successfully wrote updates to {self.yaml_path}")
-        except Exception as e:
-            # Restore backup on write failure
-            if create_backup and backup_path.exists():
-                shutil.copy2(backup_path, self.yaml_path)
-                logger.error(f"Write failed, restored backup: {e}")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+                f.flush()
+                identity = stat_identity(os.fstat(f.fileno()))
+            shutil.copymode(self.yaml_path, tmp_name)
+            os.replace(tmp_name, self.yaml_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
             raise
-        
-        # Return updated WorkItem
-        return WorkItem(**item_dict)
\ No newline at end of file
+
+        self.file_identity = identity
+        self.content_hash = hashlib.sha256(content).hexdigest()